@@ -0,0 +1,221 @@
+import zlib
+from collections.abc import Callable
+
+import zstandard
+from fastapi import HTTPException
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.config import settings
+
+# In order of preference when the client accepts both with the same weight.
+ENCODINGS = ("zstd", "gzip")
+# Compressing bigger chunks than this inline would stall the event loop.
+THREADPOOL_MIN_BYTES = 256 * 1024
+DECOMPRESS_CHUNK_BYTES = 64 * 1024
+
+
+def negotiate(accept_encoding: str) -> str | None:
+    weights: dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        name, *params = (part.strip() for part in item.split(";"))
+        weight = 1.0
+        for param in params:
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    weight = float(value)
+                except ValueError:
+                    weight = 0.0
+        weights[name.lower()] = weight
+
+    best, best_weight = None, 0.0
+    for encoding in ENCODINGS:
+        weight = weights.get(encoding, weights.get("*", 0.0))
+        if weight > best_weight:
+            best, best_weight = encoding, weight
+    return best
+
+
+def gzip_compressor() -> Callable[[bytes, bool], bytes]:
+    compressobj = zlib.compressobj(settings.gzip_level, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+
+    def compress(data: bytes, final: bool) -> bytes:
+        return compressobj.compress(data) + compressobj.flush(zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH)
+
+    return compress
+
+
+def zstd_compressor() -> Callable[[bytes, bool], bytes]:
+    compressobj = zstandard.ZstdCompressor(level=settings.zstd_level).compressobj()
+
+    def compress(data: bytes, final: bool) -> bytes:
+        mode = zstandard.COMPRESSOBJ_FLUSH_FINISH if final else zstandard.COMPRESSOBJ_FLUSH_BLOCK
+        return compressobj.compress(data) + compressobj.flush(mode)
+
+    return compress
+
+
+COMPRESSORS = {"gzip": gzip_compressor, "zstd": zstd_compressor}
+
+
+class CompressionMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        await self.app(scope, receive, CompressingSend(send, encoding))
+
+
+class CompressingSend:
+    def __init__(self, send: Send, encoding: str) -> None:
+        self.send = send
+        self.encoding = encoding
+        self.start: Message | None = None
+        self.compress: Callable[[bytes, bool], bytes] | None = None
+
+    async def __call__(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self.start = message
+            return
+
+        if self.start is not None:
+            start, self.start = self.start, None
+            await self._begin(start, message)
+            return
+
+        if self.compress is None or message["type"] != "http.response.body":
+            await self.send(message)
+            return
+
+        more_body = message.get("more_body", False)
+        body = await self._compress(message.get("body", b""), not more_body)
+        await self.send({"type": "http.response.body", "body": body, "more_body": more_body})
+
+    async def _begin(self, start: Message, message: Message) -> None:
+        headers = MutableHeaders(raw=list(start["headers"]))
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        skip = (
+            message["type"] != "http.response.body"
+            or start["status"] in (204, 206, 304)
+            or "content-encoding" in headers
+            or headers.get("content-type", "").startswith("text/event-stream")
+            or (not more_body and len(body) < settings.compression_minimum_size)
+        )
+        if skip:
+            await self.send(start)
+            await self.send(message)
+            return
+
+        self.compress = COMPRESSORS[self.encoding]()
+        body = await self._compress(body, not more_body)
+        headers["Content-Encoding"] = self.encoding
+        headers.add_vary_header("Accept-Encoding")
+        if more_body:
+            del headers["Content-Length"]
+        else:
+            headers["Content-Length"] = str(len(body))
+        await self.send({**start, "headers": headers.raw})
+        await self.send({"type": "http.response.body", "body": body, "more_body": more_body})
+
+    async def _compress(self, data: bytes, final: bool) -> bytes:
+        if len(data) >= THREADPOOL_MIN_BYTES:
+            return await run_in_threadpool(self.compress, data, final)
+        return self.compress(data, final)
+
+
+class BodyLimit:
+    def __init__(self, limit: int) -> None:
+        self.limit = limit
+        self.size = 0
+        self.chunks: list[bytes] = []
+
+    def write(self, data: bytes) -> int:
+        self.size += len(data)
+        if self.size > self.limit:
+            raise HTTPException(status_code=413, detail=f"Decompressed request body exceeds {self.limit} bytes")
+        self.chunks.append(data)
+        return len(data)
+
+    def take(self) -> bytes:
+        data = b"".join(self.chunks)
+        self.chunks = []
+        return data
+
+
+def gzip_decompressor(sink: BodyLimit) -> Callable[[bytes], None]:
+    decompressobj = zlib.decompressobj(zlib.MAX_WBITS | 16)
+
+    def decompress(data: bytes) -> None:
+        # Bounded output per call, so a small gzip bomb cannot inflate past the limit in one go.
+        while not decompressobj.eof:
+            chunk = decompressobj.decompress(data, DECOMPRESS_CHUNK_BYTES)
+            sink.write(chunk)
+            data = decompressobj.unconsumed_tail
+            if not data and len(chunk) < DECOMPRESS_CHUNK_BYTES:
+                break
+
+    return decompress
+
+
+def zstd_decompressor(sink: BodyLimit) -> Callable[[bytes], None]:
+    writer = zstandard.ZstdDecompressor().stream_writer(sink, write_size=DECOMPRESS_CHUNK_BYTES, closefd=False)
+    return writer.write
+
+
+DECOMPRESSORS = {"gzip": gzip_decompressor, "zstd": zstd_decompressor}
+
+
+class DecompressionMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = Headers(scope=scope).get("content-encoding", "identity").strip().lower()
+        if encoding == "identity":
+            await self.app(scope, receive, send)
+            return
+        if encoding not in DECOMPRESSORS:
+            response = JSONResponse(
+                {"detail": f"Unsupported Content-Encoding: {encoding}"},
+                status_code=415,
+                headers={"Accept-Encoding": ", ".join(ENCODINGS)},
+            )
+            await response(scope, receive, send)
+            return
+
+        sink = BodyLimit(settings.max_request_body_bytes)
+        decompress = DECOMPRESSORS[encoding](sink)
+
+        async def receive_decompressed() -> Message:
+            message = await receive()
+            if message["type"] != "http.request":
+                return message
+            # Inflate each chunk as it arrives rather than buffering the compressed body first.
+            try:
+                decompress(message.get("body", b""))
+            except (zlib.error, zstandard.ZstdError) as exc:
+                raise HTTPException(status_code=400, detail=f"Invalid {encoding} request body") from exc
+            return {**message, "body": sink.take()}
+
+        # Downstream sees a plain body, so the compressed length no longer applies. The scope is
+        # updated in place so what the router writes into it (the route) stays visible to outer middleware.
+        stripped = (b"content-encoding", b"content-length")
+        scope["headers"] = [(key, value) for key, value in scope["headers"] if key not in stripped]
+        await self.app(scope, receive_decompressed, send)
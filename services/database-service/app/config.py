@@ -12,6 +12,20 @@ class Settings(BaseSettings):
     db_name: str = Field(default="")
     db_host: str = Field(default="localhost")
     db_port: int = Field(default=3306)
+    db_async: bool = Field(default=False)
+    default_page_size: int = Field(default=100, ge=1)
+    max_page_size: int = Field(default=1000, ge=1)
+    max_batch_ids: int = Field(default=1000, ge=1)
+    batch_lookup_chunk_size: int = Field(default=500, ge=1)
+    export_batch_size: int = Field(default=1000, ge=1)
+    upsert_batch_size: int = Field(default=1000, ge=1)
+    # Keep each INSERT well below MySQL's max_allowed_packet (4 MiB on older servers).
+    upsert_max_batch_bytes: int = Field(default=2 * 1024 * 1024, ge=1024)
+    compression_minimum_size: int = Field(default=1024, ge=0)
+    gzip_level: int = Field(default=6, ge=1, le=9)
+    zstd_level: int = Field(default=3, ge=1, le=22)
+    # Applies after decompression, so a small compressed body cannot inflate without bound.
+    max_request_body_bytes: int = Field(default=256 * 1024 * 1024, ge=1024)
 
     model_config = {
         "env_file": ENV_FILE if ENV_FILE.exists() else None,
@@ -22,5 +36,9 @@ class Settings(BaseSettings):
     def database_url(self) -> str:
         return f"mysql+pymysql://{self.db_user}:{self.db_password}@{self.db_host}:{self.db_port}/{self.db_name}"
 
+    @property
+    def async_database_url(self) -> str:
+        return f"mysql+aiomysql://{self.db_user}:{self.db_password}@{self.db_host}:{self.db_port}/{self.db_name}"
+
 
 settings = Settings()
@@ -1,41 +1,91 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import Response, StreamingResponse
 from sqlalchemy.orm import Session
 
-from app.database import get_db
+from app.config import settings
+from app.database import SessionRunner, get_bulk_session_runner, get_db, get_session_runner
 from app.repositories.fixture_repository import FixtureRepository
-from app.schemas.fixture import BulkCreateResponse, FixtureCreate, FixtureResponse
+from app.responses import json_response
+from app.schemas.batch import BatchLookupRequest
+from app.schemas.fixture import (
+    BulkCreateResponse,
+    ExportFormat,
+    FixtureBatch,
+    FixtureCreate,
+    FixtureFilters,
+    FixturePage,
+    FixtureResponse,
+    FixtureResponseList,
+)
 from app.services.fixture_service import FixtureService
 
 router = APIRouter(prefix="/fixtures", tags=["fixtures"])
 
+EXPORT_MEDIA_TYPES = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv",
+}
+
 
 def get_fixture_service(db: Session = Depends(get_db)) -> FixtureService:
     repository = FixtureRepository(db)
     return FixtureService(repository)
 
 
-@router.get("", response_model=list[FixtureResponse])
-def get_fixtures(service: FixtureService = Depends(get_fixture_service)) -> list[FixtureResponse]:
-    return service.get_all_fixtures()
+@router.get("", response_model=FixturePage | list[FixtureResponse])
+async def get_fixtures(
+    limit: int = Query(default=settings.default_page_size, ge=1, le=settings.max_page_size),
+    after_id: int | None = Query(default=None),
+    unpaginated: bool = Query(default=False, alias="all"),
+    filters: FixtureFilters = Depends(),
+    runner: SessionRunner = Depends(get_session_runner),
+) -> Response:
+    if unpaginated:
+        fixtures = await runner.run(lambda db: get_fixture_service(db).get_all_fixtures(filters))
+        return json_response(FixtureResponseList.dump_json(fixtures))
+    page = await runner.run(lambda db: get_fixture_service(db).get_fixtures_page(limit, after_id, filters))
+    return json_response(page.model_dump_json())
+
+
+@router.get("/export")
+def export_fixtures(
+    export_format: ExportFormat = Query(default=ExportFormat.NDJSON, alias="format"),
+    filters: FixtureFilters = Depends(),
+    service: FixtureService = Depends(get_fixture_service),
+) -> StreamingResponse:
+    return StreamingResponse(
+        service.export_fixtures(export_format, filters),
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f"attachment; filename=fixtures.{export_format}"},
+    )
+
+
+@router.post("/batch", response_model=FixtureBatch)
+async def get_fixtures_batch(
+    request: BatchLookupRequest, runner: SessionRunner = Depends(get_session_runner)
+) -> FixtureBatch:
+    return await runner.run(lambda db: get_fixture_service(db).get_fixtures_by_ids(request.ids))
 
 
 @router.get("/{fixture_id}", response_model=FixtureResponse)
-def get_fixture(fixture_id: int, service: FixtureService = Depends(get_fixture_service)) -> FixtureResponse:
-    return service.get_fixture_by_id(fixture_id)
+async def get_fixture(fixture_id: int, runner: SessionRunner = Depends(get_session_runner)) -> FixtureResponse:
+    return await runner.run(lambda db: get_fixture_service(db).get_fixture_by_id(fixture_id))
 
 
 @router.post("", response_model=FixtureResponse, status_code=201)
-def create_fixture(fixture: FixtureCreate, service: FixtureService = Depends(get_fixture_service)) -> FixtureResponse:
-    return service.create_fixture(fixture)
+async def create_fixture(
+    fixture: FixtureCreate, runner: SessionRunner = Depends(get_session_runner)
+) -> FixtureResponse:
+    return await runner.run(lambda db: get_fixture_service(db).create_fixture(fixture))
 
 
 @router.post("/bulk", response_model=BulkCreateResponse)
-def bulk_upsert_fixtures(
-    fixtures: list[FixtureCreate], service: FixtureService = Depends(get_fixture_service)
+async def bulk_upsert_fixtures(
+    fixtures: list[FixtureCreate], runner: SessionRunner = Depends(get_bulk_session_runner)
 ) -> BulkCreateResponse:
-    return service.bulk_upsert_fixtures(fixtures)
+    return await runner.run(lambda db: get_fixture_service(db).bulk_upsert_fixtures(fixtures))
 
 
 @router.delete("/{fixture_id}", status_code=204)
-def delete_fixture(fixture_id: int, service: FixtureService = Depends(get_fixture_service)) -> None:
-    service.delete_fixture(fixture_id)
+async def delete_fixture(fixture_id: int, runner: SessionRunner = Depends(get_session_runner)) -> None:
+    await runner.run(lambda db: get_fixture_service(db).delete_fixture(fixture_id))
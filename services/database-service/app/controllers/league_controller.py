@@ -1,9 +1,17 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
 
-from app.database import get_db
+from app.config import settings
+from app.database import SessionRunner, get_bulk_session_runner, get_db, get_session_runner
 from app.repositories.league_repository import LeagueRepository
-from app.schemas.league import BulkCreateResponse, LeagueCreate, LeagueResponse
+from app.schemas.batch import BatchLookupRequest
+from app.schemas.league import (
+    BulkCreateResponse,
+    LeagueBatch,
+    LeagueCreate,
+    LeaguePage,
+    LeagueResponse,
+)
 from app.services.league_service import LeagueService
 
 router = APIRouter(prefix="/leagues", tags=["leagues"])
@@ -14,28 +22,44 @@ def get_league_service(db: Session = Depends(get_db)) -> LeagueService:
     return LeagueService(repository)
 
 
-@router.get("", response_model=list[LeagueResponse])
-def get_leagues(service: LeagueService = Depends(get_league_service)) -> list[LeagueResponse]:
-    return service.get_all_leagues()
+@router.get("", response_model=LeaguePage | list[LeagueResponse])
+async def get_leagues(
+    limit: int = Query(default=settings.default_page_size, ge=1, le=settings.max_page_size),
+    after_id: int | None = Query(default=None),
+    unpaginated: bool = Query(default=False, alias="all"),
+    runner: SessionRunner = Depends(get_session_runner),
+) -> LeaguePage | list[LeagueResponse]:
+    if unpaginated:
+        return await runner.run(lambda db: get_league_service(db).get_all_leagues())
+    return await runner.run(lambda db: get_league_service(db).get_leagues_page(limit, after_id))
+
+
+@router.post("/batch", response_model=LeagueBatch)
+async def get_leagues_batch(
+    request: BatchLookupRequest, runner: SessionRunner = Depends(get_session_runner)
+) -> LeagueBatch:
+    return await runner.run(lambda db: get_league_service(db).get_leagues_by_ids(request.ids))
 
 
 @router.get("/{league_id}", response_model=LeagueResponse)
-def get_league(league_id: int, service: LeagueService = Depends(get_league_service)) -> LeagueResponse:
-    return service.get_league_by_id(league_id)
+async def get_league(league_id: int, runner: SessionRunner = Depends(get_session_runner)) -> LeagueResponse:
+    return await runner.run(lambda db: get_league_service(db).get_league_by_id(league_id))
 
 
 @router.post("", response_model=LeagueResponse, status_code=201)
-def create_league(league: LeagueCreate, service: LeagueService = Depends(get_league_service)) -> LeagueResponse:
-    return service.create_league(league)
+async def create_league(
+    league: LeagueCreate, runner: SessionRunner = Depends(get_session_runner)
+) -> LeagueResponse:
+    return await runner.run(lambda db: get_league_service(db).create_league(league))
 
 
 @router.post("/bulk", response_model=BulkCreateResponse)
-def bulk_upsert_leagues(
-    leagues: list[LeagueCreate], service: LeagueService = Depends(get_league_service)
+async def bulk_upsert_leagues(
+    leagues: list[LeagueCreate], runner: SessionRunner = Depends(get_bulk_session_runner)
 ) -> BulkCreateResponse:
-    return service.bulk_upsert_leagues(leagues)
+    return await runner.run(lambda db: get_league_service(db).bulk_upsert_leagues(leagues))
 
 
 @router.delete("/{league_id}", status_code=204)
-def delete_league(league_id: int, service: LeagueService = Depends(get_league_service)) -> None:
-    service.delete_league(league_id)
+async def delete_league(league_id: int, runner: SessionRunner = Depends(get_session_runner)) -> None:
+    await runner.run(lambda db: get_league_service(db).delete_league(league_id))
@@ -1,9 +1,11 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
 
-from app.database import get_db
+from app.config import settings
+from app.database import SessionRunner, get_bulk_session_runner, get_db, get_session_runner
 from app.repositories.team_repository import TeamRepository
-from app.schemas.team import BulkCreateResponse, TeamCreate, TeamResponse
+from app.schemas.batch import BatchLookupRequest
+from app.schemas.team import BulkCreateResponse, TeamBatch, TeamCreate, TeamPage, TeamResponse
 from app.services.team_service import TeamService
 
 router = APIRouter(prefix="/teams", tags=["teams"])
@@ -14,28 +16,44 @@ def get_team_service(db: Session = Depends(get_db)) -> TeamService:
     return TeamService(repository)
 
 
-@router.get("", response_model=list[TeamResponse])
-def get_teams(service: TeamService = Depends(get_team_service)) -> list[TeamResponse]:
-    return service.get_all_teams()
+@router.get("", response_model=TeamPage | list[TeamResponse])
+async def get_teams(
+    limit: int = Query(default=settings.default_page_size, ge=1, le=settings.max_page_size),
+    after_id: int | None = Query(default=None),
+    unpaginated: bool = Query(default=False, alias="all"),
+    runner: SessionRunner = Depends(get_session_runner),
+) -> TeamPage | list[TeamResponse]:
+    if unpaginated:
+        return await runner.run(lambda db: get_team_service(db).get_all_teams())
+    return await runner.run(lambda db: get_team_service(db).get_teams_page(limit, after_id))
+
+
+@router.post("/batch", response_model=TeamBatch)
+async def get_teams_batch(
+    request: BatchLookupRequest, runner: SessionRunner = Depends(get_session_runner)
+) -> TeamBatch:
+    return await runner.run(lambda db: get_team_service(db).get_teams_by_ids(request.ids))
 
 
 @router.get("/{team_id}", response_model=TeamResponse)
-def get_team(team_id: int, service: TeamService = Depends(get_team_service)) -> TeamResponse:
-    return service.get_team_by_id(team_id)
+async def get_team(team_id: int, runner: SessionRunner = Depends(get_session_runner)) -> TeamResponse:
+    return await runner.run(lambda db: get_team_service(db).get_team_by_id(team_id))
 
 
 @router.post("", response_model=TeamResponse, status_code=201)
-def create_team(team: TeamCreate, service: TeamService = Depends(get_team_service)) -> TeamResponse:
-    return service.create_team(team)
+async def create_team(
+    team: TeamCreate, runner: SessionRunner = Depends(get_session_runner)
+) -> TeamResponse:
+    return await runner.run(lambda db: get_team_service(db).create_team(team))
 
 
 @router.post("/bulk", response_model=BulkCreateResponse)
-def bulk_upsert_teams(
-    teams: list[TeamCreate], service: TeamService = Depends(get_team_service)
+async def bulk_upsert_teams(
+    teams: list[TeamCreate], runner: SessionRunner = Depends(get_bulk_session_runner)
 ) -> BulkCreateResponse:
-    return service.bulk_upsert_teams(teams)
+    return await runner.run(lambda db: get_team_service(db).bulk_upsert_teams(teams))
 
 
 @router.delete("/{team_id}", status_code=204)
-def delete_team(team_id: int, service: TeamService = Depends(get_team_service)) -> None:
-    service.delete_team(team_id)
+async def delete_team(team_id: int, runner: SessionRunner = Depends(get_session_runner)) -> None:
+    await runner.run(lambda db: get_team_service(db).delete_team(team_id))
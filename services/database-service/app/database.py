@@ -1,16 +1,98 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import declarative_base, sessionmaker
+from collections.abc import AsyncIterator, Callable
+from functools import cache
+from typing import TypeVar
+
+import structlog
+from fastapi import Depends
+from sqlalchemy import Engine, create_engine, inspect, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, declarative_base, sessionmaker
+from starlette.concurrency import run_in_threadpool
 
 from app.config import settings
 
+logger = structlog.get_logger()
+
+T = TypeVar("T")
+
 engine = create_engine(settings.database_url)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
 
+@cache
+def get_async_engine() -> AsyncEngine:
+    return create_async_engine(settings.async_database_url)
+
+
+@cache
+def get_async_sessionmaker() -> async_sessionmaker[AsyncSession]:
+    return async_sessionmaker(get_async_engine(), autoflush=False)
+
+
 def get_db():
     db = SessionLocal()
     try:
         yield db
     finally:
         db.close()
+
+
+async def get_async_db() -> AsyncIterator[AsyncSession]:
+    async with get_async_sessionmaker()() as db:
+        yield db
+
+
+class SessionRunner:
+    # Runs sync repository code either on Starlette's thread pool over a blocking
+    # Session, or on the event loop through AsyncSession.run_sync.
+    def __init__(self, db: Session | None = None, async_db: AsyncSession | None = None):
+        self.db = db
+        self.async_db = async_db
+
+    async def run(self, fn: Callable[[Session], T]) -> T:
+        if self.async_db is not None:
+            return await self.async_db.run_sync(fn)
+        return await run_in_threadpool(fn, self.db)
+
+
+def get_sync_session_runner(db: Session = Depends(get_db)) -> SessionRunner:
+    return SessionRunner(db=db)
+
+
+async def get_async_session_runner(db: AsyncSession = Depends(get_async_db)) -> SessionRunner:
+    return SessionRunner(async_db=db)
+
+
+get_session_runner = get_async_session_runner if settings.db_async else get_sync_session_runner
+# Bulk upserts spend most of their time on CPU (hashing, batching, compiling statements). Under
+# run_sync that would all happen on the event loop, so they stay on the thread pool in both modes.
+get_bulk_session_runner = get_sync_session_runner
+
+
+async def dispose_async_engine() -> None:
+    if get_async_engine.cache_info().currsize:
+        await get_async_engine().dispose()
+
+
+def sync_schema(bind: Engine) -> None:
+    # create_all only creates missing tables, so add nullable columns and indexes
+    # introduced since a table was first created. Runs from app.migrate, not at startup.
+    Base.metadata.create_all(bind=bind)
+
+    inspector = inspect(bind)
+    with bind.begin() as connection:
+        for table in Base.metadata.sorted_tables:
+            existing = {column["name"] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing or not column.nullable:
+                    continue
+                column_type = column.type.compile(dialect=bind.dialect)
+                connection.execute(text(f"ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}"))
+                logger.info("schema_column_added", table=table.name, column=column.name)
+
+            existing_indexes = {index["name"] for index in inspector.get_indexes(table.name)}
+            for index in table.indexes:
+                if index.name not in existing_indexes:
+                    index.create(connection)
+                    logger.info("schema_index_added", table=table.name, index=index.name)
@@ -2,19 +2,23 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 
+from app.compression import CompressionMiddleware, DecompressionMiddleware
 from app.controllers import fixture_controller, league_controller, team_controller
 from app.logging import configure_logging
+from app.metrics import MetricsMiddleware, metrics_response
 
 configure_logging()
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    from app.database import Base, engine
+    from app.database import Base, dispose_async_engine, engine
     from app.models import fixture, league, team  # noqa: F401 - Import models to register with Base
 
+    # Only creates missing tables. Column and index changes to existing tables run in `make migrate`.
     Base.metadata.create_all(bind=engine)
     yield
+    await dispose_async_engine()
 
 
 app = FastAPI(
@@ -23,6 +27,9 @@ app = FastAPI(
     version="0.1.0",
     lifespan=lifespan,
 )
+app.add_middleware(DecompressionMiddleware)
+app.add_middleware(CompressionMiddleware)
+app.add_middleware(MetricsMiddleware)
 
 app.include_router(fixture_controller.router)
 app.include_router(league_controller.router)
@@ -32,3 +39,8 @@ app.include_router(team_controller.router)
 @app.get("/health")
 def health_check():
     return {"status": "healthy"}
+
+
+@app.get("/metrics", include_in_schema=False)
+def metrics():
+    return metrics_response()
@@ -0,0 +1,83 @@
+import time
+
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, Counter, Gauge, Histogram, generate_latest
+from prometheus_client.core import GaugeMetricFamily
+from prometheus_client.registry import Collector
+from sqlalchemy.pool import QueuePool
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.database import engine, get_async_engine
+
+REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds", "Time spent handling HTTP requests.", ["method", "route", "status"]
+)
+REQUESTS_IN_FLIGHT = Gauge("http_requests_in_flight", "HTTP requests currently being handled.", ["method"])
+UPSERT_DURATION = Histogram("db_bulk_upsert_duration_seconds", "Time spent on bulk upserts.", ["entity"])
+UPSERTED_ROWS = Counter("db_upserted_rows_total", "Rows passed through bulk upserts.", ["entity", "outcome"])
+
+
+class MetricsMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        in_flight = REQUESTS_IN_FLIGHT.labels(method)
+        in_flight.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            in_flight.dec()
+            # Label by route template rather than raw path to keep cardinality bounded.
+            route = getattr(scope.get("route"), "path", "unmatched")
+            REQUEST_DURATION.labels(method, route, str(status_code)).observe(time.perf_counter() - start)
+
+
+def observe_upsert(entity: str, created: int, updated: int, unchanged: int, seconds: float) -> None:
+    UPSERT_DURATION.labels(entity).observe(seconds)
+    UPSERTED_ROWS.labels(entity, "created").inc(created)
+    UPSERTED_ROWS.labels(entity, "updated").inc(updated)
+    UPSERTED_ROWS.labels(entity, "unchanged").inc(unchanged)
+
+
+class PoolCollector(Collector):
+    def collect(self):
+        pools = {"sync": engine.pool}
+        if get_async_engine.cache_info().currsize:
+            pools["async"] = get_async_engine().pool
+
+        connections = GaugeMetricFamily(
+            "db_pool_connections", "Connections held by the SQLAlchemy pool.", labels=["engine", "state"]
+        )
+        size = GaugeMetricFamily("db_pool_size", "Configured SQLAlchemy pool size.", labels=["engine"])
+        for name, pool in pools.items():
+            # SQLite test engines use pools without checkout accounting.
+            if not isinstance(pool, QueuePool):
+                continue
+            connections.add_metric([name, "checked_out"], pool.checkedout())
+            connections.add_metric([name, "checked_in"], pool.checkedin())
+            connections.add_metric([name, "overflow"], max(pool.overflow(), 0))
+            size.add_metric([name], pool.size())
+        yield connections
+        yield size
+
+
+REGISTRY.register(PoolCollector())
+
+
+def metrics_response() -> Response:
+    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
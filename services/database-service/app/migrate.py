@@ -0,0 +1,24 @@
+import time
+
+import structlog
+
+from app.database import engine, sync_schema
+from app.logging import configure_logging
+from app.models import fixture, league, team  # noqa: F401 - Import models to register with Base
+
+logger = structlog.get_logger()
+
+
+def main() -> None:
+    configure_logging()
+    logger.info("migration_started")
+    start = time.perf_counter()
+
+    sync_schema(engine)
+
+    duration_ms = int((time.perf_counter() - start) * 1000)
+    logger.info("migration_completed", duration_ms=duration_ms)
+
+
+if __name__ == "__main__":
+    main()
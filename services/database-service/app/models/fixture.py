@@ -1,4 +1,4 @@
-from sqlalchemy import Boolean, Integer, String
+from sqlalchemy import Boolean, Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database import Base
@@ -6,6 +6,13 @@ from app.database import Base
 
 class FixtureDB(Base):
     __tablename__ = "fixtures"
+    __table_args__ = (
+        Index("ix_fixtures_league_id_starting_at_timestamp", "league_id", "starting_at_timestamp"),
+        Index("ix_fixtures_season_id_state_id", "season_id", "state_id"),
+        Index("ix_fixtures_state_id_starting_at_timestamp", "state_id", "starting_at_timestamp"),
+        Index("ix_fixtures_venue_id_starting_at_timestamp", "venue_id", "starting_at_timestamp"),
+        Index("ix_fixtures_starting_at_timestamp", "starting_at_timestamp"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     sport_id: Mapped[int] = mapped_column(Integer, nullable=False)
@@ -26,3 +33,4 @@ class FixtureDB(Base):
     placeholder: Mapped[bool] = mapped_column(Boolean, nullable=False)
     has_odds: Mapped[bool] = mapped_column(Boolean, nullable=False)
     starting_at_timestamp: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    content_hash: Mapped[str | None] = mapped_column(String(32), nullable=True)
@@ -19,3 +19,4 @@ class LeagueDB(Base):
     last_played_at: Mapped[str | None] = mapped_column(String(50), nullable=True)
     category: Mapped[int | None] = mapped_column(Integer, nullable=True)
     has_jerseys: Mapped[bool | None] = mapped_column(Boolean, nullable=True)
+    content_hash: Mapped[str | None] = mapped_column(String(32), nullable=True)
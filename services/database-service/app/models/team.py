@@ -19,3 +19,4 @@ class TeamDB(Base):
     type: Mapped[str | None] = mapped_column(String(50), nullable=True)
     placeholder: Mapped[bool | None] = mapped_column(Boolean, nullable=True)
     last_played_at: Mapped[str | None] = mapped_column(String(50), nullable=True)
+    content_hash: Mapped[str | None] = mapped_column(String(32), nullable=True)
@@ -1,10 +1,15 @@
 import time
+from collections.abc import Iterator
 
 import structlog
-from sqlalchemy.orm import Session
+from sqlalchemy import RowMapping
+from sqlalchemy.orm import Query, Session
 
+from app.config import settings
+from app.metrics import observe_upsert
 from app.models.fixture import FixtureDB
-from app.schemas.fixture import FixtureCreate
+from app.repositories.upsert import bulk_upsert_rows, compute_content_hash
+from app.schemas.fixture import FixtureCreate, FixtureFilters
 
 logger = structlog.get_logger()
 
@@ -13,43 +18,88 @@ class FixtureRepository:
     def __init__(self, db: Session):
         self.db = db
 
-    def get_all(self) -> list[FixtureDB]:
-        return self.db.query(FixtureDB).all()
+    def get_all(self, filters: FixtureFilters | None = None) -> list[FixtureDB]:
+        return self.filtered_query(filters).all()
+
+    def get_page(
+        self, limit: int, after_id: int | None = None, filters: FixtureFilters | None = None
+    ) -> list[FixtureDB]:
+        query = self.filtered_query(filters)
+        if after_id is not None:
+            query = query.filter(FixtureDB.id > after_id)
+        return query.order_by(FixtureDB.id).limit(limit).all()
+
+    def filtered_query(self, filters: FixtureFilters | None = None) -> Query[FixtureDB]:
+        query = self.db.query(FixtureDB)
+        if filters is None:
+            return query
+        if filters.league_id is not None:
+            query = query.filter(FixtureDB.league_id == filters.league_id)
+        if filters.season_id is not None:
+            query = query.filter(FixtureDB.season_id == filters.season_id)
+        if filters.state_id is not None:
+            query = query.filter(FixtureDB.state_id == filters.state_id)
+        if filters.venue_id is not None:
+            query = query.filter(FixtureDB.venue_id == filters.venue_id)
+        if filters.starting_at_from is not None:
+            query = query.filter(FixtureDB.starting_at_timestamp >= filters.starting_at_from)
+        if filters.starting_at_to is not None:
+            query = query.filter(FixtureDB.starting_at_timestamp < filters.starting_at_to)
+        return query
+
+    def iter_rows(
+        self, columns: list[str], filters: FixtureFilters | None = None, batch_size: int = 1000
+    ) -> Iterator[RowMapping]:
+        # Read through a server-side cursor with plain Core rows: no ORM identity
+        # map, and at most batch_size rows buffered at a time.
+        statement = (
+            self.filtered_query(filters)
+            .with_entities(*(FixtureDB.__table__.c[column] for column in columns))
+            .order_by(FixtureDB.id)
+            .statement
+        )
+        with self.db.get_bind().connect() as connection:
+            result = connection.execution_options(stream_results=True, yield_per=batch_size).execute(statement)
+            yield from result.mappings()
 
     def get_by_id(self, fixture_id: int) -> FixtureDB | None:
         return self.db.query(FixtureDB).filter(FixtureDB.id == fixture_id).first()
 
+    def get_by_ids(self, ids: list[int]) -> list[FixtureDB]:
+        rows = []
+        chunk_size = settings.batch_lookup_chunk_size
+        for start in range(0, len(ids), chunk_size):
+            chunk = ids[start : start + chunk_size]
+            rows.extend(self.db.query(FixtureDB).filter(FixtureDB.id.in_(chunk)).all())
+        return rows
+
     def create(self, fixture: FixtureCreate) -> FixtureDB:
-        db_fixture = FixtureDB(**fixture.model_dump())
+        row = fixture.model_dump()
+        db_fixture = FixtureDB(**row, content_hash=compute_content_hash(row))
         self.db.add(db_fixture)
         self.db.commit()
         self.db.refresh(db_fixture)
         return db_fixture
 
-    def bulk_upsert(self, fixtures: list[FixtureCreate]) -> tuple[int, int]:
+    def bulk_upsert(self, fixtures: list[FixtureCreate]) -> tuple[int, int, int]:
         logger.info("bulk_upsert_started", entity="fixtures", records=len(fixtures))
         start = time.perf_counter()
 
-        created = 0
-        updated = 0
-
-        for fixture in fixtures:
-            existing = self.get_by_id(fixture.id)
-            if existing:
-                for key, value in fixture.model_dump().items():
-                    setattr(existing, key, value)
-                updated += 1
-            else:
-                self.db.add(FixtureDB(**fixture.model_dump()))
-                created += 1
-
-        self.db.commit()
+        rows = [fixture.model_dump() for fixture in fixtures]
+        created, updated, unchanged = bulk_upsert_rows(self.db, FixtureDB, rows)
 
-        duration_ms = int((time.perf_counter() - start) * 1000)
+        elapsed = time.perf_counter() - start
+        observe_upsert("fixtures", created, updated, unchanged, elapsed)
+        duration_ms = int(elapsed * 1000)
         logger.info(
-            "bulk_upsert_completed", entity="fixtures", created=created, updated=updated, duration_ms=duration_ms
+            "bulk_upsert_completed",
+            entity="fixtures",
+            created=created,
+            updated=updated,
+            unchanged=unchanged,
+            duration_ms=duration_ms,
         )
-        return created, updated
+        return created, updated, unchanged
 
     def delete(self, fixture_id: int) -> bool:
         fixture = self.get_by_id(fixture_id)
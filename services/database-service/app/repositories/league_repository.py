@@ -3,7 +3,10 @@ import time
 import structlog
 from sqlalchemy.orm import Session
 
+from app.config import settings
+from app.metrics import observe_upsert
 from app.models.league import LeagueDB
+from app.repositories.upsert import bulk_upsert_rows, compute_content_hash
 from app.schemas.league import LeagueCreate
 
 logger = structlog.get_logger()
@@ -16,40 +19,49 @@ class LeagueRepository:
     def get_all(self) -> list[LeagueDB]:
         return self.db.query(LeagueDB).all()
 
+    def get_page(self, limit: int, after_id: int | None = None) -> list[LeagueDB]:
+        query = self.db.query(LeagueDB)
+        if after_id is not None:
+            query = query.filter(LeagueDB.id > after_id)
+        return query.order_by(LeagueDB.id).limit(limit).all()
+
     def get_by_id(self, league_id: int) -> LeagueDB | None:
         return self.db.query(LeagueDB).filter(LeagueDB.id == league_id).first()
 
+    def get_by_ids(self, ids: list[int]) -> list[LeagueDB]:
+        rows = []
+        chunk_size = settings.batch_lookup_chunk_size
+        for start in range(0, len(ids), chunk_size):
+            chunk = ids[start : start + chunk_size]
+            rows.extend(self.db.query(LeagueDB).filter(LeagueDB.id.in_(chunk)).all())
+        return rows
+
     def create(self, league: LeagueCreate) -> LeagueDB:
-        db_league = LeagueDB(**league.model_dump())
+        row = league.model_dump()
+        db_league = LeagueDB(**row, content_hash=compute_content_hash(row))
         self.db.add(db_league)
         self.db.commit()
         self.db.refresh(db_league)
         return db_league
 
-    def bulk_upsert(self, leagues: list[LeagueCreate]) -> tuple[int, int]:
+    def bulk_upsert(self, leagues: list[LeagueCreate]) -> tuple[int, int, int]:
         logger.info("bulk_upsert_started", entity="leagues", records=len(leagues))
         start = time.perf_counter()
 
-        created = 0
-        updated = 0
-
-        for league in leagues:
-            existing = self.get_by_id(league.id)
-            if existing:
-                for key, value in league.model_dump().items():
-                    setattr(existing, key, value)
-                updated += 1
-            else:
-                self.db.add(LeagueDB(**league.model_dump()))
-                created += 1
-
-        self.db.commit()
+        created, updated, unchanged = bulk_upsert_rows(self.db, LeagueDB, [league.model_dump() for league in leagues])
 
-        duration_ms = int((time.perf_counter() - start) * 1000)
+        elapsed = time.perf_counter() - start
+        observe_upsert("leagues", created, updated, unchanged, elapsed)
+        duration_ms = int(elapsed * 1000)
         logger.info(
-            "bulk_upsert_completed", entity="leagues", created=created, updated=updated, duration_ms=duration_ms
+            "bulk_upsert_completed",
+            entity="leagues",
+            created=created,
+            updated=updated,
+            unchanged=unchanged,
+            duration_ms=duration_ms,
         )
-        return created, updated
+        return created, updated, unchanged
 
     def delete(self, league_id: int) -> bool:
         league = self.get_by_id(league_id)
@@ -3,7 +3,10 @@ import time
 import structlog
 from sqlalchemy.orm import Session
 
+from app.config import settings
+from app.metrics import observe_upsert
 from app.models.team import TeamDB
+from app.repositories.upsert import bulk_upsert_rows, compute_content_hash
 from app.schemas.team import TeamCreate
 
 logger = structlog.get_logger()
@@ -16,38 +19,49 @@ class TeamRepository:
     def get_all(self) -> list[TeamDB]:
         return self.db.query(TeamDB).all()
 
+    def get_page(self, limit: int, after_id: int | None = None) -> list[TeamDB]:
+        query = self.db.query(TeamDB)
+        if after_id is not None:
+            query = query.filter(TeamDB.id > after_id)
+        return query.order_by(TeamDB.id).limit(limit).all()
+
     def get_by_id(self, team_id: int) -> TeamDB | None:
         return self.db.query(TeamDB).filter(TeamDB.id == team_id).first()
 
+    def get_by_ids(self, ids: list[int]) -> list[TeamDB]:
+        rows = []
+        chunk_size = settings.batch_lookup_chunk_size
+        for start in range(0, len(ids), chunk_size):
+            chunk = ids[start : start + chunk_size]
+            rows.extend(self.db.query(TeamDB).filter(TeamDB.id.in_(chunk)).all())
+        return rows
+
     def create(self, team: TeamCreate) -> TeamDB:
-        db_team = TeamDB(**team.model_dump())
+        row = team.model_dump()
+        db_team = TeamDB(**row, content_hash=compute_content_hash(row))
         self.db.add(db_team)
         self.db.commit()
         self.db.refresh(db_team)
         return db_team
 
-    def bulk_upsert(self, teams: list[TeamCreate]) -> tuple[int, int]:
+    def bulk_upsert(self, teams: list[TeamCreate]) -> tuple[int, int, int]:
         logger.info("bulk_upsert_started", entity="teams", records=len(teams))
         start = time.perf_counter()
 
-        created = 0
-        updated = 0
-
-        for team in teams:
-            existing = self.get_by_id(team.id)
-            if existing:
-                for key, value in team.model_dump().items():
-                    setattr(existing, key, value)
-                updated += 1
-            else:
-                self.db.add(TeamDB(**team.model_dump()))
-                created += 1
-
-        self.db.commit()
+        created, updated, unchanged = bulk_upsert_rows(self.db, TeamDB, [team.model_dump() for team in teams])
 
-        duration_ms = int((time.perf_counter() - start) * 1000)
-        logger.info("bulk_upsert_completed", entity="teams", created=created, updated=updated, duration_ms=duration_ms)
-        return created, updated
+        elapsed = time.perf_counter() - start
+        observe_upsert("teams", created, updated, unchanged, elapsed)
+        duration_ms = int(elapsed * 1000)
+        logger.info(
+            "bulk_upsert_completed",
+            entity="teams",
+            created=created,
+            updated=updated,
+            unchanged=unchanged,
+            duration_ms=duration_ms,
+        )
+        return created, updated, unchanged
 
     def delete(self, team_id: int) -> bool:
         team = self.get_by_id(team_id)
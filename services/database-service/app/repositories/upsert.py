@@ -0,0 +1,82 @@
+import hashlib
+import json
+from collections.abc import Iterator
+
+from sqlalchemy import Insert, insert, select, update
+from sqlalchemy.dialects import mysql
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import Base
+
+# Rough per-value overhead in the rendered INSERT: quotes, comma and escaping slack.
+VALUE_OVERHEAD_BYTES = 4
+ROW_OVERHEAD_BYTES = 4
+
+
+def compute_content_hash(row: dict) -> str:
+    content = {key: value for key, value in row.items() if key != "content_hash"}
+    payload = json.dumps(content, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+def estimate_row_bytes(row: dict) -> int:
+    return ROW_OVERHEAD_BYTES + sum(len(str(value)) + VALUE_OVERHEAD_BYTES for value in row.values())
+
+
+def iter_batches(rows: list[dict], max_rows: int, max_bytes: int) -> Iterator[list[dict]]:
+    batch = []
+    batch_bytes = 0
+    for row in rows:
+        row_bytes = estimate_row_bytes(row)
+        if batch and (len(batch) >= max_rows or batch_bytes + row_bytes > max_bytes):
+            yield batch
+            batch = []
+            batch_bytes = 0
+        batch.append(row)
+        batch_bytes += row_bytes
+    if batch:
+        yield batch
+
+
+def build_mysql_upsert(model: type[Base], batch: list[dict]) -> Insert:
+    statement = mysql.insert(model).values(batch)
+    return statement.on_duplicate_key_update(
+        {column: statement.inserted[column] for column in batch[0] if column != "id"}
+    )
+
+
+def bulk_upsert_rows(db: Session, model: type[Base], rows: list[dict]) -> tuple[int, int, int]:
+    # Last write wins for ids repeated within one request.
+    rows = [{**row, "content_hash": compute_content_hash(row)} for row in {row["id"]: row for row in rows}.values()]
+    is_mysql = db.get_bind().dialect.name == "mysql"
+
+    created = 0
+    updated = 0
+    unchanged = 0
+
+    for batch in iter_batches(rows, settings.upsert_batch_size, settings.upsert_max_batch_bytes):
+        ids = [row["id"] for row in batch]
+        stored = db.execute(select(model.id, model.content_hash).where(model.id.in_(ids)))
+        stored_hashes = {row_id: content_hash for row_id, content_hash in stored}
+
+        new_rows = [row for row in batch if row["id"] not in stored_hashes]
+        changed_rows = [
+            row for row in batch if row["id"] in stored_hashes and stored_hashes[row["id"]] != row["content_hash"]
+        ]
+
+        if is_mysql:
+            if new_rows or changed_rows:
+                db.execute(build_mysql_upsert(model, new_rows + changed_rows))
+        else:
+            if new_rows:
+                db.execute(insert(model), new_rows)
+            if changed_rows:
+                db.execute(update(model), changed_rows)
+
+        created += len(new_rows)
+        updated += len(changed_rows)
+        unchanged += len(batch) - len(new_rows) - len(changed_rows)
+
+    db.commit()
+    return created, updated, unchanged
@@ -0,0 +1,7 @@
+from fastapi.responses import Response
+
+
+def json_response(content: bytes | str) -> Response:
+    # For payloads already validated and rendered by pydantic, so FastAPI does
+    # not validate them against response_model a second time.
+    return Response(content=content, media_type="application/json")
@@ -0,0 +1,7 @@
+from pydantic import BaseModel, Field
+
+from app.config import settings
+
+
+class BatchLookupRequest(BaseModel):
+    ids: list[int] = Field(min_length=1, max_length=settings.max_batch_ids)
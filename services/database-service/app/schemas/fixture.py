@@ -1,4 +1,6 @@
-from pydantic import BaseModel
+from enum import StrEnum
+
+from pydantic import BaseModel, TypeAdapter
 
 
 class FixtureBase(BaseModel):
@@ -31,6 +33,34 @@ class FixtureResponse(FixtureBase):
     model_config = {"from_attributes": True}
 
 
+FixtureResponseList = TypeAdapter(list[FixtureResponse])
+
+
+class FixturePage(BaseModel):
+    data: list[FixtureResponse]
+    next_cursor: int | None = None
+
+
+class FixtureBatch(BaseModel):
+    data: list[FixtureResponse]
+    missing: list[int]
+
+
+class FixtureFilters(BaseModel):
+    league_id: int | None = None
+    season_id: int | None = None
+    state_id: int | None = None
+    venue_id: int | None = None
+    starting_at_from: int | None = None
+    starting_at_to: int | None = None
+
+
+class ExportFormat(StrEnum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
 class BulkCreateResponse(BaseModel):
     created: int
     updated: int
+    unchanged: int = 0
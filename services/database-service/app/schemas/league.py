@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
 
 class LeagueBase(BaseModel):
@@ -24,6 +24,20 @@ class LeagueResponse(LeagueBase):
     model_config = {"from_attributes": True}
 
 
+LeagueResponseList = TypeAdapter(list[LeagueResponse])
+
+
+class LeaguePage(BaseModel):
+    data: list[LeagueResponse]
+    next_cursor: int | None = None
+
+
+class LeagueBatch(BaseModel):
+    data: list[LeagueResponse]
+    missing: list[int]
+
+
 class BulkCreateResponse(BaseModel):
     created: int
     updated: int
+    unchanged: int = 0
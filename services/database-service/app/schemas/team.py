@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
 
 class TeamBase(BaseModel):
@@ -24,6 +24,20 @@ class TeamResponse(TeamBase):
     model_config = {"from_attributes": True}
 
 
+TeamResponseList = TypeAdapter(list[TeamResponse])
+
+
+class TeamPage(BaseModel):
+    data: list[TeamResponse]
+    next_cursor: int | None = None
+
+
+class TeamBatch(BaseModel):
+    data: list[TeamResponse]
+    missing: list[int]
+
+
 class BulkCreateResponse(BaseModel):
     created: int
     updated: int
+    unchanged: int = 0
@@ -1,16 +1,59 @@
+import csv
+import io
+import json
+from collections.abc import Iterator
+from itertools import islice
+
 from fastapi import HTTPException
 
+from app.config import settings
 from app.repositories.fixture_repository import FixtureRepository
-from app.schemas.fixture import BulkCreateResponse, FixtureCreate, FixtureResponse
+from app.schemas.fixture import (
+    BulkCreateResponse,
+    ExportFormat,
+    FixtureBatch,
+    FixtureCreate,
+    FixtureFilters,
+    FixturePage,
+    FixtureResponse,
+    FixtureResponseList,
+)
 
 
 class FixtureService:
     def __init__(self, repository: FixtureRepository):
         self.repository = repository
 
-    def get_all_fixtures(self) -> list[FixtureResponse]:
-        fixtures = self.repository.get_all()
-        return [FixtureResponse.model_validate(fixture) for fixture in fixtures]
+    def get_all_fixtures(self, filters: FixtureFilters | None = None) -> list[FixtureResponse]:
+        return FixtureResponseList.validate_python(self.repository.get_all(filters))
+
+    def get_fixtures_page(
+        self, limit: int, after_id: int | None = None, filters: FixtureFilters | None = None
+    ) -> FixturePage:
+        fixtures = self.repository.get_page(limit + 1, after_id, filters)
+        next_cursor = fixtures[limit - 1].id if len(fixtures) > limit else None
+        return FixturePage(data=FixtureResponseList.validate_python(fixtures[:limit]), next_cursor=next_cursor)
+
+    def export_fixtures(self, export_format: ExportFormat, filters: FixtureFilters | None = None) -> Iterator[bytes]:
+        columns = list(FixtureResponse.model_fields)
+        rows = self.repository.iter_rows(columns, filters, settings.export_batch_size)
+
+        if export_format == ExportFormat.CSV:
+            yield self._render_csv(columns, [], header=True)
+        while batch := list(islice(rows, settings.export_batch_size)):
+            if export_format == ExportFormat.CSV:
+                yield self._render_csv(columns, batch)
+            else:
+                yield "".join(json.dumps(dict(row)) + "\n" for row in batch).encode()
+
+    @staticmethod
+    def _render_csv(columns: list[str], rows: list, header: bool = False) -> bytes:
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=columns)
+        if header:
+            writer.writeheader()
+        writer.writerows(rows)
+        return buffer.getvalue().encode()
 
     def get_fixture_by_id(self, fixture_id: int) -> FixtureResponse:
         fixture = self.repository.get_by_id(fixture_id)
@@ -18,6 +61,14 @@ class FixtureService:
             raise HTTPException(status_code=404, detail=f"Fixture {fixture_id} not found")
         return FixtureResponse.model_validate(fixture)
 
+    def get_fixtures_by_ids(self, ids: list[int]) -> FixtureBatch:
+        ids = list(dict.fromkeys(ids))
+        found = {fixture.id: fixture for fixture in self.repository.get_by_ids(ids)}
+        return FixtureBatch(
+            data=FixtureResponseList.validate_python([found[fixture_id] for fixture_id in ids if fixture_id in found]),
+            missing=[fixture_id for fixture_id in ids if fixture_id not in found],
+        )
+
     def create_fixture(self, fixture: FixtureCreate) -> FixtureResponse:
         existing = self.repository.get_by_id(fixture.id)
         if existing:
@@ -26,8 +77,8 @@ class FixtureService:
         return FixtureResponse.model_validate(db_fixture)
 
     def bulk_upsert_fixtures(self, fixtures: list[FixtureCreate]) -> BulkCreateResponse:
-        created, updated = self.repository.bulk_upsert(fixtures)
-        return BulkCreateResponse(created=created, updated=updated)
+        created, updated, unchanged = self.repository.bulk_upsert(fixtures)
+        return BulkCreateResponse(created=created, updated=updated, unchanged=unchanged)
 
     def delete_fixture(self, fixture_id: int) -> None:
         if not self.repository.delete(fixture_id):
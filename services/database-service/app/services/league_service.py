@@ -1,7 +1,14 @@
 from fastapi import HTTPException
 
 from app.repositories.league_repository import LeagueRepository
-from app.schemas.league import BulkCreateResponse, LeagueCreate, LeagueResponse
+from app.schemas.league import (
+    BulkCreateResponse,
+    LeagueBatch,
+    LeagueCreate,
+    LeaguePage,
+    LeagueResponse,
+    LeagueResponseList,
+)
 
 
 class LeagueService:
@@ -10,7 +17,15 @@ class LeagueService:
 
     def get_all_leagues(self) -> list[LeagueResponse]:
         leagues = self.repository.get_all()
-        return [LeagueResponse.model_validate(league) for league in leagues]
+        return LeagueResponseList.validate_python(leagues)
+
+    def get_leagues_page(self, limit: int, after_id: int | None = None) -> LeaguePage:
+        leagues = self.repository.get_page(limit + 1, after_id)
+        next_cursor = leagues[limit - 1].id if len(leagues) > limit else None
+        return LeaguePage(
+            data=LeagueResponseList.validate_python(leagues[:limit]),
+            next_cursor=next_cursor,
+        )
 
     def get_league_by_id(self, league_id: int) -> LeagueResponse:
         league = self.repository.get_by_id(league_id)
@@ -18,6 +33,14 @@ class LeagueService:
             raise HTTPException(status_code=404, detail=f"League {league_id} not found")
         return LeagueResponse.model_validate(league)
 
+    def get_leagues_by_ids(self, ids: list[int]) -> LeagueBatch:
+        ids = list(dict.fromkeys(ids))
+        found = {league.id: league for league in self.repository.get_by_ids(ids)}
+        return LeagueBatch(
+            data=LeagueResponseList.validate_python([found[league_id] for league_id in ids if league_id in found]),
+            missing=[league_id for league_id in ids if league_id not in found],
+        )
+
     def create_league(self, league: LeagueCreate) -> LeagueResponse:
         existing = self.repository.get_by_id(league.id)
         if existing:
@@ -26,8 +49,8 @@ class LeagueService:
         return LeagueResponse.model_validate(db_league)
 
     def bulk_upsert_leagues(self, leagues: list[LeagueCreate]) -> BulkCreateResponse:
-        created, updated = self.repository.bulk_upsert(leagues)
-        return BulkCreateResponse(created=created, updated=updated)
+        created, updated, unchanged = self.repository.bulk_upsert(leagues)
+        return BulkCreateResponse(created=created, updated=updated, unchanged=unchanged)
 
     def delete_league(self, league_id: int) -> None:
         if not self.repository.delete(league_id):
@@ -1,7 +1,7 @@
 from fastapi import HTTPException
 
 from app.repositories.team_repository import TeamRepository
-from app.schemas.team import BulkCreateResponse, TeamCreate, TeamResponse
+from app.schemas.team import BulkCreateResponse, TeamBatch, TeamCreate, TeamPage, TeamResponse, TeamResponseList
 
 
 class TeamService:
@@ -10,7 +10,15 @@ class TeamService:
 
     def get_all_teams(self) -> list[TeamResponse]:
         teams = self.repository.get_all()
-        return [TeamResponse.model_validate(team) for team in teams]
+        return TeamResponseList.validate_python(teams)
+
+    def get_teams_page(self, limit: int, after_id: int | None = None) -> TeamPage:
+        teams = self.repository.get_page(limit + 1, after_id)
+        next_cursor = teams[limit - 1].id if len(teams) > limit else None
+        return TeamPage(
+            data=TeamResponseList.validate_python(teams[:limit]),
+            next_cursor=next_cursor,
+        )
 
     def get_team_by_id(self, team_id: int) -> TeamResponse:
         team = self.repository.get_by_id(team_id)
@@ -18,6 +26,14 @@ class TeamService:
             raise HTTPException(status_code=404, detail="Team not found")
         return TeamResponse.model_validate(team)
 
+    def get_teams_by_ids(self, ids: list[int]) -> TeamBatch:
+        ids = list(dict.fromkeys(ids))
+        found = {team.id: team for team in self.repository.get_by_ids(ids)}
+        return TeamBatch(
+            data=TeamResponseList.validate_python([found[team_id] for team_id in ids if team_id in found]),
+            missing=[team_id for team_id in ids if team_id not in found],
+        )
+
     def create_team(self, team: TeamCreate) -> TeamResponse:
         existing = self.repository.get_by_id(team.id)
         if existing:
@@ -26,8 +42,8 @@ class TeamService:
         return TeamResponse.model_validate(created)
 
     def bulk_upsert_teams(self, teams: list[TeamCreate]) -> BulkCreateResponse:
-        created, updated = self.repository.bulk_upsert(teams)
-        return BulkCreateResponse(created=created, updated=updated)
+        created, updated, unchanged = self.repository.bulk_upsert(teams)
+        return BulkCreateResponse(created=created, updated=updated, unchanged=unchanged)
 
     def delete_team(self, team_id: int) -> None:
         deleted = self.repository.delete(team_id)
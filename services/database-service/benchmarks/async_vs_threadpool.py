@@ -0,0 +1,120 @@
+import argparse
+import asyncio
+import logging
+import statistics
+import time
+
+import anyio.to_thread
+import httpx
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.database import SessionRunner, get_db, get_session_runner, get_sync_session_runner, sync_schema
+from app.main import app
+
+
+def fixture(fixture_id: int, round_id: int) -> dict:
+    return {
+        "id": fixture_id,
+        "sport_id": 1,
+        "league_id": 8,
+        "season_id": 23614,
+        "round_id": round_id,
+        "state_id": 5,
+        "name": f"Fixture {fixture_id}",
+        "placeholder": False,
+        "has_odds": True,
+        "starting_at_timestamp": 1_722_470_400 + fixture_id,
+    }
+
+
+async def writer(client: httpx.AsyncClient, stop: asyncio.Event, batch_size: int, durations: list[float]) -> None:
+    round_id = 0
+    while not stop.is_set():
+        round_id += 1
+        start = time.perf_counter()
+        response = await client.post("/fixtures/bulk", json=[fixture(i, round_id) for i in range(1, batch_size + 1)])
+        response.raise_for_status()
+        durations.append(time.perf_counter() - start)
+
+
+async def reader(client: httpx.AsyncClient, stop: asyncio.Event, rows: int, latencies: list[float]) -> None:
+    fixture_id = 0
+    while not stop.is_set():
+        fixture_id = fixture_id % rows + 1
+        start = time.perf_counter()
+        response = await client.get(f"/fixtures/{fixture_id}")
+        response.raise_for_status()
+        latencies.append(time.perf_counter() - start)
+
+
+async def run_mode(mode: str, args: argparse.Namespace) -> None:
+    # Bulk upserts always run on the thread pool over the sync engine; only the reads switch modes.
+    sync_session_factory = sessionmaker(bind=create_engine(args.url), autoflush=False)
+
+    def get_sync_db():
+        db = sync_session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = get_sync_db
+    if mode == "async":
+        session_factory = async_sessionmaker(create_async_engine(args.async_url), autoflush=False)
+
+        async def runner():
+            async with session_factory() as db:
+                yield SessionRunner(async_db=db)
+
+        app.dependency_overrides[get_session_runner] = runner
+    else:
+        app.dependency_overrides[get_session_runner] = get_sync_session_runner
+    anyio.to_thread.current_default_thread_limiter().total_tokens = args.threads
+
+    stop = asyncio.Event()
+    write_durations: list[float] = []
+    read_latencies: list[float] = []
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://benchmark", timeout=None) as client:
+        seed = await client.post("/fixtures/bulk", json=[fixture(i, 0) for i in range(1, args.batch_size + 1)])
+        seed.raise_for_status()
+        tasks = [
+            asyncio.create_task(writer(client, stop, args.batch_size, write_durations)) for _ in range(args.writers)
+        ]
+        tasks += [
+            asyncio.create_task(reader(client, stop, args.batch_size, read_latencies)) for _ in range(args.readers)
+        ]
+        await asyncio.sleep(args.duration)
+        stop.set()
+        await asyncio.gather(*tasks)
+
+    quantiles = statistics.quantiles(read_latencies, n=100)
+    print(
+        f"{mode:>10}: reads={len(read_latencies)} "
+        f"p50={quantiles[49] * 1000:.1f}ms p95={quantiles[94] * 1000:.1f}ms p99={quantiles[98] * 1000:.1f}ms "
+        f"bulk_upserts={len(write_durations)} mean_upsert={statistics.fmean(write_durations or [0]) * 1000:.0f}ms"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare read latency under bulk-upsert load: thread pool vs asyncio")
+    parser.add_argument("--url", default="sqlite:///benchmark.db", help="Sync SQLAlchemy URL")
+    parser.add_argument("--async-url", default="sqlite+aiosqlite:///benchmark.db", help="Async SQLAlchemy URL")
+    parser.add_argument("--writers", type=int, default=4, help="Concurrent bulk upsert loops")
+    parser.add_argument("--readers", type=int, default=50, help="Concurrent single-fixture read loops")
+    parser.add_argument("--batch-size", type=int, default=2000, help="Fixtures per bulk upsert")
+    parser.add_argument("--threads", type=int, default=8, help="Starlette thread pool size")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds per mode")
+    args = parser.parse_args()
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    sync_schema(create_engine(args.url))
+    for mode in ("threadpool", "async"):
+        await run_mode(mode, args)
+    app.dependency_overrides.clear()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
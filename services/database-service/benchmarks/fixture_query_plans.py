@@ -0,0 +1,86 @@
+import argparse
+import random
+import time
+
+from sqlalchemy import create_engine, insert, text
+from sqlalchemy.orm import sessionmaker
+
+from app.database import sync_schema
+from app.models.fixture import FixtureDB
+from app.repositories.fixture_repository import FixtureRepository
+from app.schemas.fixture import FixtureFilters
+
+SEASON_START = 1_722_470_400
+SEASON_SECONDS = 300 * 24 * 3600
+
+QUERIES = {
+    "league_date_range": FixtureFilters(
+        league_id=8, starting_at_from=SEASON_START, starting_at_to=SEASON_START + 30 * 24 * 3600
+    ),
+    "season_state": FixtureFilters(season_id=23614, state_id=5),
+    "state_date_range": FixtureFilters(state_id=1, starting_at_from=SEASON_START + SEASON_SECONDS // 2),
+    "venue_date_range": FixtureFilters(venue_id=42, starting_at_from=SEASON_START),
+}
+
+
+def populate(session, rows: int) -> None:
+    random_state = random.Random(42)
+    batch = []
+    for fixture_id in range(1, rows + 1):
+        batch.append(
+            {
+                "id": fixture_id,
+                "sport_id": 1,
+                "league_id": random_state.choice([8, 9, 82, 271, 501, 564]),
+                "season_id": random_state.choice([23614, 23615, 23584, 23690]),
+                "state_id": random_state.choice([1, 5, 5, 5, 10]),
+                "venue_id": random_state.randint(1, 500),
+                "name": f"Fixture {fixture_id}",
+                "placeholder": False,
+                "has_odds": True,
+                "starting_at_timestamp": SEASON_START + random_state.randint(0, SEASON_SECONDS),
+            }
+        )
+        if len(batch) == 5000:
+            session.execute(insert(FixtureDB), batch)
+            batch = []
+    if batch:
+        session.execute(insert(FixtureDB), batch)
+    session.commit()
+
+
+def explain(session, sql: str) -> list[str]:
+    prefix = "EXPLAIN QUERY PLAN" if session.get_bind().dialect.name == "sqlite" else "EXPLAIN"
+    return [" | ".join(str(value) for value in row) for row in session.execute(text(f"{prefix} {sql}"))]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Show query plans and timings for filtered fixture queries")
+    parser.add_argument("--url", default="sqlite:///:memory:", help="SQLAlchemy database URL to benchmark against")
+    parser.add_argument("--rows", type=int, default=100_000, help="Synthetic fixtures to insert")
+    parser.add_argument("--repeat", type=int, default=20, help="Executions per query")
+    args = parser.parse_args()
+
+    engine = create_engine(args.url)
+    sync_schema(engine)
+    session = sessionmaker(bind=engine)()
+    if session.query(FixtureDB).count() == 0:
+        populate(session, args.rows)
+
+    repository = FixtureRepository(session)
+    for name, filters in QUERIES.items():
+        query = repository.filtered_query(filters).order_by(FixtureDB.id).limit(100)
+        sql = str(query.statement.compile(engine, compile_kwargs={"literal_binds": True}))
+
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            query.all()
+        mean_ms = (time.perf_counter() - start) * 1000 / args.repeat
+
+        print(f"\n{name}: {mean_ms:.2f} ms/query")
+        for line in explain(session, sql):
+            print(f"  {line}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+import argparse
+import asyncio
+import time
+
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from app.models.fixture import FixtureDB
+from app.schemas.fixture import FixturePage, FixtureResponse, FixtureResponseList
+
+
+def fixture(fixture_id: int) -> FixtureDB:
+    return FixtureDB(
+        id=fixture_id,
+        sport_id=1,
+        league_id=8,
+        season_id=23614,
+        stage_id=77471288,
+        round_id=339235,
+        state_id=5,
+        venue_id=204,
+        name="Manchester United vs Fulham",
+        starting_at="2024-08-16 19:00:00",
+        result_info="Manchester United won after full-time.",
+        leg="1/1",
+        length=90,
+        placeholder=False,
+        has_odds=True,
+        starting_at_timestamp=1723834800,
+    )
+
+
+async def serialize_baseline(rows: list[FixtureDB], response_field) -> bytes:
+    # model_validate per ORM row, then FastAPI validating and serializing the
+    # route's response_model.
+    fixtures = [FixtureResponse.model_validate(row) for row in rows]
+    return await serialize_response(field=response_field, response_content=fixtures, dump_json=True)
+
+
+async def serialize_fast_path(rows: list[FixtureDB]) -> bytes:
+    return FixtureResponseList.dump_json(FixtureResponseList.validate_python(rows))
+
+
+async def measure(label: str, fn, records: int, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.process_time()
+        await fn()
+        best = min(best, time.process_time() - start)
+    per_record_us = best / records * 1_000_000
+    print(f"{label:>10}: {best * 1000:8.1f} ms CPU  {per_record_us:6.2f} us/record")
+    return per_record_us
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="CPU cost of serializing fixture rows for GET /fixtures")
+    parser.add_argument("--records", type=int, default=50_000, help="ORM rows to serialize")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per variant; the best is reported")
+    args = parser.parse_args()
+
+    rows = [fixture(i) for i in range(args.records)]
+    response_field = create_model_field(
+        name="Response_get_fixtures", type_=FixturePage | list[FixtureResponse], mode="serialization"
+    )
+    assert await serialize_baseline(rows, response_field) == await serialize_fast_path(rows)
+
+    baseline = await measure("baseline", lambda: serialize_baseline(rows, response_field), args.records, args.repeat)
+    fast = await measure("fast path", lambda: serialize_fast_path(rows), args.records, args.repeat)
+    print(f"{'saved':>10}: {baseline - fast:6.2f} us/record ({(1 - fast / baseline) * 100:.0f}%)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
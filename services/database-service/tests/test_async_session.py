@@ -0,0 +1,50 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
+
+from app.database import Base, SessionRunner, get_db, get_session_runner
+from app.main import app
+
+
+@pytest.fixture
+def async_client(tmp_path):
+    database_path = tmp_path / "async.db"
+    sync_engine = create_engine(f"sqlite:///{database_path}")
+    Base.metadata.create_all(bind=sync_engine)
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{database_path}", poolclass=NullPool)
+    session_factory = async_sessionmaker(async_engine, autoflush=False)
+
+    async def override_get_session_runner():
+        async with session_factory() as db:
+            yield SessionRunner(async_db=db)
+
+    def override_get_db():
+        db = sessionmaker(bind=sync_engine, autoflush=False)()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_session_runner] = override_get_session_runner
+    app.dependency_overrides[get_db] = override_get_db
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+    sync_engine.dispose()
+
+
+class TestAsyncSessionRunner:
+    def test_bulk_upsert_and_read_through_async_session(self, async_client, mock_fixture_data):
+        response = async_client.post("/fixtures/bulk", json=[mock_fixture_data, {**mock_fixture_data, "id": 2}])
+
+        assert response.json() == {"created": 2, "updated": 0, "unchanged": 0}
+        page = async_client.get("/fixtures", params={"limit": 1}).json()
+        assert [fixture["id"] for fixture in page["data"]] == [2]
+        assert page["next_cursor"] == 2
+
+    def test_not_found_propagates_from_async_session(self, async_client):
+        response = async_client.get("/leagues/999")
+
+        assert response.status_code == 404
@@ -0,0 +1,114 @@
+import gzip
+import json
+
+import pytest
+import zstandard
+from prometheus_client import REGISTRY
+
+from app.compression import negotiate
+from app.config import settings
+
+
+@pytest.fixture
+def teams(mock_team_data):
+    return [{**mock_team_data, "id": mock_team_data["id"] + index, "name": f"Team {index}"} for index in range(50)]
+
+
+@pytest.mark.parametrize(
+    "accept_encoding,expected",
+    [
+        ("gzip, deflate, zstd", "zstd"),
+        ("gzip", "gzip"),
+        ("zstd;q=0.5, gzip", "gzip"),
+        ("zstd;q=0, gzip;q=0", None),
+        ("*", "zstd"),
+        ("br", None),
+        ("", None),
+    ],
+)
+def test_negotiate(accept_encoding, expected):
+    assert negotiate(accept_encoding) == expected
+
+
+class TestResponseCompression:
+    def test_list_is_compressed_with_preferred_encoding(self, client, teams):
+        client.post("/teams/bulk", json=teams)
+
+        response = client.get("/teams", params={"limit": 50}, headers={"Accept-Encoding": "gzip, zstd"})
+
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "zstd"
+        assert "Accept-Encoding" in response.headers["vary"]
+        assert len(response.json()["data"]) == 50
+
+    def test_gzip_when_only_gzip_accepted(self, client, teams):
+        client.post("/teams/bulk", json=teams)
+
+        response = client.get("/teams", params={"limit": 50}, headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert len(response.json()["data"]) == 50
+
+    def test_small_responses_are_not_compressed(self, client):
+        response = client.get("/health", headers={"Accept-Encoding": "zstd"})
+
+        assert "content-encoding" not in response.headers
+        assert response.json() == {"status": "healthy"}
+
+
+class TestRequestDecompression:
+    @pytest.mark.parametrize(
+        "encoding,compress",
+        [("gzip", gzip.compress), ("zstd", lambda body: zstandard.ZstdCompressor().compress(body))],
+    )
+    def test_bulk_upsert_accepts_compressed_body(self, client, teams, encoding, compress):
+        response = client.post(
+            "/teams/bulk",
+            content=compress(json.dumps(teams).encode()),
+            headers={"Content-Type": "application/json", "Content-Encoding": encoding},
+        )
+
+        assert response.status_code == 200
+        assert response.json()["created"] == 50
+
+    def test_compressed_request_keeps_its_route_label(self, client, teams):
+        labels = {"method": "POST", "route": "/teams/bulk", "status": "200"}
+        before = REGISTRY.get_sample_value("http_request_duration_seconds_count", labels) or 0
+
+        client.post(
+            "/teams/bulk",
+            content=zstandard.ZstdCompressor().compress(json.dumps(teams).encode()),
+            headers={"Content-Type": "application/json", "Content-Encoding": "zstd"},
+        )
+
+        assert REGISTRY.get_sample_value("http_request_duration_seconds_count", labels) == before + 1
+
+    def test_unsupported_encoding_is_rejected(self, client, teams):
+        response = client.post(
+            "/teams/bulk",
+            content=json.dumps(teams).encode(),
+            headers={"Content-Type": "application/json", "Content-Encoding": "br"},
+        )
+
+        assert response.status_code == 415
+        assert response.headers["accept-encoding"] == "zstd, gzip"
+
+    def test_corrupt_body_is_rejected(self, client):
+        response = client.post(
+            "/teams/bulk",
+            content=b"not gzip at all",
+            headers={"Content-Type": "application/json", "Content-Encoding": "gzip"},
+        )
+
+        assert response.status_code == 400
+
+    def test_decompressed_size_is_limited(self, client, teams, monkeypatch):
+        monkeypatch.setattr(settings, "max_request_body_bytes", 1024)
+
+        response = client.post(
+            "/teams/bulk",
+            content=gzip.compress(json.dumps(teams).encode()),
+            headers={"Content-Type": "application/json", "Content-Encoding": "gzip"},
+        )
+
+        assert response.status_code == 413
@@ -0,0 +1,29 @@
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.pool import StaticPool
+
+from app import migrate
+from app.database import sync_schema
+
+
+def test_sync_schema_adds_missing_nullable_columns():
+    engine = create_engine("sqlite:///:memory:", poolclass=StaticPool)
+    with engine.begin() as connection:
+        connection.execute(text("CREATE TABLE leagues (id INTEGER PRIMARY KEY, sport_id INTEGER NOT NULL)"))
+
+    sync_schema(engine)
+
+    columns = {column["name"] for column in inspect(engine).get_columns("leagues")}
+    assert "content_hash" in columns
+    assert "name" not in columns
+    assert inspect(engine).has_table("fixtures")
+
+
+def test_migrate_applies_schema_changes(monkeypatch):
+    engine = create_engine("sqlite:///:memory:", poolclass=StaticPool)
+    with engine.begin() as connection:
+        connection.execute(text("CREATE TABLE leagues (id INTEGER PRIMARY KEY, sport_id INTEGER NOT NULL)"))
+    monkeypatch.setattr(migrate, "engine", engine)
+
+    migrate.main()
+
+    assert "content_hash" in {column["name"] for column in inspect(engine).get_columns("leagues")}
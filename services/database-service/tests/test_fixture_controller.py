@@ -1,20 +1,113 @@
+import csv
+import io
+import json
+
+from app.config import settings
+
+
 class TestGetFixtures:
-    def test_returns_empty_list_when_no_fixtures(self, client):
+    def test_returns_empty_page_when_no_fixtures(self, client):
         response = client.get("/fixtures")
 
         assert response.status_code == 200
-        assert response.json() == []
+        assert response.json() == {"data": [], "next_cursor": None}
 
-    def test_returns_list_of_fixtures(self, client, mock_fixture_data):
+    def test_returns_page_of_fixtures(self, client, mock_fixture_data):
         client.post("/fixtures", json=mock_fixture_data)
 
         response = client.get("/fixtures")
 
         assert response.status_code == 200
-        data = response.json()
+        data = response.json()["data"]
         assert len(data) == 1
         assert data[0]["id"] == mock_fixture_data["id"]
 
+    def test_walks_pages_with_next_cursor(self, client, mock_fixture_data):
+        fixture_ids = [mock_fixture_data["id"] + offset for offset in range(5)]
+        client.post("/fixtures/bulk", json=[{**mock_fixture_data, "id": fixture_id} for fixture_id in fixture_ids])
+
+        seen = []
+        params = {"limit": 2}
+        while True:
+            page = client.get("/fixtures", params=params).json()
+            seen.extend(fixture["id"] for fixture in page["data"])
+            if page["next_cursor"] is None:
+                break
+            params["after_id"] = page["next_cursor"]
+
+        assert seen == fixture_ids
+
+    def test_rejects_limit_above_maximum(self, client):
+        response = client.get("/fixtures", params={"limit": 100000})
+
+        assert response.status_code == 422
+
+    def test_filters_by_league_and_date_range(self, client, mock_fixture_data):
+        timestamp = mock_fixture_data["starting_at_timestamp"]
+        client.post(
+            "/fixtures/bulk",
+            json=[
+                mock_fixture_data,
+                {**mock_fixture_data, "id": 2, "league_id": 501},
+                {**mock_fixture_data, "id": 3, "starting_at_timestamp": timestamp + 86400},
+            ],
+        )
+
+        response = client.get(
+            "/fixtures",
+            params={"league_id": 271, "starting_at_from": timestamp, "starting_at_to": timestamp + 3600},
+        )
+
+        assert response.status_code == 200
+        assert [fixture["id"] for fixture in response.json()["data"]] == [mock_fixture_data["id"]]
+
+    def test_filters_by_season_and_state(self, client, mock_fixture_data):
+        client.post("/fixtures/bulk", json=[mock_fixture_data, {**mock_fixture_data, "id": 2, "state_id": 1}])
+
+        response = client.get("/fixtures", params={"season_id": 23584, "state_id": 1})
+
+        assert [fixture["id"] for fixture in response.json()["data"]] == [2]
+
+    def test_returns_full_list_when_all_requested(self, client, mock_fixture_data):
+        client.post("/fixtures", json=mock_fixture_data)
+
+        response = client.get("/fixtures", params={"all": True})
+
+        assert response.status_code == 200
+        assert [fixture["id"] for fixture in response.json()] == [mock_fixture_data["id"]]
+
+
+class TestExportFixtures:
+    def test_exports_ndjson(self, client, mock_fixture_data):
+        client.post("/fixtures/bulk", json=[mock_fixture_data, {**mock_fixture_data, "id": 2}])
+
+        response = client.get("/fixtures/export")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        assert [row["id"] for row in rows] == [2, mock_fixture_data["id"]]
+        assert rows[1] == mock_fixture_data
+
+    def test_exports_csv_with_header(self, client, mock_fixture_data):
+        client.post("/fixtures", json=mock_fixture_data)
+
+        response = client.get("/fixtures/export", params={"format": "csv"})
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/csv")
+        rows = list(csv.DictReader(io.StringIO(response.text)))
+        assert len(rows) == 1
+        assert rows[0]["id"] == str(mock_fixture_data["id"])
+        assert rows[0]["name"] == mock_fixture_data["name"]
+
+    def test_applies_filters(self, client, mock_fixture_data):
+        client.post("/fixtures/bulk", json=[mock_fixture_data, {**mock_fixture_data, "id": 2, "league_id": 501}])
+
+        response = client.get("/fixtures/export", params={"league_id": 501})
+
+        assert [json.loads(line)["id"] for line in response.text.splitlines()] == [2]
+
 
 class TestGetFixtureById:
     def test_returns_fixture_when_exists(self, client, mock_fixture_data):
@@ -31,6 +124,33 @@ class TestGetFixtureById:
         assert response.status_code == 404
 
 
+class TestGetFixturesBatch:
+    def test_returns_fixtures_in_request_order_with_misses(self, client, mock_fixture_data):
+        fixtures = [{**mock_fixture_data, "id": fixture_id} for fixture_id in (1, 2, 3)]
+        client.post("/fixtures/bulk", json=fixtures)
+
+        response = client.post("/fixtures/batch", json={"ids": [3, 99, 1, 3]})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [fixture["id"] for fixture in data["data"]] == [3, 1]
+        assert data["missing"] == [99]
+
+    def test_looks_up_ids_in_chunks(self, client, mock_fixture_data, monkeypatch):
+        monkeypatch.setattr(settings, "batch_lookup_chunk_size", 2)
+        fixtures = [{**mock_fixture_data, "id": fixture_id} for fixture_id in range(1, 6)]
+        client.post("/fixtures/bulk", json=fixtures)
+
+        response = client.post("/fixtures/batch", json={"ids": [5, 4, 3, 2, 1]})
+
+        assert [fixture["id"] for fixture in response.json()["data"]] == [5, 4, 3, 2, 1]
+
+    def test_rejects_empty_id_list(self, client):
+        response = client.post("/fixtures/batch", json={"ids": []})
+
+        assert response.status_code == 422
+
+
 class TestCreateFixture:
     def test_creates_fixture(self, client, mock_fixture_data):
         response = client.post("/fixtures", json=mock_fixture_data)
@@ -69,6 +189,14 @@ class TestBulkUpsertFixtures:
         assert response.json()["created"] == 0
         assert response.json()["updated"] == 1
 
+    def test_reports_unchanged_fixtures(self, client, mock_fixture_data):
+        client.post("/fixtures", json=mock_fixture_data)
+
+        response = client.post("/fixtures/bulk", json=[mock_fixture_data])
+
+        assert response.status_code == 200
+        assert response.json() == {"created": 0, "updated": 0, "unchanged": 1}
+
 
 class TestDeleteFixture:
     def test_deletes_existing_fixture(self, client, mock_fixture_data):
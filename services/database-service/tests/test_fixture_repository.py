@@ -0,0 +1,25 @@
+from sqlalchemy import text
+
+from app.repositories.fixture_repository import FixtureRepository
+from app.schemas.fixture import FixtureFilters
+
+
+class TestFilteredQuery:
+    def test_league_and_date_range_use_composite_index(self, db_session):
+        repository = FixtureRepository(db_session)
+        filters = FixtureFilters(league_id=271, starting_at_from=1733000000, starting_at_to=1734000000)
+        query = repository.filtered_query(filters)
+        sql = str(query.statement.compile(db_session.get_bind(), compile_kwargs={"literal_binds": True}))
+
+        plan = " ".join(str(row) for row in db_session.execute(text(f"EXPLAIN QUERY PLAN {sql}")))
+
+        assert "ix_fixtures_league_id_starting_at_timestamp" in plan
+
+    def test_season_and_state_use_composite_index(self, db_session):
+        repository = FixtureRepository(db_session)
+        query = repository.filtered_query(FixtureFilters(season_id=23584, state_id=5))
+        sql = str(query.statement.compile(db_session.get_bind(), compile_kwargs={"literal_binds": True}))
+
+        plan = " ".join(str(row) for row in db_session.execute(text(f"EXPLAIN QUERY PLAN {sql}")))
+
+        assert "ix_fixtures_season_id_state_id" in plan
@@ -3,7 +3,7 @@ class TestGetLeagues:
         response = client.get("/leagues")
 
         assert response.status_code == 200
-        assert response.json() == []
+        assert response.json() == {"data": [], "next_cursor": None}
 
     def test_returns_list_of_leagues(self, client, mock_league_data):
         client.post("/leagues", json=mock_league_data)
@@ -11,7 +11,7 @@ class TestGetLeagues:
         response = client.get("/leagues")
 
         assert response.status_code == 200
-        data = response.json()
+        data = response.json()["data"]
         assert len(data) == 1
         assert data[0]["id"] == mock_league_data["id"]
 
@@ -31,6 +31,18 @@ class TestGetLeagueById:
         assert response.status_code == 404
 
 
+
+class TestGetLeaguesBatch:
+    def test_returns_leagues_in_request_order_with_misses(self, client, mock_league_data):
+        client.post("/leagues/bulk", json=[{**mock_league_data, "id": 8}, {**mock_league_data, "id": 564}])
+
+        response = client.post("/leagues/batch", json={"ids": [564, 1, 8]})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [league["id"] for league in data["data"]] == [564, 8]
+        assert data["missing"] == [1]
+
 class TestCreateLeague:
     def test_creates_league(self, client, mock_league_data):
         response = client.post("/leagues", json=mock_league_data)
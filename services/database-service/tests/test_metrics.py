@@ -0,0 +1,23 @@
+from prometheus_client import REGISTRY
+
+
+def test_metrics_endpoint_exposes_pool_gauges(client):
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert 'db_pool_connections{engine="sync",state="checked_out"}' in response.text
+    assert 'db_pool_size{engine="sync"}' in response.text
+
+
+def test_bulk_upsert_counts_rows_by_outcome(client, mock_team_data):
+    def sample(outcome):
+        return REGISTRY.get_sample_value("db_upserted_rows_total", {"entity": "teams", "outcome": outcome}) or 0
+
+    created, updated = sample("created"), sample("updated")
+
+    client.post("/teams/bulk", json=[mock_team_data])
+    client.post("/teams/bulk", json=[{**mock_team_data, "name": "Renamed"}])
+
+    assert sample("created") == created + 1
+    assert sample("updated") == updated + 1
+    assert REGISTRY.get_sample_value("db_bulk_upsert_duration_seconds_count", {"entity": "teams"}) >= 2
@@ -1,7 +1,7 @@
 def test_get_teams_empty(client):
     response = client.get("/teams")
     assert response.status_code == 200
-    assert response.json() == []
+    assert response.json() == {"data": [], "next_cursor": None}
 
 
 def test_create_team(client, mock_team_data):
@@ -33,6 +33,15 @@ def test_get_team_not_found(client):
     assert response.status_code == 404
 
 
+def test_get_teams_batch(client, mock_team_data):
+    client.post("/teams/bulk", json=[{**mock_team_data, "id": 1}, {**mock_team_data, "id": 2}])
+    response = client.post("/teams/batch", json={"ids": [2, 7, 1]})
+    assert response.status_code == 200
+    data = response.json()
+    assert [team["id"] for team in data["data"]] == [2, 1]
+    assert data["missing"] == [7]
+
+
 def test_bulk_upsert_teams(client, mock_team_data):
     teams = [mock_team_data]
     response = client.post("/teams/bulk", json=teams)
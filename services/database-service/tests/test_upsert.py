@@ -0,0 +1,86 @@
+from unittest.mock import patch
+
+from sqlalchemy.dialects import mysql
+
+from app.models.fixture import FixtureDB
+from app.repositories.fixture_repository import FixtureRepository
+from app.repositories.upsert import build_mysql_upsert, compute_content_hash, iter_batches
+from app.schemas.fixture import FixtureCreate
+
+
+class TestIterBatches:
+    def test_splits_on_row_count(self):
+        rows = [{"id": row_id} for row_id in range(5)]
+
+        batches = list(iter_batches(rows, max_rows=2, max_bytes=1_000_000))
+
+        assert [len(batch) for batch in batches] == [2, 2, 1]
+
+    def test_splits_on_estimated_bytes(self):
+        rows = [{"id": row_id, "name": "x" * 100} for row_id in range(4)]
+
+        batches = list(iter_batches(rows, max_rows=100, max_bytes=250))
+
+        assert [len(batch) for batch in batches] == [2, 2]
+
+
+class TestBuildMysqlUpsert:
+    def test_renders_on_duplicate_key_update(self, mock_fixture_data):
+        statement = build_mysql_upsert(FixtureDB, [mock_fixture_data])
+
+        sql = str(statement.compile(dialect=mysql.dialect()))
+
+        assert sql.startswith("INSERT INTO fixtures")
+        assert "ON DUPLICATE KEY UPDATE" in sql
+        assert "name = VALUES(name)" in sql
+        assert "id = VALUES(id)" not in sql
+
+
+class TestBulkUpsertRows:
+    def test_counts_created_and_updated_across_batches(self, db_session, mock_fixture_data):
+        repository = FixtureRepository(db_session)
+        repository.create(FixtureCreate(**mock_fixture_data))
+        base_id = mock_fixture_data["id"]
+        fixtures = [FixtureCreate(**{**mock_fixture_data, "id": base_id + offset}) for offset in range(3)]
+
+        with patch("app.repositories.upsert.settings") as mock_settings:
+            mock_settings.upsert_batch_size = 2
+            mock_settings.upsert_max_batch_bytes = 1_000_000
+            created, updated, unchanged = repository.bulk_upsert(fixtures)
+
+        assert (created, updated, unchanged) == (2, 0, 1)
+        assert len(repository.get_all()) == 3
+
+    def test_last_duplicate_in_request_wins(self, db_session, mock_fixture_data):
+        repository = FixtureRepository(db_session)
+        fixtures = [FixtureCreate(**mock_fixture_data), FixtureCreate(**{**mock_fixture_data, "name": "Renamed"})]
+
+        created, updated, unchanged = repository.bulk_upsert(fixtures)
+
+        assert (created, updated, unchanged) == (1, 0, 0)
+        assert repository.get_by_id(mock_fixture_data["id"]).name == "Renamed"
+
+
+class TestContentHash:
+    def test_ignores_key_order_and_existing_hash(self, mock_fixture_data):
+        reordered = dict(reversed(list(mock_fixture_data.items())))
+
+        assert compute_content_hash(mock_fixture_data) == compute_content_hash(
+            {**reordered, "content_hash": "stale"}
+        )
+
+    def test_changes_when_content_changes(self, mock_fixture_data):
+        assert compute_content_hash(mock_fixture_data) != compute_content_hash({**mock_fixture_data, "state_id": 1})
+
+    def test_bulk_upsert_skips_unchanged_rows(self, db_session, mock_fixture_data):
+        repository = FixtureRepository(db_session)
+        changed = {**mock_fixture_data, "id": mock_fixture_data["id"] + 1}
+        repository.bulk_upsert([FixtureCreate(**mock_fixture_data), FixtureCreate(**changed)])
+        changed["result_info"] = "Home team won"
+
+        created, updated, unchanged = repository.bulk_upsert(
+            [FixtureCreate(**mock_fixture_data), FixtureCreate(**changed)]
+        )
+
+        assert (created, updated, unchanged) == (0, 1, 1)
+        assert repository.get_by_id(changed["id"]).result_info == "Home team won"
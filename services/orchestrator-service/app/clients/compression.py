@@ -0,0 +1,22 @@
+import gzip
+import json
+
+import zstandard
+
+from app.config import settings
+
+
+def encode_json(payload) -> tuple[bytes, dict[str, str]]:
+    # Same compact encoding httpx uses for json=, so identity bodies are unchanged on the wire.
+    body = json.dumps(payload, ensure_ascii=False, separators=(",", ":"), allow_nan=False).encode()
+    headers = {"Content-Type": "application/json"}
+    encoding = settings.database_request_encoding
+    if encoding == "identity" or len(body) < settings.request_compression_minimum_size:
+        return body, headers
+
+    if encoding == "zstd":
+        body = zstandard.ZstdCompressor(level=settings.zstd_level).compress(body)
+    else:
+        body = gzip.compress(body, compresslevel=settings.gzip_level)
+    headers["Content-Encoding"] = encoding
+    return body, headers
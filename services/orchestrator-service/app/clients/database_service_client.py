@@ -1,9 +1,13 @@
+import asyncio
 import time
 
 import httpx
 import structlog
 
+from app.clients.compression import encode_json
+from app.clients.http_client import create_http_client, get_pool_stats
 from app.config import settings
+from app.metrics import upstream_hooks
 
 logger = structlog.get_logger()
 
@@ -11,82 +15,127 @@ logger = structlog.get_logger()
 class DatabaseServiceClient:
     def __init__(self):
         self.base_url = settings.database_service_url
-        self.timeout = httpx.Timeout(timeout=90.0)
+        self._client: httpx.AsyncClient | None = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        return self.open()
+
+    def open(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = create_http_client(event_hooks=upstream_hooks("database-service"))
+        return self._client
+
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def pool_stats(self) -> dict:
+        return get_pool_stats(self._client)
 
     async def bulk_upsert_leagues(self, leagues: list[dict]) -> dict:
         logger.info("database_request_started", entity="leagues", operation="bulk_upsert", records=len(leagues))
         start = time.perf_counter()
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.post(f"{self.base_url}/leagues/bulk", json=leagues)
-            response.raise_for_status()
-            data = response.json()
+        response = await self._post_json("leagues/bulk", leagues)
+        response.raise_for_status()
+        data = response.json()
+        data["payload_bytes"] = len(response.request.content)
 
         duration_ms = int((time.perf_counter() - start) * 1000)
-        logger.info("database_request_completed", entity="leagues", operation="bulk_upsert", duration_ms=duration_ms)
+        logger.info(
+            "database_request_completed",
+            entity="leagues",
+            operation="bulk_upsert",
+            payload_bytes=data["payload_bytes"],
+            duration_ms=duration_ms,
+        )
         return data
 
     async def get_leagues(self) -> list[dict]:
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.get(f"{self.base_url}/leagues")
-            response.raise_for_status()
-            return response.json()
+        return await self._get_all_pages("leagues")
 
     async def get_league(self, league_id: int) -> dict:
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.get(f"{self.base_url}/leagues/{league_id}")
-            response.raise_for_status()
-            return response.json()
+        response = await self.client.get(f"{self.base_url}/leagues/{league_id}")
+        response.raise_for_status()
+        return response.json()
 
     async def bulk_upsert_teams(self, teams: list[dict]) -> dict:
         logger.info("database_request_started", entity="teams", operation="bulk_upsert", records=len(teams))
         start = time.perf_counter()
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.post(f"{self.base_url}/teams/bulk", json=teams)
-            response.raise_for_status()
-            data = response.json()
+        response = await self._post_json("teams/bulk", teams)
+        response.raise_for_status()
+        data = response.json()
+        data["payload_bytes"] = len(response.request.content)
 
         duration_ms = int((time.perf_counter() - start) * 1000)
-        logger.info("database_request_completed", entity="teams", operation="bulk_upsert", duration_ms=duration_ms)
+        logger.info(
+            "database_request_completed",
+            entity="teams",
+            operation="bulk_upsert",
+            payload_bytes=data["payload_bytes"],
+            duration_ms=duration_ms,
+        )
         return data
 
     async def get_teams(self) -> list[dict]:
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.get(f"{self.base_url}/teams")
-            response.raise_for_status()
-            return response.json()
+        return await self._get_all_pages("teams")
 
     async def get_team(self, team_id: int) -> dict:
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.get(f"{self.base_url}/teams/{team_id}")
-            response.raise_for_status()
-            return response.json()
+        response = await self.client.get(f"{self.base_url}/teams/{team_id}")
+        response.raise_for_status()
+        return response.json()
 
     async def bulk_upsert_fixtures(self, fixtures: list[dict]) -> dict:
         logger.info("database_request_started", entity="fixtures", operation="bulk_upsert", records=len(fixtures))
         start = time.perf_counter()
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.post(f"{self.base_url}/fixtures/bulk", json=fixtures)
-            response.raise_for_status()
-            data = response.json()
+        response = await self._post_json("fixtures/bulk", fixtures)
+        response.raise_for_status()
+        data = response.json()
+        data["payload_bytes"] = len(response.request.content)
 
         duration_ms = int((time.perf_counter() - start) * 1000)
-        logger.info("database_request_completed", entity="fixtures", operation="bulk_upsert", duration_ms=duration_ms)
+        logger.info(
+            "database_request_completed",
+            entity="fixtures",
+            operation="bulk_upsert",
+            payload_bytes=data["payload_bytes"],
+            duration_ms=duration_ms,
+        )
         return data
 
     async def get_fixtures(self) -> list[dict]:
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.get(f"{self.base_url}/fixtures")
-            response.raise_for_status()
-            return response.json()
+        return await self._get_all_pages("fixtures")
 
     async def get_fixture(self, fixture_id: int) -> dict:
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.get(f"{self.base_url}/fixtures/{fixture_id}")
+        response = await self.client.get(f"{self.base_url}/fixtures/{fixture_id}")
+        response.raise_for_status()
+        return response.json()
+
+    async def get_fixtures_starting_between(self, start_timestamp: int, end_timestamp: int) -> list[dict]:
+        return await self._get_all_pages(
+            "fixtures", {"starting_at_from": start_timestamp, "starting_at_to": end_timestamp}
+        )
+
+    async def _post_json(self, path: str, payload: list[dict]) -> httpx.Response:
+        # Encoding a full sync's payload is CPU-bound and slow enough to stall the event loop.
+        content, headers = await asyncio.to_thread(encode_json, payload)
+        return await self.client.post(f"{self.base_url}/{path}", content=content, headers=headers)
+
+    async def _get_all_pages(self, entity: str, filters: dict | None = None) -> list[dict]:
+        records = []
+        params = {"limit": settings.database_page_size, **(filters or {})}
+        while True:
+            response = await self.client.get(f"{self.base_url}/{entity}", params=params)
             response.raise_for_status()
-            return response.json()
+            page = response.json()
+            records.extend(page["data"])
+            if page["next_cursor"] is None:
+                return records
+            params["after_id"] = page["next_cursor"]
 
 
 database_service_client = DatabaseServiceClient()
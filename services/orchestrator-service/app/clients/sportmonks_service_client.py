@@ -1,74 +1,128 @@
+import json
 import time
+from collections.abc import AsyncIterator
+from datetime import date, datetime
 
 import httpx
 import structlog
 
+from app.clients.http_client import create_http_client, get_pool_stats
 from app.config import settings
+from app.metrics import upstream_hooks
 
 logger = structlog.get_logger()
 
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
 
 class SportMonksServiceClient:
     def __init__(self):
         self.base_url = settings.sportmonks_service_url
-        self.timeout = httpx.Timeout(timeout=90.0)
+        self._client: httpx.AsyncClient | None = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        return self.open()
+
+    def open(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = create_http_client(event_hooks=upstream_hooks("sportmonks-service"))
+        return self._client
+
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def pool_stats(self) -> dict:
+        return get_pool_stats(self._client)
 
     async def get_leagues(self) -> list[dict]:
         logger.info("sportmonks_request_started", entity="leagues")
         start = time.perf_counter()
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.get(f"{self.base_url}/leagues")
-            response.raise_for_status()
-            data = response.json()
+        response = await self.client.get(f"{self.base_url}/leagues")
+        response.raise_for_status()
+        data = response.json()
 
         duration_ms = int((time.perf_counter() - start) * 1000)
         logger.info("sportmonks_request_completed", entity="leagues", records=len(data), duration_ms=duration_ms)
         return data
 
     async def get_league(self, league_id: int) -> dict:
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.get(f"{self.base_url}/leagues/{league_id}")
-            response.raise_for_status()
-            return response.json()
+        response = await self.client.get(f"{self.base_url}/leagues/{league_id}")
+        response.raise_for_status()
+        return response.json()
 
     async def get_teams(self) -> list[dict]:
         logger.info("sportmonks_request_started", entity="teams")
         start = time.perf_counter()
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.get(f"{self.base_url}/teams")
-            response.raise_for_status()
-            data = response.json()
+        response = await self.client.get(f"{self.base_url}/teams")
+        response.raise_for_status()
+        data = response.json()
 
         duration_ms = int((time.perf_counter() - start) * 1000)
         logger.info("sportmonks_request_completed", entity="teams", records=len(data), duration_ms=duration_ms)
         return data
 
     async def get_team(self, team_id: int) -> dict:
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.get(f"{self.base_url}/teams/{team_id}")
-            response.raise_for_status()
-            return response.json()
+        response = await self.client.get(f"{self.base_url}/teams/{team_id}")
+        response.raise_for_status()
+        return response.json()
 
     async def get_fixtures(self) -> list[dict]:
         logger.info("sportmonks_request_started", entity="fixtures")
         start = time.perf_counter()
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.get(f"{self.base_url}/fixtures")
+        response = await self.client.get(f"{self.base_url}/fixtures")
+        response.raise_for_status()
+        data = response.json()
+
+        duration_ms = int((time.perf_counter() - start) * 1000)
+        logger.info("sportmonks_request_completed", entity="fixtures", records=len(data), duration_ms=duration_ms)
+        return data
+
+    async def stream_fixtures(self) -> AsyncIterator[dict]:
+        logger.info("sportmonks_stream_started", entity="fixtures")
+        start = time.perf_counter()
+        records = 0
+
+        async with self.client.stream(
+            "GET", f"{self.base_url}/fixtures", headers={"Accept": NDJSON_MEDIA_TYPE}
+        ) as response:
             response.raise_for_status()
-            data = response.json()
+            async for line in response.aiter_lines():
+                if line:
+                    records += 1
+                    yield json.loads(line)
+
+        duration_ms = int((time.perf_counter() - start) * 1000)
+        logger.info("sportmonks_stream_completed", entity="fixtures", records=records, duration_ms=duration_ms)
+
+    async def get_updated_fixtures(self, since: datetime) -> list[dict]:
+        logger.info("sportmonks_request_started", entity="fixtures", since=since.isoformat())
+        start = time.perf_counter()
+
+        response = await self.client.get(f"{self.base_url}/fixtures/updated", params={"since": since.isoformat()})
+        response.raise_for_status()
+        data = response.json()
 
         duration_ms = int((time.perf_counter() - start) * 1000)
         logger.info("sportmonks_request_completed", entity="fixtures", records=len(data), duration_ms=duration_ms)
         return data
 
+    async def get_fixtures_between(self, start_date: date, end_date: date) -> list[dict]:
+        response = await self.client.get(
+            f"{self.base_url}/fixtures/between/{start_date.isoformat()}/{end_date.isoformat()}"
+        )
+        response.raise_for_status()
+        return response.json()
+
     async def get_fixture(self, fixture_id: int) -> dict:
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.get(f"{self.base_url}/fixtures/{fixture_id}")
-            response.raise_for_status()
-            return response.json()
+        response = await self.client.get(f"{self.base_url}/fixtures/{fixture_id}")
+        response.raise_for_status()
+        return response.json()
 
 
 sportmonks_service_client = SportMonksServiceClient()
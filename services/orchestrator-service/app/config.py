@@ -1,4 +1,5 @@
 from pathlib import Path
+from typing import Literal
 
 from pydantic import Field
 from pydantic_settings import BaseSettings
@@ -9,6 +10,37 @@ ENV_FILE = Path(__file__).resolve().parent.parent.parent.parent / ".env"
 class Settings(BaseSettings):
     sportmonks_service_url: str = Field(default="http://127.0.0.1:8000")
     database_service_url: str = Field(default="http://127.0.0.1:8001")
+    http_timeout: float = Field(default=90.0)
+    http_max_connections: int = Field(default=20)
+    http_max_keepalive_connections: int = Field(default=10)
+    http_keepalive_expiry: float = Field(default=30.0)
+    http2: bool = Field(default=False)
+    database_page_size: int = Field(default=1000, ge=1)
+    # An older database-service cannot read compressed bodies, so only switch this once every replica is upgraded.
+    database_request_encoding: Literal["identity", "gzip", "zstd"] = Field(default="identity")
+    request_compression_minimum_size: int = Field(default=1024, ge=0)
+    gzip_level: int = Field(default=6, ge=1, le=9)
+    zstd_level: int = Field(default=3, ge=1, le=22)
+    sync_chunk_size: int = Field(default=1000, ge=1)
+    sync_queue_size: int = Field(default=4, ge=1)
+    sync_writers: int = Field(default=2, ge=1)
+    state_dir: str = Field(default=".state")
+    backfill_window_days: int = Field(default=7, ge=1)
+    backfill_concurrency: int = Field(default=4, ge=1)
+    sync_history_size: int = Field(default=200, ge=1)
+    max_concurrent_jobs: int = Field(default=2, ge=1)
+    job_history_size: int = Field(default=100, ge=1)
+    scheduler_enabled: bool = Field(default=False)
+    scheduler_jitter_ratio: float = Field(default=0.1, ge=0, lt=1)
+    league_sync_interval_seconds: float = Field(default=86400, gt=0)
+    team_sync_interval_seconds: float = Field(default=86400, gt=0)
+    fixture_sync_interval_seconds: float = Field(default=900, gt=0)
+    fixture_live_interval_seconds: float = Field(default=60, gt=0)
+    fixture_idle_interval_seconds: float = Field(default=6 * 3600, gt=0)
+    fixture_soon_seconds: float = Field(default=3600, ge=0)
+    fixture_live_window_seconds: float = Field(default=3 * 3600, gt=0)
+    fixture_live_state_ids: list[int] = Field(default=[2, 3, 4, 6, 9, 21, 22, 25])
+    fixture_ended_state_ids: list[int] = Field(default=[5, 7, 8, 10, 12, 14, 15, 17, 20])
 
     model_config = {
         "env_file": ENV_FILE if ENV_FILE.exists() else None,
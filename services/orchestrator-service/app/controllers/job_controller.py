@@ -0,0 +1,80 @@
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from fastapi import APIRouter, HTTPException, status
+from pydantic import BaseModel
+
+from app.models.job import JobStatus
+from app.models.sync import BackfillRequest, FixtureSyncMode
+from app.services.fixture_backfill_service import fixture_backfill_service
+from app.services.fixture_sync_service import fixture_sync_service
+from app.services.job_manager import JobConflictError, job_manager
+from app.services.league_sync_service import league_sync_service
+from app.services.sync_all_service import sync_all_service
+from app.services.sync_scheduler import sync_scheduler
+from app.services.team_sync_service import team_sync_service
+
+router = APIRouter(prefix="/jobs", tags=["jobs"])
+
+
+def submit(kind: str, run: Callable[[], Awaitable[BaseModel]], params: dict[str, Any] | None = None) -> JobStatus:
+    try:
+        job, attached = job_manager.submit(kind, run, params)
+    except JobConflictError as exc:
+        raise HTTPException(status_code=409, detail=str(exc)) from exc
+    return job.status(attached)
+
+
+@router.post("/sync/leagues", response_model=JobStatus, status_code=status.HTTP_202_ACCEPTED)
+async def submit_league_sync() -> JobStatus:
+    return submit("leagues", league_sync_service.sync_leagues)
+
+
+@router.post("/sync/teams", response_model=JobStatus, status_code=status.HTTP_202_ACCEPTED)
+async def submit_team_sync() -> JobStatus:
+    return submit("teams", team_sync_service.sync_teams)
+
+
+@router.post("/sync/fixtures", response_model=JobStatus, status_code=status.HTTP_202_ACCEPTED)
+async def submit_fixture_sync(mode: FixtureSyncMode = FixtureSyncMode.FULL) -> JobStatus:
+    return submit("fixtures", lambda: fixture_sync_service.sync_fixtures(mode), {"mode": mode})
+
+
+@router.post("/sync/fixtures/backfill", response_model=JobStatus, status_code=status.HTTP_202_ACCEPTED)
+async def submit_fixture_backfill(request: BackfillRequest) -> JobStatus:
+    return submit(
+        "fixtures:backfill",
+        lambda: fixture_backfill_service.backfill(request.start_date, request.end_date, request.window_days),
+        request.model_dump(mode="json"),
+    )
+
+
+@router.post("/sync/all", response_model=JobStatus, status_code=status.HTTP_202_ACCEPTED)
+async def submit_sync_all(fixture_mode: FixtureSyncMode = FixtureSyncMode.FULL) -> JobStatus:
+    return submit("all", lambda: sync_all_service.sync_all(fixture_mode), {"fixture_mode": fixture_mode})
+
+
+@router.get("", response_model=list[JobStatus])
+async def list_jobs() -> list[JobStatus]:
+    return [job.status() for job in job_manager.recent()]
+
+
+@router.get("/schedule")
+async def get_schedule() -> list[dict]:
+    return sync_scheduler.status()
+
+
+@router.get("/{job_id}", response_model=JobStatus)
+async def get_job(job_id: str) -> JobStatus:
+    job = job_manager.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    return job.status()
+
+
+@router.delete("/{job_id}", response_model=JobStatus, status_code=status.HTTP_202_ACCEPTED)
+async def cancel_job(job_id: str) -> JobStatus:
+    job = job_manager.cancel(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    return job.status()
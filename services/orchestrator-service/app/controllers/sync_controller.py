@@ -1,23 +1,72 @@
-from fastapi import APIRouter
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Any
 
-from app.models.sync import SyncResult
+from fastapi import APIRouter, HTTPException
+from pydantic import BaseModel
+
+from app.models.job import JobState
+from app.models.sync import (
+    BackfillRequest,
+    BackfillResult,
+    EntitySyncStats,
+    FixtureSyncMode,
+    SyncAllResult,
+    SyncResult,
+)
+from app.services.fixture_backfill_service import fixture_backfill_service
 from app.services.fixture_sync_service import fixture_sync_service
+from app.services.job_manager import JobConflictError, job_manager
 from app.services.league_sync_service import league_sync_service
+from app.services.sync_all_service import sync_all_service
 from app.services.team_sync_service import team_sync_service
+from app.stores.sync_history_store import sync_history_store
 
 router = APIRouter(prefix="/sync", tags=["sync"])
 
 
+async def run_job(kind: str, run: Callable[[], Awaitable[BaseModel]], params: dict[str, Any] | None = None) -> Any:
+    # Blocking form of /jobs/sync/*: the run still goes through the job manager, so it is
+    # de-duplicated against other jobs and keeps running if the caller disconnects.
+    try:
+        job, _ = job_manager.submit(kind, run, params)
+    except JobConflictError as exc:
+        raise HTTPException(status_code=409, detail=str(exc)) from exc
+    await asyncio.wait([job.task])
+    if job.state is not JobState.COMPLETED:
+        raise HTTPException(status_code=500, detail=f"Job {job.id} {job.state}: {job.error or 'no result'}")
+    return job.result
+
+
+@router.post("/all", response_model=SyncAllResult)
+async def sync_all(fixture_mode: FixtureSyncMode = FixtureSyncMode.FULL) -> SyncAllResult:
+    return await run_job("all", lambda: sync_all_service.sync_all(fixture_mode), {"fixture_mode": fixture_mode})
+
+
+@router.get("/stats", response_model=list[EntitySyncStats])
+async def sync_stats(mode: str | None = None) -> list[EntitySyncStats]:
+    return sync_history_store.stats(mode)
+
+
 @router.post("/leagues", response_model=SyncResult)
 async def sync_leagues() -> SyncResult:
-    return await league_sync_service.sync_leagues()
+    return await run_job("leagues", league_sync_service.sync_leagues)
 
 
 @router.post("/teams", response_model=SyncResult)
 async def sync_teams() -> SyncResult:
-    return await team_sync_service.sync_teams()
+    return await run_job("teams", team_sync_service.sync_teams)
 
 
 @router.post("/fixtures", response_model=SyncResult)
-async def sync_fixtures() -> SyncResult:
-    return await fixture_sync_service.sync_fixtures()
+async def sync_fixtures(mode: FixtureSyncMode = FixtureSyncMode.FULL) -> SyncResult:
+    return await run_job("fixtures", lambda: fixture_sync_service.sync_fixtures(mode), {"mode": mode})
+
+
+@router.post("/fixtures/backfill", response_model=BackfillResult)
+async def backfill_fixtures(request: BackfillRequest) -> BackfillResult:
+    return await run_job(
+        "fixtures:backfill",
+        lambda: fixture_backfill_service.backfill(request.start_date, request.end_date, request.window_days),
+        request.model_dump(mode="json"),
+    )
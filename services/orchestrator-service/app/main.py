@@ -1,19 +1,59 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 
-from app.controllers import sync_controller
+from app.clients.database_service_client import database_service_client
+from app.clients.sportmonks_service_client import sportmonks_service_client
+from app.config import settings
+from app.controllers import job_controller, sync_controller
 from app.logging import configure_logging
+from app.metrics import MetricsMiddleware, metrics_response, register_pool
+from app.services.job_manager import job_manager
+from app.services.sync_scheduler import sync_scheduler
 
 configure_logging()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    sportmonks_service_client.open()
+    database_service_client.open()
+    if settings.scheduler_enabled:
+        sync_scheduler.start()
+    yield
+    await sync_scheduler.stop()
+    await job_manager.shutdown()
+    await sportmonks_service_client.close()
+    await database_service_client.close()
+
+
 app = FastAPI(
     title="Orchestrator Service",
     description="Service for orchestrating data sync workflows",
     version="0.1.0",
+    lifespan=lifespan,
 )
+app.add_middleware(MetricsMiddleware)
+register_pool("sportmonks_service", sportmonks_service_client.pool_stats)
+register_pool("database_service", database_service_client.pool_stats)
 
 app.include_router(sync_controller.router)
+app.include_router(job_controller.router)
 
 
 @app.get("/health")
 async def health_check():
     return {"status": "healthy"}
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    return metrics_response()
+
+
+@app.get("/health/pool")
+async def pool_stats():
+    return {
+        "sportmonks_service": sportmonks_service_client.pool_stats(),
+        "database_service": database_service_client.pool_stats(),
+    }
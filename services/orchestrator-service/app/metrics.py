@@ -0,0 +1,108 @@
+import time
+from collections.abc import Callable
+
+import httpx
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, Counter, Gauge, Histogram, generate_latest
+from prometheus_client.core import GaugeMetricFamily
+from prometheus_client.registry import Collector
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.models.sync import SyncResult
+
+REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds", "Time spent handling HTTP requests.", ["method", "route", "status"]
+)
+REQUESTS_IN_FLIGHT = Gauge("http_requests_in_flight", "HTTP requests currently being handled.", ["method"])
+UPSTREAM_REQUEST_DURATION = Histogram(
+    "upstream_request_duration_seconds", "Time to response headers for calls to other services.", ["upstream", "status"]
+)
+SYNC_DURATION = Histogram(
+    "sync_duration_seconds",
+    "Time spent on completed syncs.",
+    ["entity", "mode"],
+    buckets=(0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600, 1800),
+)
+SYNCED_RECORDS = Counter("sync_records_total", "Records written by completed syncs.", ["entity", "outcome"])
+
+
+class MetricsMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        in_flight = REQUESTS_IN_FLIGHT.labels(method)
+        in_flight.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            in_flight.dec()
+            # Label by route template rather than raw path to keep cardinality bounded.
+            route = getattr(scope.get("route"), "path", "unmatched")
+            REQUEST_DURATION.labels(method, route, str(status_code)).observe(time.perf_counter() - start)
+
+
+def upstream_hooks(upstream: str) -> dict:
+    async def on_request(request: httpx.Request) -> None:
+        request.extensions["metrics_start"] = time.perf_counter()
+
+    async def on_response(response: httpx.Response) -> None:
+        start = response.request.extensions.get("metrics_start")
+        if start is not None:
+            UPSTREAM_REQUEST_DURATION.labels(upstream, str(response.status_code)).observe(time.perf_counter() - start)
+
+    return {"request": [on_request], "response": [on_response]}
+
+
+def observe_sync(result: SyncResult, mode: str) -> None:
+    SYNC_DURATION.labels(result.entity, mode).observe(result.total_ms / 1000)
+    SYNCED_RECORDS.labels(result.entity, "created").inc(result.created)
+    SYNCED_RECORDS.labels(result.entity, "updated").inc(result.updated)
+    SYNCED_RECORDS.labels(result.entity, "unchanged").inc(result.unchanged)
+
+
+class PoolCollector(Collector):
+    def __init__(self) -> None:
+        self.pools: dict[str, Callable[[], dict]] = {}
+
+    def collect(self):
+        connections = GaugeMetricFamily(
+            "http_client_pool_connections", "Connections held by the outbound HTTP pool.", labels=["pool", "state"]
+        )
+        requests = GaugeMetricFamily(
+            "http_client_pool_requests", "Requests using or queued on the outbound HTTP pool.", labels=["pool", "state"]
+        )
+        for name, stats_for in self.pools.items():
+            stats = stats_for()
+            connections.add_metric([name, "active"], stats["active_connections"])
+            connections.add_metric([name, "idle"], stats["idle_connections"])
+            requests.add_metric([name, "active"], stats["active_requests"])
+            requests.add_metric([name, "queued"], stats["queued_requests"])
+        yield connections
+        yield requests
+
+
+pool_collector = PoolCollector()
+REGISTRY.register(pool_collector)
+
+
+def register_pool(name: str, stats: Callable[[], dict]) -> None:
+    pool_collector.pools[name] = stats
+
+
+def metrics_response() -> Response:
+    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
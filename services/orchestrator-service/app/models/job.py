@@ -0,0 +1,32 @@
+from datetime import datetime
+from enum import StrEnum
+from typing import Any
+
+from pydantic import BaseModel
+
+
+class JobState(StrEnum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+class JobStatus(BaseModel):
+    id: str
+    kind: str
+    params: dict[str, Any]
+    state: JobState
+    phases: dict[str, str]
+    records_fetched: int
+    rows_written: int
+    rows_unchanged: int = 0
+    batches_written: int
+    rows_per_second: float
+    submitted_at: datetime
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    attached: bool = False
+    result: dict[str, Any] | None = None
+    error: str | None = None
@@ -1,8 +1,75 @@
-from pydantic import BaseModel
+from datetime import date, datetime
+from enum import StrEnum
+
+from pydantic import BaseModel, Field, model_validator
+
+
+class FixtureSyncMode(StrEnum):
+    FULL = "full"
+    PIPELINED = "pipelined"
+    INCREMENTAL = "incremental"
 
 
 class SyncResult(BaseModel):
     entity: str
     created: int
     updated: int
+    unchanged: int = 0
     status: str
+    records: int = 0
+    fetch_ms: int = 0
+    upsert_ms: int = 0
+    total_ms: int = 0
+    records_per_second: float = 0.0
+    payload_bytes: int = 0
+
+    def timed(self, fetch_ms: int, total_ms: int) -> "SyncResult":
+        records_per_second = round(self.records * 1000 / total_ms, 1) if total_ms else 0.0
+        return self.model_copy(
+            update={"fetch_ms": fetch_ms, "total_ms": total_ms, "records_per_second": records_per_second}
+        )
+
+
+class BackfillRequest(BaseModel):
+    start_date: date
+    end_date: date
+    window_days: int | None = Field(default=None, ge=1)
+
+    @model_validator(mode="after")
+    def check_range(self) -> "BackfillRequest":
+        if self.start_date > self.end_date:
+            raise ValueError("start_date must not be after end_date")
+        return self
+
+
+class BackfillResult(SyncResult):
+    windows: int
+    windows_skipped: int
+
+
+class EntitySyncResult(SyncResult):
+    depends_on: list[str]
+    wait_ms: int
+
+
+class SyncAllResult(BaseModel):
+    status: str
+    duration_ms: int
+    results: list[EntitySyncResult]
+
+
+class PhaseStats(BaseModel):
+    p50: float
+    p95: float
+    p99: float
+
+
+class EntitySyncStats(BaseModel):
+    entity: str
+    runs: int
+    last_run_at: datetime
+    total_ms: PhaseStats
+    fetch_ms: PhaseStats
+    upsert_ms: PhaseStats
+    records_per_second: PhaseStats
+    payload_bytes: PhaseStats
@@ -0,0 +1,148 @@
+import asyncio
+import time
+from datetime import date, timedelta
+
+import structlog
+
+from app.clients.database_service_client import database_service_client
+from app.clients.sportmonks_service_client import sportmonks_service_client
+from app.config import settings
+from app.metrics import observe_sync
+from app.models.sync import BackfillResult
+from app.services.job_manager import report_fetched, report_phase, report_written
+from app.stores.backfill_store import backfill_store
+from app.stores.sync_history_store import sync_history_store
+
+logger = structlog.get_logger()
+
+
+class FixtureBackfillService:
+    async def backfill(self, start_date: date, end_date: date, window_days: int | None = None) -> BackfillResult:
+        window_days = window_days or settings.backfill_window_days
+        backfill_id = f"fixtures:{start_date.isoformat()}:{end_date.isoformat()}:{window_days}"
+        windows = self._windows(start_date, end_date, window_days)
+        completed = backfill_store.completed_windows(backfill_id)
+        pending = [window for window in windows if self._window_id(*window) not in completed]
+
+        logger.info(
+            "backfill_started",
+            entity="fixtures",
+            start_date=start_date.isoformat(),
+            end_date=end_date.isoformat(),
+            windows=len(windows),
+            resumed=len(windows) - len(pending),
+            concurrency=settings.backfill_concurrency,
+        )
+        start = time.perf_counter()
+
+        queue: asyncio.Queue[tuple[date, date]] = asyncio.Queue()
+        for window in pending:
+            queue.put_nowait(window)
+        # fetch_ms and upsert_ms sum across concurrent windows, i.e. busy time rather than wall time.
+        totals = dict.fromkeys(
+            ("created", "updated", "unchanged", "records", "fetch_ms", "upsert_ms", "payload_bytes"), 0
+        )
+        windows_done = len(windows) - len(pending)
+        errors: list[Exception] = []
+
+        async def worker() -> None:
+            nonlocal windows_done
+            # Stop taking new windows after a failure but let in-flight ones finish,
+            # so everything already fetched is written and recorded for the resume.
+            while not errors and not queue.empty():
+                window_start, window_end = queue.get_nowait()
+                try:
+                    result = await self._backfill_window(window_start, window_end)
+                except Exception as exc:
+                    errors.append(exc)
+                    logger.error(
+                        "backfill_window_failed",
+                        entity="fixtures",
+                        window_start=window_start.isoformat(),
+                        window_end=window_end.isoformat(),
+                        error=str(exc),
+                    )
+                    return
+                for key in totals:
+                    totals[key] += result.get(key, 0)
+                backfill_store.mark_completed(backfill_id, self._window_id(window_start, window_end))
+                windows_done += 1
+                report_phase("fixtures", f"backfilled {windows_done}/{len(windows)} windows")
+
+        async with asyncio.TaskGroup() as group:
+            for _ in range(min(settings.backfill_concurrency, len(pending))):
+                group.create_task(worker())
+
+        total_duration_ms = int((time.perf_counter() - start) * 1000)
+        if errors:
+            logger.error(
+                "backfill_failed",
+                entity="fixtures",
+                windows_remaining=len(windows) - len(backfill_store.completed_windows(backfill_id)),
+                duration_ms=total_duration_ms,
+            )
+            raise errors[0]
+
+        backfill_store.clear(backfill_id)
+        result = BackfillResult(
+            entity="fixtures",
+            status="completed",
+            windows=len(windows),
+            windows_skipped=len(windows) - len(pending),
+            **totals,
+        ).timed(totals["fetch_ms"], total_duration_ms)
+        observe_sync(result, "backfill")
+        sync_history_store.append(result, "backfill")
+        logger.info(
+            "backfill_completed",
+            entity="fixtures",
+            **totals,
+            records_per_second=result.records_per_second,
+            duration_ms=total_duration_ms,
+        )
+        return result
+
+    async def _backfill_window(self, window_start: date, window_end: date) -> dict:
+        start = time.perf_counter()
+        fixtures = await sportmonks_service_client.get_fixtures_between(window_start, window_end)
+        fetched = time.perf_counter()
+        report_fetched(len(fixtures))
+        if fixtures:
+            result = await database_service_client.bulk_upsert_fixtures(fixtures)
+            report_written(result)
+        else:
+            result = {"created": 0, "updated": 0, "unchanged": 0}
+
+        done = time.perf_counter()
+        result = {
+            **result,
+            "records": len(fixtures),
+            "fetch_ms": int((fetched - start) * 1000),
+            "upsert_ms": int((done - fetched) * 1000),
+        }
+        duration_ms = int((done - start) * 1000)
+        logger.info(
+            "backfill_window_completed",
+            entity="fixtures",
+            window_start=window_start.isoformat(),
+            window_end=window_end.isoformat(),
+            records=len(fixtures),
+            duration_ms=duration_ms,
+        )
+        return result
+
+    @staticmethod
+    def _windows(start_date: date, end_date: date, window_days: int) -> list[tuple[date, date]]:
+        windows = []
+        while start_date <= end_date:
+            window_end = min(start_date + timedelta(days=window_days - 1), end_date)
+            windows.append((start_date, window_end))
+            start_date = window_end + timedelta(days=1)
+        return windows
+
+    @staticmethod
+    def _window_id(window_start: date, window_end: date) -> str:
+        return f"{window_start.isoformat()}/{window_end.isoformat()}"
+
+
+fixture_backfill_service = FixtureBackfillService()
@@ -1,54 +1,198 @@
 import time
+from datetime import UTC, datetime
 
 import structlog
 
 from app.clients.database_service_client import database_service_client
 from app.clients.sportmonks_service_client import sportmonks_service_client
-from app.models.sync import SyncResult
+from app.config import settings
+from app.metrics import observe_sync
+from app.models.sync import FixtureSyncMode, SyncResult
+from app.services.job_manager import report_fetched, report_phase, report_written
+from app.services.pipeline import run_pipeline
+from app.stores.sync_history_store import sync_history_store
+from app.stores.watermark_store import watermark_store
 
 logger = structlog.get_logger()
 
 
 class FixtureSyncService:
-    async def sync_fixtures(self) -> SyncResult:
+    async def sync_fixtures(self, mode: FixtureSyncMode = FixtureSyncMode.FULL) -> SyncResult:
+        # Taken before fetching so that changes landing mid-sync are picked up next run.
+        started_at = datetime.now(UTC)
+        since = self.watermark_for(mode)
+
+        if since is not None:
+            result = await self._sync_fixtures_incremental(since)
+        elif mode == FixtureSyncMode.PIPELINED:
+            result = await self._sync_fixtures_pipelined()
+        else:
+            result = await self._sync_fixtures_full()
+
+        watermark_store.set("fixtures", started_at)
+        return result
+
+    def watermark_for(self, mode: FixtureSyncMode) -> datetime | None:
+        if mode != FixtureSyncMode.INCREMENTAL:
+            return None
+        since = watermark_store.get("fixtures")
+        if since is None:
+            logger.info("sync_watermark_missing", entity="fixtures", fallback=FixtureSyncMode.FULL)
+        return since
+
+    async def _sync_fixtures_full(self) -> SyncResult:
         logger.info("sync_started", entity="fixtures")
         start = time.perf_counter()
 
+        fixtures = await self.fetch_fixtures()
+        fetch_ms = int((time.perf_counter() - start) * 1000)
+        result = await self.store_fixtures(fixtures)
+        result = result.timed(fetch_ms, int((time.perf_counter() - start) * 1000))
+
+        observe_sync(result, FixtureSyncMode.FULL)
+        sync_history_store.append(result, FixtureSyncMode.FULL)
+        logger.info(
+            "sync_completed",
+            entity="fixtures",
+            created=result.created,
+            updated=result.updated,
+            unchanged=result.unchanged,
+            fetch_ms=result.fetch_ms,
+            upsert_ms=result.upsert_ms,
+            records_per_second=result.records_per_second,
+            payload_bytes=result.payload_bytes,
+            duration_ms=result.total_ms,
+        )
+        return result
+
+    async def _sync_fixtures_incremental(self, since: datetime) -> SyncResult:
+        logger.info("sync_started", entity="fixtures", mode=FixtureSyncMode.INCREMENTAL, since=since.isoformat())
+        start = time.perf_counter()
+
+        fixtures = await self.fetch_fixtures(since)
+        fetch_ms = int((time.perf_counter() - start) * 1000)
+        result = await self.store_fixtures(fixtures)
+        result = result.timed(fetch_ms, int((time.perf_counter() - start) * 1000))
+
+        observe_sync(result, FixtureSyncMode.INCREMENTAL)
+        sync_history_store.append(result, FixtureSyncMode.INCREMENTAL)
+        logger.info(
+            "sync_completed",
+            entity="fixtures",
+            mode=FixtureSyncMode.INCREMENTAL,
+            records=len(fixtures),
+            created=result.created,
+            updated=result.updated,
+            unchanged=result.unchanged,
+            fetch_ms=result.fetch_ms,
+            upsert_ms=result.upsert_ms,
+            records_per_second=result.records_per_second,
+            payload_bytes=result.payload_bytes,
+            duration_ms=result.total_ms,
+        )
+        return result
+
+    async def fetch_fixtures(self, since: datetime | None = None) -> list[dict]:
+        report_phase("fixtures", "fetching")
+        if since is not None:
+            fixtures = await sportmonks_service_client.get_updated_fixtures(since)
+            report_fetched(len(fixtures))
+            return fixtures
+
         logger.info("sportmonks_fetch_started", entity="fixtures")
         fetch_start = time.perf_counter()
         fixtures = await sportmonks_service_client.get_fixtures()
         fetch_duration_ms = int((time.perf_counter() - fetch_start) * 1000)
+        report_fetched(len(fixtures))
         logger.info(
             "sportmonks_fetch_completed", entity="fixtures", records=len(fixtures), duration_ms=fetch_duration_ms
         )
+        return fixtures
+
+    async def store_fixtures(self, fixtures: list[dict]) -> SyncResult:
+        if not fixtures:
+            report_phase("fixtures", "done")
+            return SyncResult(entity="fixtures", created=0, updated=0, unchanged=0, status="completed")
 
+        report_phase("fixtures", "writing")
         logger.info("database_upsert_started", entity="fixtures", records=len(fixtures))
         upsert_start = time.perf_counter()
         result = await database_service_client.bulk_upsert_fixtures(fixtures)
         upsert_duration_ms = int((time.perf_counter() - upsert_start) * 1000)
+        report_written(result)
+        report_phase("fixtures", "done")
         logger.info(
             "database_upsert_completed",
             entity="fixtures",
             created=result["created"],
             updated=result["updated"],
+            unchanged=result.get("unchanged", 0),
             duration_ms=upsert_duration_ms,
         )
 
-        total_duration_ms = int((time.perf_counter() - start) * 1000)
-        logger.info(
-            "sync_completed",
+        return SyncResult(
             entity="fixtures",
             created=result["created"],
             updated=result["updated"],
-            duration_ms=total_duration_ms,
+            unchanged=result.get("unchanged", 0),
+            status="completed",
+            records=len(fixtures),
+            upsert_ms=upsert_duration_ms,
+            payload_bytes=result.get("payload_bytes", 0),
         )
 
-        return SyncResult(
+    async def _sync_fixtures_pipelined(self) -> SyncResult:
+        logger.info(
+            "sync_started",
             entity="fixtures",
-            created=result["created"],
-            updated=result["updated"],
+            mode=FixtureSyncMode.PIPELINED,
+            chunk_size=settings.sync_chunk_size,
+            writers=settings.sync_writers,
+        )
+        start = time.perf_counter()
+        report_phase("fixtures", "streaming")
+
+        result = await run_pipeline(
+            entity="fixtures",
+            records=sportmonks_service_client.stream_fixtures(),
+            write=database_service_client.bulk_upsert_fixtures,
+            chunk_size=settings.sync_chunk_size,
+            queue_size=settings.sync_queue_size,
+            writers=settings.sync_writers,
+        )
+
+        report_phase("fixtures", "done")
+        # Fetching and writing overlap here: fetch_ms is the stream's wall time and
+        # upsert_ms the writers' combined busy time.
+        sync_result = SyncResult(
+            entity="fixtures",
+            created=result.created,
+            updated=result.updated,
+            unchanged=result.unchanged,
             status="completed",
+            records=result.records,
+            upsert_ms=result.upsert_ms,
+            payload_bytes=result.payload_bytes,
+        ).timed(result.fetch_ms, int((time.perf_counter() - start) * 1000))
+
+        observe_sync(sync_result, FixtureSyncMode.PIPELINED)
+        sync_history_store.append(sync_result, FixtureSyncMode.PIPELINED)
+        logger.info(
+            "sync_completed",
+            entity="fixtures",
+            mode=FixtureSyncMode.PIPELINED,
+            records=result.records,
+            chunks=result.chunks,
+            created=result.created,
+            updated=result.updated,
+            unchanged=result.unchanged,
+            fetch_ms=sync_result.fetch_ms,
+            upsert_ms=sync_result.upsert_ms,
+            records_per_second=sync_result.records_per_second,
+            payload_bytes=sync_result.payload_bytes,
+            duration_ms=sync_result.total_ms,
         )
+        return sync_result
 
 
 fixture_sync_service = FixtureSyncService()
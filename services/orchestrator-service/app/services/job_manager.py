@@ -0,0 +1,193 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any
+from uuid import uuid4
+
+import structlog
+from pydantic import BaseModel
+
+from app.config import settings
+from app.models.job import JobState, JobStatus
+
+logger = structlog.get_logger()
+
+_current_job: ContextVar["Job | None"] = ContextVar("current_job", default=None)
+
+# Kinds that write more than the entity they are named after.
+ENTITIES_BY_KIND = {
+    "all": ("leagues", "teams", "fixtures"),
+    "fixtures:backfill": ("fixtures",),
+}
+
+
+@dataclass
+class Job:
+    id: str
+    kind: str
+    params: dict[str, Any]
+    entities: frozenset[str] = frozenset()
+    submitted_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    state: JobState = JobState.QUEUED
+    phases: dict[str, str] = field(default_factory=dict)
+    records_fetched: int = 0
+    rows_written: int = 0
+    rows_unchanged: int = 0
+    batches_written: int = 0
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    result: BaseModel | None = None
+    error: str | None = None
+    task: asyncio.Task | None = field(default=None, repr=False)
+
+    @property
+    def finished(self) -> bool:
+        return self.state in (JobState.COMPLETED, JobState.FAILED, JobState.CANCELLED)
+
+    def status(self, attached: bool = False) -> JobStatus:
+        elapsed = 0.0
+        if self.started_at is not None:
+            elapsed = ((self.finished_at or datetime.now(UTC)) - self.started_at).total_seconds()
+        return JobStatus(
+            id=self.id,
+            kind=self.kind,
+            params=self.params,
+            state=self.state,
+            phases=dict(self.phases),
+            records_fetched=self.records_fetched,
+            rows_written=self.rows_written,
+            rows_unchanged=self.rows_unchanged,
+            batches_written=self.batches_written,
+            rows_per_second=round(self.rows_written / elapsed, 1) if elapsed > 0 else 0.0,
+            submitted_at=self.submitted_at,
+            started_at=self.started_at,
+            finished_at=self.finished_at,
+            attached=attached,
+            result=self.result.model_dump(mode="json") if self.result is not None else None,
+            error=self.error,
+        )
+
+
+class JobConflictError(Exception):
+    def __init__(self, job: Job):
+        self.job = job
+        super().__init__(
+            f"Job {job.id} ({job.kind}) is already syncing {', '.join(sorted(job.entities))} with different parameters"
+        )
+
+
+def report_phase(entity: str, phase: str) -> None:
+    job = _current_job.get()
+    if job is not None:
+        job.phases[entity] = phase
+
+
+def report_fetched(records: int) -> None:
+    job = _current_job.get()
+    if job is not None:
+        job.records_fetched += records
+
+
+def report_written(result: dict) -> None:
+    job = _current_job.get()
+    if job is not None:
+        job.rows_written += result["created"] + result["updated"]
+        job.rows_unchanged += result.get("unchanged", 0)
+        job.batches_written += 1
+
+
+class JobManager:
+    def __init__(self, max_concurrent: int, history_size: int):
+        self.max_concurrent = max_concurrent
+        self.history_size = history_size
+        self.jobs: dict[str, Job] = {}
+        self._active: dict[str, Job] = {}
+        self._slots: asyncio.Semaphore | None = None
+
+    @property
+    def slots(self) -> asyncio.Semaphore:
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_concurrent)
+        return self._slots
+
+    def submit(
+        self, kind: str, run: Callable[[], Awaitable[BaseModel]], params: dict[str, Any] | None = None
+    ) -> tuple[Job, bool]:
+        # A second identical submission attaches to the queued or running job. Anything else that
+        # would write the same entities at the same time is rejected.
+        params = params or {}
+        entities = frozenset(ENTITIES_BY_KIND.get(kind, (kind,)))
+        for active in self._active.values():
+            if not active.entities & entities:
+                continue
+            if active.kind == kind and active.params == params:
+                logger.info("job_attached", job_id=active.id, kind=kind)
+                return active, True
+            logger.info("job_conflict", job_id=active.id, kind=kind, active_kind=active.kind)
+            raise JobConflictError(active)
+
+        job = Job(id=uuid4().hex, kind=kind, params=params, entities=entities)
+        self.jobs[job.id] = job
+        self._active[job.id] = job
+        job.task = asyncio.create_task(self._run(job, run))
+        logger.info("job_submitted", job_id=job.id, kind=kind, params=job.params)
+        self._prune()
+        return job, False
+
+    def get(self, job_id: str) -> Job | None:
+        return self.jobs.get(job_id)
+
+    def recent(self) -> list[Job]:
+        return list(self.jobs.values())
+
+    def cancel(self, job_id: str) -> Job | None:
+        job = self.jobs.get(job_id)
+        if job is not None and not job.finished and job.task is not None:
+            job.task.cancel()
+            logger.info("job_cancel_requested", job_id=job.id, kind=job.kind)
+        return job
+
+    async def shutdown(self) -> None:
+        tasks = [job.task for job in self._active.values() if job.task is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _run(self, job: Job, run: Callable[[], Awaitable[BaseModel]]) -> None:
+        _current_job.set(job)
+        try:
+            async with self.slots:
+                job.state = JobState.RUNNING
+                job.started_at = datetime.now(UTC)
+                logger.info("job_started", job_id=job.id, kind=job.kind)
+                job.result = await run()
+            job.state = JobState.COMPLETED
+        except asyncio.CancelledError:
+            job.state = JobState.CANCELLED
+        except Exception as exc:
+            job.state = JobState.FAILED
+            job.error = str(exc) or type(exc).__name__
+        finally:
+            job.finished_at = datetime.now(UTC)
+            self._active.pop(job.id, None)
+            status = job.status()
+            logger.info(
+                "job_finished",
+                job_id=job.id,
+                kind=job.kind,
+                state=job.state,
+                rows_written=status.rows_written,
+                rows_unchanged=status.rows_unchanged,
+                rows_per_second=status.rows_per_second,
+                error=job.error,
+            )
+
+    def _prune(self) -> None:
+        finished = [job_id for job_id, job in self.jobs.items() if job.finished]
+        for job_id in finished[: max(len(self.jobs) - self.history_size, 0)]:
+            del self.jobs[job_id]
+
+
+job_manager = JobManager(settings.max_concurrent_jobs, settings.job_history_size)
@@ -4,7 +4,10 @@ import structlog
 
 from app.clients.database_service_client import database_service_client
 from app.clients.sportmonks_service_client import sportmonks_service_client
+from app.metrics import observe_sync
 from app.models.sync import SyncResult
+from app.services.job_manager import report_fetched, report_phase, report_written
+from app.stores.sync_history_store import sync_history_store
 
 logger = structlog.get_logger()
 
@@ -14,38 +17,63 @@ class LeagueSyncService:
         logger.info("sync_started", entity="leagues")
         start = time.perf_counter()
 
+        leagues = await self.fetch_leagues()
+        fetch_ms = int((time.perf_counter() - start) * 1000)
+        result = await self.store_leagues(leagues)
+        result = result.timed(fetch_ms, int((time.perf_counter() - start) * 1000))
+
+        observe_sync(result, "full")
+        sync_history_store.append(result, "full")
+        logger.info(
+            "sync_completed",
+            entity="leagues",
+            created=result.created,
+            updated=result.updated,
+            unchanged=result.unchanged,
+            fetch_ms=result.fetch_ms,
+            upsert_ms=result.upsert_ms,
+            records_per_second=result.records_per_second,
+            payload_bytes=result.payload_bytes,
+            duration_ms=result.total_ms,
+        )
+        return result
+
+    async def fetch_leagues(self) -> list[dict]:
+        report_phase("leagues", "fetching")
         logger.info("sportmonks_fetch_started", entity="leagues")
         fetch_start = time.perf_counter()
         leagues = await sportmonks_service_client.get_leagues()
         fetch_duration_ms = int((time.perf_counter() - fetch_start) * 1000)
+        report_fetched(len(leagues))
         logger.info("sportmonks_fetch_completed", entity="leagues", records=len(leagues), duration_ms=fetch_duration_ms)
+        return leagues
 
+    async def store_leagues(self, leagues: list[dict]) -> SyncResult:
+        report_phase("leagues", "writing")
         logger.info("database_upsert_started", entity="leagues", records=len(leagues))
         upsert_start = time.perf_counter()
         result = await database_service_client.bulk_upsert_leagues(leagues)
         upsert_duration_ms = int((time.perf_counter() - upsert_start) * 1000)
+        report_written(result)
+        report_phase("leagues", "done")
         logger.info(
             "database_upsert_completed",
             entity="leagues",
             created=result["created"],
             updated=result["updated"],
+            unchanged=result.get("unchanged", 0),
             duration_ms=upsert_duration_ms,
         )
 
-        total_duration_ms = int((time.perf_counter() - start) * 1000)
-        logger.info(
-            "sync_completed",
-            entity="leagues",
-            created=result["created"],
-            updated=result["updated"],
-            duration_ms=total_duration_ms,
-        )
-
         return SyncResult(
             entity="leagues",
             created=result["created"],
             updated=result["updated"],
+            unchanged=result.get("unchanged", 0),
             status="completed",
+            records=len(leagues),
+            upsert_ms=upsert_duration_ms,
+            payload_bytes=result.get("payload_bytes", 0),
         )
 
 
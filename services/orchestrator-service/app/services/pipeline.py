@@ -0,0 +1,88 @@
+import asyncio
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import aclosing
+from dataclasses import dataclass
+
+import structlog
+
+from app.services.job_manager import report_fetched, report_written
+
+logger = structlog.get_logger()
+
+_DONE = object()
+
+
+@dataclass
+class PipelineResult:
+    records: int = 0
+    chunks: int = 0
+    created: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    fetch_ms: int = 0
+    upsert_ms: int = 0
+    payload_bytes: int = 0
+
+
+async def run_pipeline(
+    entity: str,
+    records: AsyncIterator[dict],
+    write: Callable[[list[dict]], Awaitable[dict]],
+    chunk_size: int,
+    queue_size: int,
+    writers: int,
+) -> PipelineResult:
+    queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+    result = PipelineResult()
+
+    async def produce() -> None:
+        start = time.perf_counter()
+        chunk = []
+        async with aclosing(records) as stream:
+            async for record in stream:
+                chunk.append(record)
+                if len(chunk) >= chunk_size:
+                    await enqueue(chunk)
+                    chunk = []
+        if chunk:
+            await enqueue(chunk)
+        result.fetch_ms = int((time.perf_counter() - start) * 1000)
+        for _ in range(writers):
+            await queue.put(_DONE)
+
+    async def enqueue(chunk: list[dict]) -> None:
+        result.records += len(chunk)
+        result.chunks += 1
+        report_fetched(len(chunk))
+        await queue.put(chunk)
+
+    async def consume(writer: int) -> None:
+        while (chunk := await queue.get()) is not _DONE:
+            write_start = time.perf_counter()
+            written = await write(chunk)
+            result.upsert_ms += int((time.perf_counter() - write_start) * 1000)
+            result.payload_bytes += written.get("payload_bytes", 0)
+            report_written(written)
+            result.created += written["created"]
+            result.updated += written["updated"]
+            result.unchanged += written.get("unchanged", 0)
+            logger.info(
+                "pipeline_chunk_written",
+                entity=entity,
+                writer=writer,
+                records=len(chunk),
+                created=written["created"],
+                updated=written["updated"],
+                unchanged=written.get("unchanged", 0),
+            )
+
+    try:
+        async with asyncio.TaskGroup() as group:
+            group.create_task(produce())
+            for writer in range(writers):
+                group.create_task(consume(writer))
+    except ExceptionGroup as exc:
+        raise exc.exceptions[0] from exc
+
+    return result
@@ -0,0 +1,75 @@
+import time
+from datetime import UTC, datetime
+
+import structlog
+
+from app.metrics import observe_sync
+from app.models.sync import FixtureSyncMode, SyncAllResult, SyncResult
+from app.services.fixture_sync_service import fixture_sync_service
+from app.services.league_sync_service import league_sync_service
+from app.services.sync_graph import SyncNode, run_sync_graph
+from app.services.team_sync_service import team_sync_service
+from app.stores.sync_history_store import sync_history_store
+from app.stores.watermark_store import watermark_store
+
+logger = structlog.get_logger()
+
+
+class SyncAllService:
+    async def sync_all(self, fixture_mode: FixtureSyncMode = FixtureSyncMode.FULL) -> SyncAllResult:
+        logger.info("sync_started", entity="all", fixture_mode=fixture_mode)
+        start = time.perf_counter()
+        since = fixture_sync_service.watermark_for(fixture_mode)
+        # Without a watermark an incremental run reads everything, so it is recorded as full.
+        fixture_ran = FixtureSyncMode.INCREMENTAL if since is not None else FixtureSyncMode.FULL
+
+        nodes = [
+            SyncNode("leagues", league_sync_service.fetch_leagues, league_sync_service.store_leagues),
+            SyncNode("teams", team_sync_service.fetch_teams, team_sync_service.store_teams),
+            self._fixture_node(fixture_mode, since, depends_on=("leagues",)),
+        ]
+        results = await run_sync_graph(nodes)
+
+        for result in results:
+            if result.entity == "fixtures" and fixture_mode == FixtureSyncMode.PIPELINED:
+                continue  # already recorded by sync_fixtures
+            mode = fixture_ran if result.entity == "fixtures" else "full"
+            observe_sync(result, mode)
+            sync_history_store.append(result, mode)
+        total_duration_ms = int((time.perf_counter() - start) * 1000)
+        logger.info(
+            "sync_completed",
+            entity="all",
+            fixture_mode=fixture_mode,
+            created=sum(result.created for result in results),
+            updated=sum(result.updated for result in results),
+            unchanged=sum(result.unchanged for result in results),
+            duration_ms=total_duration_ms,
+        )
+        return SyncAllResult(status="completed", duration_ms=total_duration_ms, results=results)
+
+    def _fixture_node(self, mode: FixtureSyncMode, since: datetime | None, depends_on: tuple[str, ...]) -> SyncNode:
+        if mode == FixtureSyncMode.PIPELINED:
+            # Streaming interleaves fetching with writing, so the whole sync has to wait for its dependencies.
+            async def no_fetch() -> None:
+                return None
+
+            async def sync_pipelined(_: None) -> SyncResult:
+                return await fixture_sync_service.sync_fixtures(mode)
+
+            return SyncNode("fixtures", no_fetch, sync_pipelined, depends_on)
+
+        started_at = datetime.now(UTC)
+
+        async def fetch() -> list[dict]:
+            return await fixture_sync_service.fetch_fixtures(since)
+
+        async def write(fixtures: list[dict]) -> SyncResult:
+            result = await fixture_sync_service.store_fixtures(fixtures)
+            watermark_store.set("fixtures", started_at)
+            return result
+
+        return SyncNode("fixtures", fetch, write, depends_on)
+
+
+sync_all_service = SyncAllService()
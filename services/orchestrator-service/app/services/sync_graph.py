@@ -0,0 +1,70 @@
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from graphlib import TopologicalSorter
+from typing import Any
+
+import structlog
+
+from app.models.sync import EntitySyncResult, SyncResult
+from app.services.job_manager import report_phase
+
+logger = structlog.get_logger()
+
+
+@dataclass
+class SyncNode:
+    entity: str
+    fetch: Callable[[], Awaitable[Any]]
+    write: Callable[[Any], Awaitable[SyncResult]]
+    depends_on: tuple[str, ...] = ()
+
+
+async def run_sync_graph(nodes: list[SyncNode]) -> list[EntitySyncResult]:
+    # Every fetch starts at once; each write waits only for the writes it depends on,
+    # so wall-clock time tracks the slowest chain rather than the sum of entities.
+    by_entity = {node.entity: node for node in nodes}
+    for node in nodes:
+        unknown = set(node.depends_on) - by_entity.keys()
+        if unknown:
+            raise ValueError(f"{node.entity} depends on unknown entities: {sorted(unknown)}")
+    order = list(TopologicalSorter({node.entity: node.depends_on for node in nodes}).static_order())
+
+    tasks: dict[str, asyncio.Task[EntitySyncResult]] = {}
+    try:
+        async with asyncio.TaskGroup() as group:
+            for entity in order:
+                node = by_entity[entity]
+                tasks[entity] = group.create_task(_run_node(node, [tasks[name] for name in node.depends_on]))
+    except ExceptionGroup as exc:
+        raise exc.exceptions[0] from None
+
+    return [tasks[node.entity].result() for node in nodes]
+
+
+async def _run_node(node: SyncNode, dependencies: list[asyncio.Task]) -> EntitySyncResult:
+    start = time.perf_counter()
+    records = await node.fetch()
+    fetched = time.perf_counter()
+    if dependencies:
+        report_phase(node.entity, "waiting")
+    await asyncio.gather(*dependencies)
+    ready = time.perf_counter()
+    result = await node.write(records)
+    done = time.perf_counter()
+
+    entity_result = EntitySyncResult(
+        **result.model_dump(exclude={"fetch_ms", "total_ms", "records_per_second"}),
+        depends_on=list(node.depends_on),
+        wait_ms=int((ready - fetched) * 1000),
+    ).timed(result.fetch_ms + int((fetched - start) * 1000), int((done - start) * 1000))
+    logger.info(
+        "sync_node_completed",
+        entity=node.entity,
+        fetch_ms=entity_result.fetch_ms,
+        wait_ms=entity_result.wait_ms,
+        upsert_ms=entity_result.upsert_ms,
+        duration_ms=entity_result.total_ms,
+    )
+    return entity_result
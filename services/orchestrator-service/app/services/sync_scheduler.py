@@ -0,0 +1,155 @@
+import asyncio
+import random
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+
+import structlog
+
+from app.clients.database_service_client import database_service_client
+from app.config import settings
+from app.models.sync import FixtureSyncMode
+from app.services.fixture_sync_service import fixture_sync_service
+from app.services.job_manager import Job, JobConflictError, job_manager
+from app.services.league_sync_service import league_sync_service
+from app.services.team_sync_service import team_sync_service
+
+logger = structlog.get_logger()
+
+
+@dataclass
+class Schedule:
+    entity: str
+    submit: Callable[[], tuple[Job, bool]]
+    next_interval: Callable[[], Awaitable[float]]
+    interval_seconds: float | None = None
+    next_run_at: datetime | None = None
+
+
+def fixture_interval(fixtures: list[dict], now: float) -> float:
+    # Poll fast while anything is live, at the base rate when a kickoff is close,
+    # and otherwise back off - but never sleep through the next kickoff.
+    live_states = set(settings.fixture_live_state_ids)
+    ended_states = set(settings.fixture_ended_state_ids)
+    kickoffs = []
+    for fixture in fixtures:
+        kickoff = fixture.get("starting_at_timestamp")
+        state_id = fixture.get("state_id")
+        if state_id in live_states:
+            return settings.fixture_live_interval_seconds
+        if kickoff is None or state_id in ended_states:
+            continue
+        if kickoff <= now < kickoff + settings.fixture_live_window_seconds:
+            return settings.fixture_live_interval_seconds
+        if kickoff > now:
+            kickoffs.append(kickoff)
+
+    if not kickoffs:
+        return settings.fixture_idle_interval_seconds
+    until_soon = min(kickoffs) - now - settings.fixture_soon_seconds
+    if until_soon <= 0:
+        return settings.fixture_sync_interval_seconds
+    return min(max(until_soon, settings.fixture_sync_interval_seconds), settings.fixture_idle_interval_seconds)
+
+
+def with_jitter(interval: float) -> float:
+    ratio = settings.scheduler_jitter_ratio
+    return interval * random.uniform(1 - ratio, 1 + ratio)
+
+
+class SyncScheduler:
+    def __init__(self):
+        self.schedules = [
+            Schedule(
+                "leagues",
+                lambda: job_manager.submit("leagues", league_sync_service.sync_leagues),
+                self._fixed(lambda: settings.league_sync_interval_seconds),
+            ),
+            Schedule(
+                "teams",
+                lambda: job_manager.submit("teams", team_sync_service.sync_teams),
+                self._fixed(lambda: settings.team_sync_interval_seconds),
+            ),
+            Schedule(
+                "fixtures",
+                lambda: job_manager.submit(
+                    "fixtures",
+                    lambda: fixture_sync_service.sync_fixtures(FixtureSyncMode.INCREMENTAL),
+                    {"mode": FixtureSyncMode.INCREMENTAL},
+                ),
+                self._fixture_interval,
+            ),
+        ]
+        self._tasks: list[asyncio.Task] = []
+
+    def start(self) -> None:
+        if self._tasks:
+            return
+        self._tasks = [asyncio.create_task(self._run(schedule)) for schedule in self.schedules]
+        logger.info("scheduler_started", entities=[schedule.entity for schedule in self.schedules])
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def status(self) -> list[dict]:
+        return [
+            {
+                "entity": schedule.entity,
+                "interval_seconds": schedule.interval_seconds,
+                "next_run_at": schedule.next_run_at,
+            }
+            for schedule in self.schedules
+        ]
+
+    async def _run(self, schedule: Schedule) -> None:
+        while True:
+            try:
+                job, attached = schedule.submit()
+            except JobConflictError as exc:
+                # Another job is already writing this entity, so wait on it instead of stacking a second run.
+                job, attached = exc.job, True
+            if job.task is not None:
+                # Wait for the run to finish so intervals are measured between runs, not starts.
+                await asyncio.wait([job.task])
+
+            try:
+                interval = await schedule.next_interval()
+            except Exception as exc:
+                interval = settings.fixture_sync_interval_seconds
+                logger.warning("scheduler_interval_failed", entity=schedule.entity, error=str(exc))
+
+            delay = with_jitter(interval)
+            schedule.interval_seconds = interval
+            schedule.next_run_at = datetime.now(UTC) + timedelta(seconds=delay)
+            logger.info(
+                "sync_scheduled",
+                entity=schedule.entity,
+                job_id=job.id,
+                attached=attached,
+                state=job.state,
+                interval_seconds=interval,
+                delay_seconds=round(delay, 1),
+            )
+            await asyncio.sleep(delay)
+
+    @staticmethod
+    def _fixed(interval: Callable[[], float]) -> Callable[[], Awaitable[float]]:
+        async def next_interval() -> float:
+            return interval()
+
+        return next_interval
+
+    @staticmethod
+    async def _fixture_interval() -> float:
+        now = time.time()
+        fixtures = await database_service_client.get_fixtures_starting_between(
+            int(now - settings.fixture_live_window_seconds), int(now + settings.fixture_idle_interval_seconds)
+        )
+        return fixture_interval(fixtures, now)
+
+
+sync_scheduler = SyncScheduler()
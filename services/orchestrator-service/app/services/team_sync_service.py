@@ -4,7 +4,10 @@ import structlog
 
 from app.clients.database_service_client import database_service_client
 from app.clients.sportmonks_service_client import sportmonks_service_client
+from app.metrics import observe_sync
 from app.models.sync import SyncResult
+from app.services.job_manager import report_fetched, report_phase, report_written
+from app.stores.sync_history_store import sync_history_store
 
 logger = structlog.get_logger()
 
@@ -14,38 +17,63 @@ class TeamSyncService:
         logger.info("sync_started", entity="teams")
         start = time.perf_counter()
 
+        teams = await self.fetch_teams()
+        fetch_ms = int((time.perf_counter() - start) * 1000)
+        result = await self.store_teams(teams)
+        result = result.timed(fetch_ms, int((time.perf_counter() - start) * 1000))
+
+        observe_sync(result, "full")
+        sync_history_store.append(result, "full")
+        logger.info(
+            "sync_completed",
+            entity="teams",
+            created=result.created,
+            updated=result.updated,
+            unchanged=result.unchanged,
+            fetch_ms=result.fetch_ms,
+            upsert_ms=result.upsert_ms,
+            records_per_second=result.records_per_second,
+            payload_bytes=result.payload_bytes,
+            duration_ms=result.total_ms,
+        )
+        return result
+
+    async def fetch_teams(self) -> list[dict]:
+        report_phase("teams", "fetching")
         logger.info("sportmonks_fetch_started", entity="teams")
         fetch_start = time.perf_counter()
         teams = await sportmonks_service_client.get_teams()
         fetch_duration_ms = int((time.perf_counter() - fetch_start) * 1000)
+        report_fetched(len(teams))
         logger.info("sportmonks_fetch_completed", entity="teams", records=len(teams), duration_ms=fetch_duration_ms)
+        return teams
 
+    async def store_teams(self, teams: list[dict]) -> SyncResult:
+        report_phase("teams", "writing")
         logger.info("database_upsert_started", entity="teams", records=len(teams))
         upsert_start = time.perf_counter()
         result = await database_service_client.bulk_upsert_teams(teams)
         upsert_duration_ms = int((time.perf_counter() - upsert_start) * 1000)
+        report_written(result)
+        report_phase("teams", "done")
         logger.info(
             "database_upsert_completed",
             entity="teams",
             created=result["created"],
             updated=result["updated"],
+            unchanged=result.get("unchanged", 0),
             duration_ms=upsert_duration_ms,
         )
 
-        total_duration_ms = int((time.perf_counter() - start) * 1000)
-        logger.info(
-            "sync_completed",
-            entity="teams",
-            created=result["created"],
-            updated=result["updated"],
-            duration_ms=total_duration_ms,
-        )
-
         return SyncResult(
             entity="teams",
             created=result["created"],
             updated=result["updated"],
+            unchanged=result.get("unchanged", 0),
             status="completed",
+            records=len(teams),
+            upsert_ms=upsert_duration_ms,
+            payload_bytes=result.get("payload_bytes", 0),
         )
 
 
@@ -0,0 +1,24 @@
+from pathlib import Path
+
+from app.config import settings
+from app.stores.json_store import JsonStore
+
+
+class BackfillStore(JsonStore):
+    def completed_windows(self, backfill_id: str) -> set[str]:
+        return set(self._read().get(backfill_id, []))
+
+    def mark_completed(self, backfill_id: str, window_id: str) -> None:
+        backfills = self._read()
+        windows = set(backfills.get(backfill_id, []))
+        windows.add(window_id)
+        backfills[backfill_id] = sorted(windows)
+        self._write(backfills)
+
+    def clear(self, backfill_id: str) -> None:
+        backfills = self._read()
+        if backfills.pop(backfill_id, None) is not None:
+            self._write(backfills)
+
+
+backfill_store = BackfillStore(Path(settings.state_dir) / "backfills.json")
@@ -0,0 +1,61 @@
+import math
+from datetime import UTC, datetime
+from pathlib import Path
+
+from app.config import settings
+from app.models.sync import EntitySyncStats, PhaseStats, SyncResult
+from app.stores.json_store import JsonStore
+
+PHASES = ("total_ms", "fetch_ms", "upsert_ms", "records_per_second", "payload_bytes")
+
+
+def percentile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[max(math.ceil(q / 100 * len(ordered)) - 1, 0)]
+
+
+class SyncHistoryStore(JsonStore):
+    def __init__(self, path: Path, max_runs: int):
+        super().__init__(path)
+        self.max_runs = max_runs
+
+    def append(self, result: SyncResult, mode: str) -> None:
+        history = self._read()
+        runs = history.get(result.entity, [])
+        runs.append(
+            {
+                "mode": mode,
+                "status": result.status,
+                "finished_at": datetime.now(UTC).isoformat(),
+                "records": result.records,
+                **{phase: getattr(result, phase) for phase in PHASES},
+            }
+        )
+        history[result.entity] = runs[-self.max_runs :]
+        self._write(history)
+
+    def runs(self, entity: str) -> list[dict]:
+        return self._read().get(entity, [])
+
+    def stats(self, mode: str | None = None) -> list[EntitySyncStats]:
+        stats = []
+        for entity, runs in sorted(self._read().items()):
+            runs = [run for run in runs if mode is None or run["mode"] == mode]
+            if not runs:
+                continue
+            phases = {
+                phase: PhaseStats(**{f"p{q}": percentile([run[phase] for run in runs], q) for q in (50, 95, 99)})
+                for phase in PHASES
+            }
+            stats.append(
+                EntitySyncStats(
+                    entity=entity,
+                    runs=len(runs),
+                    last_run_at=datetime.fromisoformat(runs[-1]["finished_at"]),
+                    **phases,
+                )
+            )
+        return stats
+
+
+sync_history_store = SyncHistoryStore(Path(settings.state_dir) / "sync_history.json", settings.sync_history_size)
@@ -0,0 +1,19 @@
+from datetime import datetime
+from pathlib import Path
+
+from app.config import settings
+from app.stores.json_store import JsonStore
+
+
+class WatermarkStore(JsonStore):
+    def get(self, entity: str) -> datetime | None:
+        value = self._read().get(entity)
+        return datetime.fromisoformat(value) if value else None
+
+    def set(self, entity: str, value: datetime) -> None:
+        watermarks = self._read()
+        watermarks[entity] = value.isoformat()
+        self._write(watermarks)
+
+
+watermark_store = WatermarkStore(Path(settings.state_dir) / "watermarks.json")
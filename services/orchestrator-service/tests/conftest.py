@@ -2,6 +2,16 @@ import pytest
 from fastapi.testclient import TestClient
 
 from app.main import app
+from app.stores.backfill_store import backfill_store
+from app.stores.sync_history_store import sync_history_store
+from app.stores.watermark_store import watermark_store
+
+
+@pytest.fixture(autouse=True)
+def isolated_state(tmp_path, monkeypatch):
+    monkeypatch.setattr(watermark_store, "path", tmp_path / "watermarks.json")
+    monkeypatch.setattr(backfill_store, "path", tmp_path / "backfills.json")
+    monkeypatch.setattr(sync_history_store, "path", tmp_path / "sync_history.json")
 
 
 @pytest.fixture
@@ -0,0 +1,89 @@
+import gzip
+import json
+
+import httpx
+import pytest
+import zstandard
+
+from app.clients.database_service_client import DatabaseServiceClient
+from app.config import settings
+
+
+class TestDatabaseServiceClient:
+    @pytest.fixture
+    def client(self):
+        return DatabaseServiceClient()
+
+    @pytest.mark.asyncio
+    async def test_get_fixtures_follows_next_cursor(self, client, mock_fixtures):
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(dict(request.url.params))
+            if "after_id" not in request.url.params:
+                return httpx.Response(200, json={"data": mock_fixtures[:1], "next_cursor": mock_fixtures[0]["id"]})
+            return httpx.Response(200, json={"data": mock_fixtures[1:], "next_cursor": None})
+
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        result = await client.get_fixtures()
+
+        assert result == mock_fixtures
+        assert requests[1]["after_id"] == str(mock_fixtures[0]["id"])
+
+    @pytest.mark.asyncio
+    async def test_bulk_upsert_reports_payload_bytes(self, client, mock_fixtures):
+        sent = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            sent.append(len(request.content))
+            return httpx.Response(200, json={"created": 2, "updated": 0, "unchanged": 0})
+
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        result = await client.bulk_upsert_fixtures(mock_fixtures)
+
+        assert result["created"] == 2
+        assert result["payload_bytes"] == sent[0] > 0
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "encoding,decompress",
+        [("zstd", lambda body: zstandard.ZstdDecompressor().decompress(body)), ("gzip", gzip.decompress)],
+    )
+    async def test_bulk_upsert_compresses_body(self, client, mock_fixtures, monkeypatch, encoding, decompress):
+        monkeypatch.setattr(settings, "database_request_encoding", encoding)
+        monkeypatch.setattr(settings, "request_compression_minimum_size", 0)
+        sent = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            sent.append(request)
+            return httpx.Response(200, json={"created": 2, "updated": 0, "unchanged": 0})
+
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        result = await client.bulk_upsert_fixtures(mock_fixtures)
+
+        assert sent[0].headers["content-encoding"] == encoding
+        assert json.loads(decompress(sent[0].content)) == mock_fixtures
+        assert result["payload_bytes"] == len(sent[0].content)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "overrides", [{}, {"database_request_encoding": "zstd", "request_compression_minimum_size": 1024 * 1024}]
+    )
+    async def test_bulk_upsert_is_sent_uncompressed(self, client, mock_fixtures, monkeypatch, overrides):
+        for name, value in overrides.items():
+            monkeypatch.setattr(settings, name, value)
+        sent = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            sent.append(request)
+            return httpx.Response(200, json={"created": 2, "updated": 0, "unchanged": 0})
+
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        await client.bulk_upsert_fixtures(mock_fixtures)
+
+        assert "content-encoding" not in sent[0].headers
+        assert json.loads(sent[0].content) == mock_fixtures
@@ -0,0 +1,93 @@
+import asyncio
+from datetime import date
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.services.fixture_backfill_service import FixtureBackfillService
+from app.stores.backfill_store import backfill_store
+
+
+class TestFixtureBackfillService:
+    @pytest.fixture
+    def service(self):
+        return FixtureBackfillService()
+
+    @pytest.mark.asyncio
+    async def test_backfill_upserts_each_window(self, service, mock_fixtures):
+        with (
+            patch("app.services.fixture_backfill_service.sportmonks_service_client") as mock_sportmonks,
+            patch("app.services.fixture_backfill_service.database_service_client") as mock_database,
+        ):
+            mock_sportmonks.get_fixtures_between = AsyncMock(return_value=mock_fixtures)
+            mock_database.bulk_upsert_fixtures = AsyncMock(return_value={"created": 2, "updated": 0})
+
+            result = await service.backfill(date(2024, 8, 1), date(2024, 8, 20), window_days=7)
+
+            windows = sorted(call.args for call in mock_sportmonks.get_fixtures_between.call_args_list)
+            assert windows == [
+                (date(2024, 8, 1), date(2024, 8, 7)),
+                (date(2024, 8, 8), date(2024, 8, 14)),
+                (date(2024, 8, 15), date(2024, 8, 20)),
+            ]
+            assert result.created == 6
+            assert result.windows == 3
+            assert result.windows_skipped == 0
+            assert backfill_store.completed_windows("fixtures:2024-08-01:2024-08-20:7") == set()
+
+    @pytest.mark.asyncio
+    async def test_backfill_runs_windows_concurrently_up_to_limit(self, service):
+        in_flight = 0
+        peak = 0
+
+        async def get_fixtures_between(window_start, window_end):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return []
+
+        with (
+            patch("app.services.fixture_backfill_service.sportmonks_service_client") as mock_sportmonks,
+            patch("app.services.fixture_backfill_service.database_service_client"),
+            patch("app.services.fixture_backfill_service.settings") as mock_settings,
+        ):
+            mock_settings.backfill_concurrency = 3
+            mock_sportmonks.get_fixtures_between = AsyncMock(side_effect=get_fixtures_between)
+
+            await service.backfill(date(2024, 8, 1), date(2024, 8, 10), window_days=1)
+
+            assert mock_sportmonks.get_fixtures_between.call_count == 10
+            assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_failed_backfill_resumes_from_unfinished_windows(self, service, mock_fixtures):
+        failing_window = (date(2024, 8, 8), date(2024, 8, 14))
+
+        async def flaky(window_start, window_end):
+            if (window_start, window_end) == failing_window:
+                raise RuntimeError("upstream down")
+            return mock_fixtures
+
+        with (
+            patch("app.services.fixture_backfill_service.sportmonks_service_client") as mock_sportmonks,
+            patch("app.services.fixture_backfill_service.database_service_client") as mock_database,
+            patch("app.services.fixture_backfill_service.settings") as mock_settings,
+        ):
+            mock_settings.backfill_concurrency = 1
+            mock_sportmonks.get_fixtures_between = AsyncMock(side_effect=flaky)
+            mock_database.bulk_upsert_fixtures = AsyncMock(return_value={"created": 2, "updated": 0})
+
+            with pytest.raises(RuntimeError):
+                await service.backfill(date(2024, 8, 1), date(2024, 8, 20), window_days=7)
+
+            assert backfill_store.completed_windows("fixtures:2024-08-01:2024-08-20:7") == {"2024-08-01/2024-08-07"}
+
+            mock_sportmonks.get_fixtures_between = AsyncMock(return_value=mock_fixtures)
+            result = await service.backfill(date(2024, 8, 1), date(2024, 8, 20), window_days=7)
+
+            resumed = [call.args for call in mock_sportmonks.get_fixtures_between.call_args_list]
+            assert resumed == [failing_window, (date(2024, 8, 15), date(2024, 8, 20))]
+            assert result.windows_skipped == 1
+            assert result.created == 4
@@ -1,8 +1,11 @@
+from datetime import UTC, datetime
 from unittest.mock import AsyncMock, patch
 
 import pytest
 
+from app.models.sync import FixtureSyncMode
 from app.services.fixture_sync_service import FixtureSyncService
+from app.stores.watermark_store import watermark_store
 
 
 class TestFixtureSyncService:
@@ -27,3 +30,118 @@ class TestFixtureSyncService:
             assert result.status == "completed"
             mock_sportmonks.get_fixtures.assert_called_once()
             mock_database.bulk_upsert_fixtures.assert_called_once_with(mock_fixtures)
+
+    @pytest.mark.asyncio
+    async def test_pipelined_sync_writes_chunks_and_sums_counts(self, service, mock_fixtures):
+        fixtures = [{**mock_fixtures[0], "id": fixture_id} for fixture_id in range(5)]
+
+        async def stream_fixtures():
+            for fixture in fixtures:
+                yield fixture
+
+        async def bulk_upsert(chunk):
+            return {"created": len(chunk), "updated": 1}
+
+        with (
+            patch("app.services.fixture_sync_service.sportmonks_service_client") as mock_sportmonks,
+            patch("app.services.fixture_sync_service.database_service_client") as mock_database,
+            patch("app.services.fixture_sync_service.settings") as mock_settings,
+        ):
+            mock_settings.sync_chunk_size = 2
+            mock_settings.sync_queue_size = 1
+            mock_settings.sync_writers = 2
+            mock_sportmonks.stream_fixtures = stream_fixtures
+            mock_database.bulk_upsert_fixtures = AsyncMock(side_effect=bulk_upsert)
+
+            result = await service.sync_fixtures(FixtureSyncMode.PIPELINED)
+
+            assert result.created == 5
+            assert result.updated == 3
+            assert result.status == "completed"
+            assert mock_database.bulk_upsert_fixtures.call_count == 3
+            chunks = [call.args[0] for call in mock_database.bulk_upsert_fixtures.call_args_list]
+            assert sorted(fixture["id"] for chunk in chunks for fixture in chunk) == list(range(5))
+
+    @pytest.mark.asyncio
+    async def test_pipelined_sync_raises_when_a_write_fails(self, service, mock_fixtures):
+        async def stream_fixtures():
+            for fixture in mock_fixtures:
+                yield fixture
+
+        with (
+            patch("app.services.fixture_sync_service.sportmonks_service_client") as mock_sportmonks,
+            patch("app.services.fixture_sync_service.database_service_client") as mock_database,
+            patch("app.services.fixture_sync_service.settings") as mock_settings,
+        ):
+            mock_settings.sync_chunk_size = 1
+            mock_settings.sync_queue_size = 1
+            mock_settings.sync_writers = 1
+            mock_sportmonks.stream_fixtures = stream_fixtures
+            mock_database.bulk_upsert_fixtures = AsyncMock(side_effect=RuntimeError("database unavailable"))
+
+            with pytest.raises(RuntimeError, match="database unavailable"):
+                await service.sync_fixtures(FixtureSyncMode.PIPELINED)
+
+    @pytest.mark.asyncio
+    async def test_incremental_sync_fetches_changes_since_watermark(self, service, mock_fixtures):
+        since = datetime(2024, 8, 1, 12, 0, tzinfo=UTC)
+        watermark_store.set("fixtures", since)
+
+        with (
+            patch("app.services.fixture_sync_service.sportmonks_service_client") as mock_sportmonks,
+            patch("app.services.fixture_sync_service.database_service_client") as mock_database,
+        ):
+            mock_sportmonks.get_updated_fixtures = AsyncMock(return_value=mock_fixtures[:1])
+            mock_database.bulk_upsert_fixtures = AsyncMock(return_value={"created": 0, "updated": 1})
+
+            result = await service.sync_fixtures(FixtureSyncMode.INCREMENTAL)
+
+            assert result.updated == 1
+            mock_sportmonks.get_updated_fixtures.assert_called_once_with(since)
+            mock_sportmonks.get_fixtures.assert_not_called()
+            assert watermark_store.get("fixtures") > since
+
+    @pytest.mark.asyncio
+    async def test_incremental_sync_skips_write_when_nothing_changed(self, service):
+        watermark_store.set("fixtures", datetime(2024, 8, 1, 12, 0, tzinfo=UTC))
+
+        with (
+            patch("app.services.fixture_sync_service.sportmonks_service_client") as mock_sportmonks,
+            patch("app.services.fixture_sync_service.database_service_client") as mock_database,
+        ):
+            mock_sportmonks.get_updated_fixtures = AsyncMock(return_value=[])
+            mock_database.bulk_upsert_fixtures = AsyncMock()
+
+            result = await service.sync_fixtures(FixtureSyncMode.INCREMENTAL)
+
+            assert result.created == 0
+            assert result.updated == 0
+            mock_database.bulk_upsert_fixtures.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_incremental_sync_without_watermark_runs_full_sync(self, service, mock_fixtures, mock_bulk_result):
+        with (
+            patch("app.services.fixture_sync_service.sportmonks_service_client") as mock_sportmonks,
+            patch("app.services.fixture_sync_service.database_service_client") as mock_database,
+        ):
+            mock_sportmonks.get_fixtures = AsyncMock(return_value=mock_fixtures)
+            mock_database.bulk_upsert_fixtures = AsyncMock(return_value=mock_bulk_result)
+
+            await service.sync_fixtures(FixtureSyncMode.INCREMENTAL)
+
+            mock_sportmonks.get_fixtures.assert_called_once()
+            mock_sportmonks.get_updated_fixtures.assert_not_called()
+            assert watermark_store.get("fixtures") is not None
+
+    @pytest.mark.asyncio
+    async def test_failed_sync_keeps_previous_watermark(self, service):
+        since = datetime(2024, 8, 1, 12, 0, tzinfo=UTC)
+        watermark_store.set("fixtures", since)
+
+        with patch("app.services.fixture_sync_service.sportmonks_service_client") as mock_sportmonks:
+            mock_sportmonks.get_updated_fixtures = AsyncMock(side_effect=RuntimeError("upstream down"))
+
+            with pytest.raises(RuntimeError):
+                await service.sync_fixtures(FixtureSyncMode.INCREMENTAL)
+
+            assert watermark_store.get("fixtures") == since
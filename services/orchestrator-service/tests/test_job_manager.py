@@ -0,0 +1,150 @@
+import asyncio
+
+import pytest
+
+from app.models.job import JobState
+from app.models.sync import SyncResult
+from app.services.job_manager import JobConflictError, JobManager, report_fetched, report_phase, report_written
+
+
+def sync_result(created: int = 0) -> SyncResult:
+    return SyncResult(entity="leagues", created=created, updated=0, status="completed")
+
+
+async def settle(job) -> None:
+    await asyncio.wait([job.task])
+
+
+@pytest.mark.asyncio
+async def test_job_reports_progress_and_result():
+    manager = JobManager(max_concurrent=2, history_size=10)
+
+    async def run():
+        report_phase("leagues", "fetching")
+        report_fetched(3)
+        report_written({"created": 2, "updated": 1, "unchanged": 4})
+        report_phase("leagues", "done")
+        return sync_result(created=2)
+
+    job, attached = manager.submit("leagues", run)
+    await settle(job)
+    status = job.status()
+
+    assert attached is False
+    assert status.state == JobState.COMPLETED
+    assert status.phases == {"leagues": "done"}
+    assert (status.records_fetched, status.rows_written, status.batches_written) == (3, 3, 1)
+    assert status.rows_unchanged == 4
+    assert status.result["created"] == 2
+    assert manager.get(job.id) is job
+
+
+@pytest.mark.asyncio
+async def test_second_submission_for_same_kind_attaches_to_running_job():
+    manager = JobManager(max_concurrent=2, history_size=10)
+    release = asyncio.Event()
+    calls = 0
+
+    async def run():
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return sync_result()
+
+    first, _ = manager.submit("fixtures", run)
+    second, attached = manager.submit("fixtures", run)
+    release.set()
+    await settle(first)
+
+    assert attached is True
+    assert second is first
+    assert calls == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "first,second",
+    [
+        (("all", {}), ("fixtures", {"mode": "full"})),
+        (("fixtures:backfill", {"window_days": 7}), ("fixtures", {"mode": "full"})),
+        (("fixtures", {"mode": "incremental"}), ("fixtures", {"mode": "pipelined"})),
+    ],
+)
+async def test_overlapping_submission_with_different_work_is_rejected(first, second):
+    manager = JobManager(max_concurrent=2, history_size=10)
+    release = asyncio.Event()
+
+    async def run():
+        await release.wait()
+        return sync_result()
+
+    active, _ = manager.submit(first[0], run, first[1])
+
+    with pytest.raises(JobConflictError) as exc_info:
+        manager.submit(second[0], run, second[1])
+
+    assert exc_info.value.job is active
+    release.set()
+    await settle(active)
+    replacement, attached = manager.submit(second[0], run, second[1])
+    assert attached is False
+    await settle(replacement)
+
+
+@pytest.mark.asyncio
+async def test_jobs_beyond_the_cap_stay_queued():
+    manager = JobManager(max_concurrent=1, history_size=10)
+    release = asyncio.Event()
+
+    async def run():
+        await release.wait()
+        return sync_result()
+
+    first, _ = manager.submit("leagues", run)
+    second, _ = manager.submit("teams", run)
+    await asyncio.sleep(0)
+
+    assert first.state == JobState.RUNNING
+    assert second.state == JobState.QUEUED
+    release.set()
+    await settle(first)
+    await settle(second)
+    assert second.state == JobState.COMPLETED
+
+
+@pytest.mark.asyncio
+async def test_cancel_stops_running_job_and_frees_the_kind():
+    manager = JobManager(max_concurrent=1, history_size=10)
+
+    async def run():
+        await asyncio.Event().wait()
+
+    job, _ = manager.submit("leagues", run)
+    await asyncio.sleep(0)
+    manager.cancel(job.id)
+    await settle(job)
+
+    assert job.state == JobState.CANCELLED
+    assert job.finished_at is not None
+    replacement, attached = manager.submit("leagues", run)
+    assert attached is False
+    assert replacement is not job
+    await manager.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_failed_job_records_error_and_history_is_bounded():
+    manager = JobManager(max_concurrent=1, history_size=2)
+
+    async def fail():
+        raise RuntimeError("upstream unavailable")
+
+    jobs = []
+    for _ in range(3):
+        job, _ = manager.submit("leagues", fail)
+        await settle(job)
+        jobs.append(job)
+
+    assert jobs[-1].state == JobState.FAILED
+    assert jobs[-1].error == "upstream unavailable"
+    assert [job.id for job in manager.recent()] == [job.id for job in jobs[1:]]
@@ -3,6 +3,7 @@ from unittest.mock import AsyncMock, patch
 import pytest
 
 from app.services.league_sync_service import LeagueSyncService
+from app.stores.sync_history_store import sync_history_store
 
 
 class TestLeagueSyncService:
@@ -27,3 +28,24 @@ class TestLeagueSyncService:
             assert result.status == "completed"
             mock_sportmonks.get_leagues.assert_called_once()
             mock_database.bulk_upsert_leagues.assert_called_once_with(mock_leagues)
+
+    @pytest.mark.asyncio
+    async def test_sync_reports_phase_timings_and_records_history(self, service, mock_leagues):
+        with (
+            patch("app.services.league_sync_service.sportmonks_service_client") as mock_sportmonks,
+            patch("app.services.league_sync_service.database_service_client") as mock_database,
+        ):
+            mock_sportmonks.get_leagues = AsyncMock(return_value=mock_leagues)
+            mock_database.bulk_upsert_leagues = AsyncMock(
+                return_value={"created": 2, "updated": 0, "unchanged": 0, "payload_bytes": 1234}
+            )
+
+            result = await service.sync_leagues()
+
+            assert result.records == 2
+            assert result.payload_bytes == 1234
+            assert result.total_ms >= result.fetch_ms + result.upsert_ms
+            runs = sync_history_store.runs("leagues")
+            assert len(runs) == 1
+            assert runs[0]["mode"] == "full"
+            assert runs[0]["payload_bytes"] == 1234
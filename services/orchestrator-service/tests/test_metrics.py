@@ -0,0 +1,42 @@
+from unittest.mock import AsyncMock, patch
+
+import httpx
+from prometheus_client import REGISTRY
+
+from app.metrics import upstream_hooks
+from app.services.league_sync_service import league_sync_service
+
+
+def test_metrics_endpoint_exposes_pool_gauges(client):
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert 'http_client_pool_connections{pool="database_service",state="active"}' in response.text
+    assert 'http_client_pool_requests{pool="sportmonks_service",state="queued"}' in response.text
+
+
+async def test_completed_sync_records_duration_and_rows(mock_leagues, mock_bulk_result):
+    labels = {"entity": "leagues", "mode": "full"}
+    before = REGISTRY.get_sample_value("sync_duration_seconds_count", labels) or 0
+    created = REGISTRY.get_sample_value("sync_records_total", {"entity": "leagues", "outcome": "created"}) or 0
+
+    with (
+        patch("app.services.league_sync_service.sportmonks_service_client") as mock_sportmonks,
+        patch("app.services.league_sync_service.database_service_client") as mock_database,
+    ):
+        mock_sportmonks.get_leagues = AsyncMock(return_value=mock_leagues)
+        mock_database.bulk_upsert_leagues = AsyncMock(return_value=mock_bulk_result)
+        await league_sync_service.sync_leagues()
+
+    assert REGISTRY.get_sample_value("sync_duration_seconds_count", labels) == before + 1
+    assert REGISTRY.get_sample_value("sync_records_total", {"entity": "leagues", "outcome": "created"}) == created + 2
+
+
+async def test_upstream_hooks_time_each_response():
+    labels = {"upstream": "test-upstream", "status": "204"}
+    transport = httpx.MockTransport(lambda request: httpx.Response(204))
+
+    async with httpx.AsyncClient(transport=transport, event_hooks=upstream_hooks("test-upstream")) as client:
+        await client.get("http://upstream.test/leagues")
+
+    assert REGISTRY.get_sample_value("upstream_request_duration_seconds_count", labels) == 1
@@ -1,5 +1,12 @@
+import asyncio
+import time
 from unittest.mock import AsyncMock, patch
 
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.services.job_manager import job_manager
+
 
 class TestSyncLeagues:
     def test_sync_leagues_returns_result(self, client, mock_leagues, mock_bulk_result):
@@ -85,3 +92,197 @@ class TestSyncFixtures:
             client.post("/sync/fixtures")
 
             mock_database.bulk_upsert_fixtures.assert_called_once_with(mock_fixtures)
+
+
+class TestBackfillFixtures:
+    def test_backfill_returns_result(self, client, mock_fixtures):
+        with (
+            patch("app.services.fixture_backfill_service.sportmonks_service_client") as mock_sportmonks,
+            patch("app.services.fixture_backfill_service.database_service_client") as mock_database,
+        ):
+            mock_sportmonks.get_fixtures_between = AsyncMock(return_value=mock_fixtures)
+            mock_database.bulk_upsert_fixtures = AsyncMock(return_value={"created": 2, "updated": 0})
+
+            response = client.post(
+                "/sync/fixtures/backfill",
+                json={"start_date": "2024-08-01", "end_date": "2024-08-03", "window_days": 1},
+            )
+
+            assert response.status_code == 200
+            data = response.json()
+            assert data["created"] == 6
+            assert data["windows"] == 3
+
+    def test_backfill_rejects_inverted_range(self, client):
+        response = client.post("/sync/fixtures/backfill", json={"start_date": "2024-08-03", "end_date": "2024-08-01"})
+
+        assert response.status_code == 422
+
+
+class TestSyncAll:
+    def test_sync_all_syncs_every_entity_with_timings(
+        self, client, mock_leagues, mock_teams, mock_fixtures, mock_bulk_result
+    ):
+        with (
+            patch("app.services.league_sync_service.sportmonks_service_client") as league_sportmonks,
+            patch("app.services.league_sync_service.database_service_client") as league_database,
+            patch("app.services.team_sync_service.sportmonks_service_client") as team_sportmonks,
+            patch("app.services.team_sync_service.database_service_client") as team_database,
+            patch("app.services.fixture_sync_service.sportmonks_service_client") as fixture_sportmonks,
+            patch("app.services.fixture_sync_service.database_service_client") as fixture_database,
+        ):
+            league_sportmonks.get_leagues = AsyncMock(return_value=mock_leagues)
+            league_database.bulk_upsert_leagues = AsyncMock(return_value=mock_bulk_result)
+            team_sportmonks.get_teams = AsyncMock(return_value=mock_teams)
+            team_database.bulk_upsert_teams = AsyncMock(return_value=mock_bulk_result)
+            fixture_sportmonks.get_fixtures = AsyncMock(return_value=mock_fixtures)
+            fixture_database.bulk_upsert_fixtures = AsyncMock(return_value=mock_bulk_result)
+
+            response = client.post("/sync/all")
+
+            assert response.status_code == 200
+            data = response.json()
+            assert data["status"] == "completed"
+            assert [result["entity"] for result in data["results"]] == ["leagues", "teams", "fixtures"]
+            fixtures = data["results"][2]
+            assert fixtures["depends_on"] == ["leagues"]
+            assert fixtures["created"] == 2
+            assert {"fetch_ms", "wait_ms", "upsert_ms", "total_ms", "records_per_second"} <= fixtures.keys()
+            fixture_database.bulk_upsert_fixtures.assert_called_once_with(mock_fixtures)
+
+
+    def test_incremental_without_watermark_is_recorded_as_full(
+        self, client, mock_leagues, mock_teams, mock_fixtures, mock_bulk_result
+    ):
+        with (
+            patch("app.services.league_sync_service.sportmonks_service_client") as league_sportmonks,
+            patch("app.services.league_sync_service.database_service_client") as league_database,
+            patch("app.services.team_sync_service.sportmonks_service_client") as team_sportmonks,
+            patch("app.services.team_sync_service.database_service_client") as team_database,
+            patch("app.services.fixture_sync_service.sportmonks_service_client") as fixture_sportmonks,
+            patch("app.services.fixture_sync_service.database_service_client") as fixture_database,
+        ):
+            league_sportmonks.get_leagues = AsyncMock(return_value=mock_leagues)
+            league_database.bulk_upsert_leagues = AsyncMock(return_value=mock_bulk_result)
+            team_sportmonks.get_teams = AsyncMock(return_value=mock_teams)
+            team_database.bulk_upsert_teams = AsyncMock(return_value=mock_bulk_result)
+            fixture_sportmonks.get_fixtures = AsyncMock(return_value=mock_fixtures)
+            fixture_database.bulk_upsert_fixtures = AsyncMock(return_value=mock_bulk_result)
+
+            client.post("/sync/all", params={"fixture_mode": "incremental"})
+
+            fixture_sportmonks.get_fixtures.assert_awaited_once()
+        assert client.get("/sync/stats", params={"mode": "incremental"}).json() == []
+        assert "fixtures" in [stats["entity"] for stats in client.get("/sync/stats", params={"mode": "full"}).json()]
+
+class TestSyncJobs:
+    def test_submitted_job_runs_in_background(self, mock_leagues, mock_bulk_result):
+        with (
+            TestClient(app) as client,
+            patch("app.services.league_sync_service.sportmonks_service_client") as mock_sportmonks,
+            patch("app.services.league_sync_service.database_service_client") as mock_database,
+        ):
+            mock_sportmonks.get_leagues = AsyncMock(return_value=mock_leagues)
+            mock_database.bulk_upsert_leagues = AsyncMock(return_value=mock_bulk_result)
+
+            response = client.post("/jobs/sync/leagues")
+            assert response.status_code == 202
+            job_id = response.json()["id"]
+
+            for _ in range(50):
+                job = client.get(f"/jobs/{job_id}").json()
+                if job["state"] == "completed":
+                    break
+                time.sleep(0.01)
+
+            assert job["state"] == "completed"
+            assert job["records_fetched"] == 2
+            assert job["rows_written"] == 2
+            assert job["phases"] == {"leagues": "done"}
+            assert job["result"]["created"] == 2
+
+    def test_conflicting_submission_returns_409(self):
+        async def sync_fixtures(mode):
+            await asyncio.Event().wait()
+
+        with (
+            TestClient(app) as client,
+            patch("app.controllers.job_controller.fixture_sync_service") as mock_fixture_sync,
+        ):
+            mock_fixture_sync.sync_fixtures = sync_fixtures
+            first = client.post("/jobs/sync/fixtures", params={"mode": "incremental"})
+            attached = client.post("/jobs/sync/fixtures", params={"mode": "incremental"})
+            conflict = client.post("/jobs/sync/fixtures", params={"mode": "pipelined"})
+            client.delete(f"/jobs/{first.json()['id']}")
+
+        assert attached.json()["attached"] is True
+        assert attached.json()["id"] == first.json()["id"]
+        assert conflict.status_code == 409
+
+    def test_blocking_sync_runs_as_a_job(self, client, mock_leagues, mock_bulk_result, monkeypatch):
+        monkeypatch.setattr(job_manager, "jobs", {})
+        with (
+            patch("app.services.league_sync_service.sportmonks_service_client") as mock_sportmonks,
+            patch("app.services.league_sync_service.database_service_client") as mock_database,
+        ):
+            mock_sportmonks.get_leagues = AsyncMock(return_value=mock_leagues)
+            mock_database.bulk_upsert_leagues = AsyncMock(return_value=mock_bulk_result)
+
+            response = client.post("/sync/leagues")
+
+        [job] = client.get("/jobs").json()
+        assert response.status_code == 200
+        assert job["kind"] == "leagues"
+        assert job["result"]["created"] == response.json()["created"] == 2
+        assert job["state"] == "completed"
+
+    def test_blocking_sync_conflicts_with_running_job(self):
+        async def sync_fixtures(mode):
+            await asyncio.Event().wait()
+
+        with (
+            TestClient(app) as client,
+            patch("app.controllers.job_controller.fixture_sync_service") as mock_fixture_sync,
+        ):
+            mock_fixture_sync.sync_fixtures = sync_fixtures
+            running = client.post("/jobs/sync/fixtures", params={"mode": "incremental"})
+            response = client.post("/sync/all")
+            client.delete(f"/jobs/{running.json()['id']}")
+
+        assert response.status_code == 409
+
+    def test_blocking_sync_reports_failed_job(self, client):
+        with patch("app.services.league_sync_service.sportmonks_service_client") as mock_sportmonks:
+            mock_sportmonks.get_leagues = AsyncMock(side_effect=RuntimeError("upstream down"))
+
+            response = client.post("/sync/leagues")
+
+        assert response.status_code == 500
+        assert "upstream down" in response.json()["detail"]
+
+    def test_unknown_job_returns_404(self, client):
+        assert client.get("/jobs/missing").status_code == 404
+        assert client.delete("/jobs/missing").status_code == 404
+
+
+class TestSyncStats:
+    def test_stats_summarise_recorded_runs(self, client, mock_leagues, mock_bulk_result):
+        with (
+            patch("app.services.league_sync_service.sportmonks_service_client") as mock_sportmonks,
+            patch("app.services.league_sync_service.database_service_client") as mock_database,
+        ):
+            mock_sportmonks.get_leagues = AsyncMock(return_value=mock_leagues)
+            mock_database.bulk_upsert_leagues = AsyncMock(return_value=mock_bulk_result)
+            client.post("/sync/leagues")
+            client.post("/sync/leagues")
+
+        response = client.get("/sync/stats")
+
+        assert response.status_code == 200
+        [stats] = response.json()
+        assert stats["entity"] == "leagues"
+        assert stats["runs"] == 2
+        assert set(stats["total_ms"]) == {"p50", "p95", "p99"}
+
+    def test_stats_are_empty_without_history(self, client):
+        assert client.get("/sync/stats").json() == []
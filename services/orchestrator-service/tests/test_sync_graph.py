@@ -0,0 +1,80 @@
+import asyncio
+
+import pytest
+
+from app.models.sync import SyncResult
+from app.services.sync_graph import SyncNode, run_sync_graph
+
+
+def node(entity, events, depends_on=(), fetch_gate=None, fail_write=False):
+    async def fetch():
+        events.append(f"fetch:{entity}")
+        if fetch_gate is not None:
+            await fetch_gate.wait()
+        return [entity]
+
+    async def write(records):
+        if fail_write:
+            raise RuntimeError(f"{entity} write failed")
+        events.append(f"write:{entity}")
+        return SyncResult(entity=entity, created=len(records), updated=0, status="completed")
+
+    return SyncNode(entity, fetch, write, tuple(depends_on))
+
+
+@pytest.mark.asyncio
+async def test_fetches_start_together_before_any_write():
+    events = []
+    gate = asyncio.Event()
+    nodes = [
+        node("leagues", events, fetch_gate=gate),
+        node("teams", events, fetch_gate=gate),
+        node("fixtures", events, depends_on=["leagues"], fetch_gate=gate),
+    ]
+
+    task = asyncio.create_task(run_sync_graph(nodes))
+    for _ in range(5):
+        await asyncio.sleep(0)
+    assert sorted(events) == ["fetch:fixtures", "fetch:leagues", "fetch:teams"]
+    gate.set()
+    results = await task
+
+    assert [result.entity for result in results] == ["leagues", "teams", "fixtures"]
+    assert events.index("write:leagues") < events.index("write:fixtures")
+    assert results[2].depends_on == ["leagues"]
+
+
+@pytest.mark.asyncio
+async def test_dependent_write_waits_for_slow_dependency():
+    events = []
+    leagues_gate = asyncio.Event()
+    nodes = [node("leagues", events, fetch_gate=leagues_gate), node("fixtures", events, depends_on=["leagues"])]
+
+    task = asyncio.create_task(run_sync_graph(nodes))
+    for _ in range(5):
+        await asyncio.sleep(0)
+    assert "write:fixtures" not in events
+    leagues_gate.set()
+    await task
+
+    assert events[-2:] == ["write:leagues", "write:fixtures"]
+
+
+@pytest.mark.asyncio
+async def test_failed_dependency_skips_dependent_write():
+    events = []
+    nodes = [node("leagues", events, fail_write=True), node("fixtures", events, depends_on=["leagues"])]
+
+    with pytest.raises(RuntimeError, match="leagues write failed"):
+        await run_sync_graph(nodes)
+
+    assert "write:fixtures" not in events
+
+
+@pytest.mark.asyncio
+async def test_rejects_unknown_and_cyclic_dependencies():
+    with pytest.raises(ValueError, match="unknown"):
+        await run_sync_graph([node("fixtures", [], depends_on=["leagues"])])
+
+    with pytest.raises(ValueError):
+        await run_sync_graph([node("a", [], depends_on=["b"]), node("b", [], depends_on=["a"])])
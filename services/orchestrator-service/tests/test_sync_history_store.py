@@ -0,0 +1,47 @@
+from app.models.sync import SyncResult
+from app.stores.sync_history_store import SyncHistoryStore, percentile
+
+
+def run(entity: str, total_ms: int, records: int = 100) -> SyncResult:
+    return SyncResult(
+        entity=entity, created=records, updated=0, status="completed", records=records
+    ).timed(fetch_ms=total_ms // 2, total_ms=total_ms)
+
+
+def test_percentile_uses_nearest_rank():
+    values = list(range(1, 101))
+
+    assert percentile(values, 50) == 50
+    assert percentile(values, 95) == 95
+    assert percentile(values, 99) == 99
+    assert percentile([7], 99) == 7
+
+
+def test_history_is_bounded_per_entity(tmp_path):
+    store = SyncHistoryStore(tmp_path / "history.json", max_runs=3)
+
+    for total_ms in range(1, 6):
+        store.append(run("fixtures", total_ms), "incremental")
+    store.append(run("leagues", 10), "full")
+
+    assert [entry["total_ms"] for entry in store.runs("fixtures")] == [3, 4, 5]
+    assert len(store.runs("leagues")) == 1
+
+
+def test_stats_report_percentiles_per_entity_and_filter_by_mode(tmp_path):
+    store = SyncHistoryStore(tmp_path / "history.json", max_runs=100)
+    for total_ms in range(100, 1100, 100):
+        store.append(run("fixtures", total_ms), "incremental")
+    store.append(run("fixtures", 60_000), "full")
+    store.append(run("teams", 500), "full")
+
+    stats = {entry.entity: entry for entry in store.stats()}
+    incremental = store.stats("incremental")
+
+    assert stats["fixtures"].runs == 11
+    assert stats["fixtures"].total_ms.p99 == 60_000
+    assert stats["teams"].runs == 1
+    assert [entry.entity for entry in incremental] == ["fixtures"]
+    assert incremental[0].total_ms.p50 == 500
+    assert incremental[0].total_ms.p95 == 1000
+    assert incremental[0].records_per_second.p50 == 166.7
@@ -0,0 +1,105 @@
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.config import settings
+from app.models.sync import SyncResult
+from app.services.job_manager import JobManager
+from app.services.sync_scheduler import Schedule, SyncScheduler, fixture_interval, with_jitter
+
+NOW = 1_750_000_000
+
+
+def fixture(state_id: int, kickoff: float) -> dict:
+    return {"state_id": state_id, "starting_at_timestamp": kickoff}
+
+
+class TestFixtureInterval:
+    def test_live_state_polls_at_live_interval(self):
+        assert fixture_interval([fixture(2, NOW - 600)], NOW) == settings.fixture_live_interval_seconds
+
+    def test_kicked_off_but_not_yet_updated_counts_as_live(self):
+        assert fixture_interval([fixture(1, NOW - 60)], NOW) == settings.fixture_live_interval_seconds
+
+    def test_ended_fixtures_are_ignored(self):
+        assert fixture_interval([fixture(5, NOW - 600)], NOW) == settings.fixture_idle_interval_seconds
+
+    def test_kickoff_soon_uses_base_interval(self):
+        kickoff = NOW + settings.fixture_soon_seconds / 2
+        assert fixture_interval([fixture(1, kickoff)], NOW) == settings.fixture_sync_interval_seconds
+
+    def test_distant_kickoff_wakes_up_before_it_is_soon(self):
+        kickoff = NOW + settings.fixture_soon_seconds + 2 * 3600
+
+        assert fixture_interval([fixture(1, kickoff)], NOW) == 2 * 3600
+
+    def test_nothing_scheduled_backs_off_to_idle_interval(self):
+        assert fixture_interval([], NOW) == settings.fixture_idle_interval_seconds
+
+
+def test_jitter_stays_within_ratio(monkeypatch):
+    monkeypatch.setattr(settings, "scheduler_jitter_ratio", 0.2)
+
+    delays = [with_jitter(100) for _ in range(200)]
+
+    assert all(80 <= delay <= 120 for delay in delays)
+
+
+@pytest.mark.asyncio
+async def test_scheduler_waits_for_run_then_sleeps_for_next_interval(monkeypatch):
+    monkeypatch.setattr(settings, "scheduler_jitter_ratio", 0)
+    manager = JobManager(max_concurrent=1, history_size=10)
+    runs = AsyncMock(return_value=SyncResult(entity="fixtures", created=0, updated=0, status="completed"))
+    schedule = Schedule("fixtures", lambda: manager.submit("fixtures", runs), AsyncMock(return_value=60.0))
+    sleeps = []
+
+    async def sleep(delay):
+        sleeps.append(delay)
+        raise asyncio.CancelledError
+
+    with patch("app.services.sync_scheduler.asyncio.sleep", side_effect=sleep):
+        with pytest.raises(asyncio.CancelledError):
+            await SyncScheduler()._run(schedule)
+
+    runs.assert_awaited_once()
+    assert sleeps == [60.0]
+    assert schedule.interval_seconds == 60.0
+    assert schedule.next_run_at is not None
+
+
+@pytest.mark.asyncio
+async def test_scheduler_waits_on_a_conflicting_job(monkeypatch):
+    monkeypatch.setattr(settings, "scheduler_jitter_ratio", 0)
+    manager = JobManager(max_concurrent=1, history_size=10)
+    backfill = AsyncMock(return_value=SyncResult(entity="fixtures", created=0, updated=0, status="completed"))
+    runs = AsyncMock()
+    active, _ = manager.submit("fixtures:backfill", backfill)
+    schedule = Schedule("fixtures", lambda: manager.submit("fixtures", runs), AsyncMock(return_value=60.0))
+
+    with patch("app.services.sync_scheduler.asyncio.sleep", side_effect=asyncio.CancelledError):
+        with pytest.raises(asyncio.CancelledError):
+            await SyncScheduler()._run(schedule)
+
+    backfill.assert_awaited_once()
+    runs.assert_not_awaited()
+    assert active.finished
+
+
+@pytest.mark.asyncio
+async def test_fixture_interval_falls_back_when_lookup_fails(monkeypatch):
+    monkeypatch.setattr(settings, "scheduler_jitter_ratio", 0)
+    manager = JobManager(max_concurrent=1, history_size=10)
+    runs = AsyncMock(return_value=SyncResult(entity="fixtures", created=0, updated=0, status="completed"))
+    scheduler = SyncScheduler()
+    schedule = Schedule("fixtures", lambda: manager.submit("fixtures", runs), scheduler._fixture_interval)
+
+    with (
+        patch("app.services.sync_scheduler.database_service_client") as mock_database,
+        patch("app.services.sync_scheduler.asyncio.sleep", side_effect=asyncio.CancelledError),
+    ):
+        mock_database.get_fixtures_starting_between = AsyncMock(side_effect=RuntimeError("down"))
+        with pytest.raises(asyncio.CancelledError):
+            await scheduler._run(schedule)
+
+    assert schedule.interval_seconds == settings.fixture_sync_interval_seconds
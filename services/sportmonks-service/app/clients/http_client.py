@@ -0,0 +1,32 @@
+import httpx
+
+from app.config import settings
+
+
+def create_http_client(**kwargs) -> httpx.AsyncClient:
+    limits = httpx.Limits(
+        max_connections=settings.http_max_connections,
+        max_keepalive_connections=settings.http_max_keepalive_connections,
+        keepalive_expiry=settings.http_keepalive_expiry,
+    )
+    return httpx.AsyncClient(limits=limits, http2=settings.http2, **kwargs)
+
+
+def get_pool_stats(client: httpx.AsyncClient | None) -> dict:
+    # httpx has no public pool API, so read httpcore's pool defensively.
+    pool = getattr(getattr(client, "_transport", None), "_pool", None)
+    connections = list(getattr(pool, "connections", []))
+    requests = list(getattr(pool, "_requests", []))
+    idle = sum(1 for connection in connections if connection.is_idle())
+    queued = sum(1 for request in requests if request.is_queued())
+
+    return {
+        "open": client is not None and not client.is_closed,
+        "max_connections": settings.http_max_connections,
+        "max_keepalive_connections": settings.http_max_keepalive_connections,
+        "connections": len(connections),
+        "idle_connections": idle,
+        "active_connections": len(connections) - idle,
+        "active_requests": len(requests) - queued,
+        "queued_requests": queued,
+    }
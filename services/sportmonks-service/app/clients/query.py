@@ -0,0 +1,22 @@
+from pydantic import BaseModel
+
+from app.config import settings
+
+
+def select_fields(model: type[BaseModel]) -> str:
+    # SportMonks always returns id, so it is left out of the select list.
+    return ",".join(name for name in model.model_fields if name != "id")
+
+
+def build_filters(filters: dict[str, list[int]]) -> str | None:
+    parts = [f"{name}:{','.join(str(value) for value in values)}" for name, values in filters.items() if values]
+    return ";".join(parts) or None
+
+
+def query_params(model: type[BaseModel], filters: dict[str, list[int]] | None = None) -> dict:
+    params = {}
+    if settings.sportmonks_select_fields:
+        params["select"] = select_fields(model)
+    if filters and (upstream_filters := build_filters(filters)):
+        params["filters"] = upstream_filters
+    return params
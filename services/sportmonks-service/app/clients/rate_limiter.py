@@ -0,0 +1,118 @@
+import asyncio
+import time
+from dataclasses import dataclass
+
+import structlog
+
+logger = structlog.get_logger()
+
+
+class RateLimitExhaustedError(Exception):
+    def __init__(self, entity: str, retry_after: float):
+        super().__init__(f"SportMonks rate limit for {entity} exhausted, resets in {retry_after:.0f}s")
+        self.entity = entity
+        self.retry_after = retry_after
+
+
+@dataclass
+class RateLimitBudget:
+    remaining: int
+    resets_at: float
+    in_flight: int = 0
+
+    @property
+    def available(self) -> int:
+        return self.remaining - self.in_flight
+
+
+def entity_for(endpoint: str) -> str:
+    # SportMonks budgets calls per entity: football/fixtures/between/... and
+    # football/fixtures/{id} draw from the same pool.
+    parts = endpoint.strip("/").split("/")
+    return parts[1] if len(parts) > 1 else parts[0]
+
+
+class RateLimiter:
+    def __init__(self, limit: int, window_seconds: float, reserve: int = 0, max_wait_seconds: float = 900.0):
+        self.limit = limit
+        self.window_seconds = window_seconds
+        self.reserve = reserve
+        self.max_wait_seconds = max_wait_seconds
+        self._budgets: dict[str, RateLimitBudget] = {}
+        self._condition = asyncio.Condition()
+
+    def _budget(self, entity: str) -> RateLimitBudget:
+        now = time.monotonic()
+        budget = self._budgets.get(entity)
+        if budget is None:
+            budget = self._budgets[entity] = RateLimitBudget(self.limit, now + self.window_seconds)
+        elif now >= budget.resets_at:
+            budget.remaining = self.limit
+            budget.resets_at = now + self.window_seconds
+        return budget
+
+    async def acquire(self, entity: str) -> None:
+        async with self._condition:
+            while True:
+                budget = self._budget(entity)
+                if budget.available > self.reserve:
+                    budget.in_flight += 1
+                    return
+
+                wait = max(budget.resets_at - time.monotonic(), 0.0)
+                if wait > self.max_wait_seconds:
+                    raise RateLimitExhaustedError(entity, wait)
+
+                logger.warning(
+                    "rate_limit_waiting",
+                    entity=entity,
+                    remaining=budget.remaining,
+                    in_flight=budget.in_flight,
+                    wait_seconds=round(wait, 1),
+                )
+                try:
+                    await asyncio.wait_for(self._condition.wait(), timeout=wait)
+                except TimeoutError:
+                    pass
+
+    async def release(
+        self,
+        entity: str,
+        remaining: int | None = None,
+        resets_in_seconds: float | None = None,
+    ) -> None:
+        async with self._condition:
+            budget = self._budget(entity)
+            budget.in_flight -= 1
+            if remaining is None:
+                budget.remaining -= 1
+            elif resets_in_seconds is None:
+                budget.remaining = min(budget.remaining, remaining)
+            else:
+                resets_at = time.monotonic() + resets_in_seconds
+                # Responses can land out of order, so within one window never let a
+                # stale, larger remaining count win over a newer one.
+                if resets_at > budget.resets_at + 1:
+                    budget.remaining = remaining
+                else:
+                    budget.remaining = min(budget.remaining, remaining)
+                budget.resets_at = resets_at
+            self._condition.notify_all()
+
+    async def exhaust(self, entity: str, resets_in_seconds: float) -> None:
+        async with self._condition:
+            budget = self._budget(entity)
+            budget.remaining = 0
+            budget.resets_at = time.monotonic() + resets_in_seconds
+            logger.warning("rate_limit_exhausted", entity=entity, resets_in_seconds=resets_in_seconds)
+
+    def snapshot(self) -> dict:
+        now = time.monotonic()
+        return {
+            entity: {
+                "remaining": budget.remaining,
+                "in_flight": budget.in_flight,
+                "resets_in_seconds": max(round(budget.resets_at - now, 1), 0.0),
+            }
+            for entity, budget in self._budgets.items()
+        }
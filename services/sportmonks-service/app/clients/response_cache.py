@@ -0,0 +1,111 @@
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from enum import StrEnum
+from urllib.parse import urlencode
+
+
+class CacheState(StrEnum):
+    FRESH = "fresh"
+    STALE = "stale"
+    MISS = "miss"
+
+
+@dataclass
+class CacheEntry:
+    payload: dict
+    size: int
+    expires_at: float
+    etag: str | None = None
+    last_modified: str | None = None
+
+    def validators(self) -> dict[str, str]:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    def __init__(self, max_bytes: int, ttl_seconds: dict[str, float], stale_seconds: float):
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.stale_seconds = stale_seconds
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._size = 0
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.revalidated = 0
+        self.evictions = 0
+
+    @staticmethod
+    def key(endpoint: str, params: dict | None = None) -> str:
+        if not params:
+            return endpoint
+        return f"{endpoint}?{urlencode(sorted(params.items()))}"
+
+    def ttl_for(self, entity: str) -> float:
+        return self.ttl_seconds.get(entity, 0.0)
+
+    def lookup(self, key: str) -> tuple[CacheEntry | None, CacheState]:
+        entry = self._entries.get(key)
+        now = time.monotonic()
+        if entry is not None and now < entry.expires_at + self.stale_seconds:
+            self._entries.move_to_end(key)
+            if now < entry.expires_at:
+                self.hits += 1
+                return entry, CacheState.FRESH
+            self.stale_hits += 1
+            return entry, CacheState.STALE
+        self.misses += 1
+        return entry, CacheState.MISS
+
+    def put(
+        self,
+        key: str,
+        payload: dict,
+        size: int,
+        ttl: float,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> None:
+        self._discard(key)
+        if size > self.max_bytes:
+            return
+        self._entries[key] = CacheEntry(payload, size, time.monotonic() + ttl, etag, last_modified)
+        self._size += size
+        while self._size > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._size -= evicted.size
+            self.evictions += 1
+
+    def touch(self, key: str, ttl: float) -> None:
+        entry = self._entries.get(key)
+        if entry is not None:
+            entry.expires_at = time.monotonic() + ttl
+            self._entries.move_to_end(key)
+            self.revalidated += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._size = 0
+
+    def _discard(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= entry.size
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._entries),
+            "bytes": self._size,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "revalidated": self.revalidated,
+            "evictions": self.evictions,
+        }
@@ -0,0 +1,42 @@
+import random
+from dataclasses import dataclass
+
+import httpx
+
+RETRYABLE_STATUS_CODES = frozenset({408, 500, 502, 503, 504})
+
+
+def is_retryable(exc: Exception) -> bool:
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code in RETRYABLE_STATUS_CODES
+    return isinstance(exc, httpx.TransportError)
+
+
+def backoff_delay(attempt: int, base: float, cap: float) -> float:
+    # Full jitter keeps concurrent page retries from hammering upstream in lockstep.
+    return random.uniform(0, min(cap, base * 2**attempt))
+
+
+class RetryBudget:
+    def __init__(self, retries: int):
+        self.remaining = retries
+
+    def take(self) -> bool:
+        if self.remaining <= 0:
+            return False
+        self.remaining -= 1
+        return True
+
+
+@dataclass
+class PageCheckpoint:
+    next_page: int
+    items: list[dict]
+    created_at: float
+
+
+class PaginationAbortedError(Exception):
+    def __init__(self, endpoint: str, page: int):
+        super().__init__(f"Pagination of {endpoint} abandoned at page {page}")
+        self.endpoint = endpoint
+        self.page = page
@@ -0,0 +1,128 @@
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable
+from typing import Any
+
+
+class SingleFlight:
+    def __init__(self):
+        self._tasks: dict[str, asyncio.Task] = {}
+        self._waiters: dict[asyncio.Task, int] = {}
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._tasks
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        task = self._tasks.get(key)
+        if task is None:
+            task = asyncio.create_task(fn())
+            self._tasks[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        self._waiters[task] = self._waiters.get(task, 0) + 1
+        try:
+            # Shielded so one caller going away does not fail the others waiting on it.
+            return await asyncio.shield(task)
+        finally:
+            self._leave(key, task)
+
+    def _leave(self, key: str, task: asyncio.Task) -> None:
+        remaining = self._waiters.pop(task) - 1
+        if remaining:
+            self._waiters[task] = remaining
+        elif not task.done():
+            # Nobody is left to use the result, so stop the upstream call too.
+            if self._tasks.get(key) is task:
+                del self._tasks[key]
+            task.cancel()
+
+    def _forget(self, key: str, task: asyncio.Task) -> None:
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+        if not task.cancelled():
+            task.exception()
+
+
+class SharedPages:
+    # Lets several consumers read one paginated walk. Pages are pulled by the
+    # fastest consumer and dropped once every subscriber has read them, so
+    # memory stays bounded by how far the slowest one lags behind.
+    def __init__(self, source: AsyncIterator[list[dict]], on_finished: Callable[[], None]):
+        self._source = source
+        self._on_finished = on_finished
+        self._pages: list[list[dict]] = []
+        self._offset = 0
+        self._positions: dict[object, int] = {}
+        self._next: asyncio.Task | None = None
+        self._done = False
+        self._error: BaseException | None = None
+
+    @property
+    def joinable(self) -> bool:
+        # A new subscriber has to start at the first page, which is only still held until page 2 arrives.
+        return not self._done and self._offset == 0 and len(self._pages) <= 1
+
+    async def subscribe(self) -> AsyncIterator[list[dict]]:
+        token = object()
+        index = self._offset
+        self._positions[token] = index
+        try:
+            while True:
+                while index >= self._offset + len(self._pages) and not self._done:
+                    await asyncio.wait([self._advance()])
+                if index < self._offset + len(self._pages):
+                    items = self._pages[index - self._offset]
+                    index += 1
+                    self._positions[token] = index
+                    self._trim()
+                    yield items
+                elif self._error is not None:
+                    raise self._error
+                else:
+                    return
+        finally:
+            del self._positions[token]
+            if self._positions:
+                self._trim()
+            elif not self._done:
+                await self._abandon()
+
+    def _trim(self) -> None:
+        read_by_all = min(self._positions.values())
+        if read_by_all > self._offset:
+            del self._pages[: read_by_all - self._offset]
+            self._offset = read_by_all
+
+    def _advance(self) -> asyncio.Task:
+        if self._next is None:
+            self._next = asyncio.create_task(self._pull())
+            self._next.add_done_callback(self._collect)
+        return self._next
+
+    async def _pull(self) -> list[dict] | None:
+        try:
+            return await anext(self._source)
+        except StopAsyncIteration:
+            return None
+
+    def _collect(self, task: asyncio.Task) -> None:
+        self._next = None
+        if task.cancelled():
+            return
+        if task.exception() is not None:
+            self._error = task.exception()
+            self._finish()
+        elif task.result() is None:
+            self._finish()
+        else:
+            self._pages.append(task.result())
+
+    def _finish(self) -> None:
+        self._done = True
+        self._on_finished()
+
+    async def _abandon(self) -> None:
+        self._done = True
+        self._on_finished()
+        if self._next is not None:
+            self._next.cancel()
+            await asyncio.gather(self._next, return_exceptions=True)
+        await self._source.aclose()
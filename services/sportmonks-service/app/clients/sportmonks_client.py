@@ -1,9 +1,20 @@
+import asyncio
 import time
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import aclosing
 
 import httpx
+import orjson
 import structlog
 
+from app.clients.http_client import create_http_client, get_pool_stats
+from app.clients.rate_limiter import RateLimiter, entity_for
+from app.clients.response_cache import CacheEntry, CacheState, ResponseCache
+from app.clients.retry import PageCheckpoint, PaginationAbortedError, RetryBudget, backoff_delay, is_retryable
+from app.clients.single_flight import SharedPages, SingleFlight
 from app.config import settings
+from app.metrics import PAGES_FETCHED, UPSTREAM_REQUEST_DURATION
 
 logger = structlog.get_logger()
 
@@ -12,57 +23,339 @@ class SportMonksClient:
     def __init__(self):
         self.base_url = settings.base_url
         self.api_token = settings.api_key
+        self.per_page = settings.per_page
+        self.page_concurrency = settings.page_concurrency
+        self.rate_limit_retries = settings.rate_limit_retries
+        self.rate_limiter = RateLimiter(
+            limit=settings.rate_limit_per_entity,
+            window_seconds=settings.rate_limit_window_seconds,
+            reserve=settings.rate_limit_reserve,
+            max_wait_seconds=settings.rate_limit_max_wait_seconds,
+        )
+        self.cache = ResponseCache(
+            max_bytes=settings.cache_max_bytes,
+            ttl_seconds=settings.cache_ttl_seconds,
+            stale_seconds=settings.cache_stale_seconds,
+        )
+        self._revalidations: dict[str, asyncio.Task] = {}
+        self._requests = SingleFlight()
+        self._walks: dict[str, SharedPages] = {}
+        self.retry_max_attempts = settings.retry_max_attempts
+        self.retry_budget = settings.retry_budget
+        self.retry_backoff_base = settings.retry_backoff_base
+        self.retry_backoff_max = settings.retry_backoff_max
+        self.checkpoint_ttl_seconds = settings.checkpoint_ttl_seconds
+        self._checkpoints: dict[str, PageCheckpoint] = {}
+        self._client: httpx.AsyncClient | None = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        return self.open()
+
+    def open(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = create_http_client()
+        return self._client
+
+    async def close(self) -> None:
+        for task in self._revalidations.values():
+            task.cancel()
+        await asyncio.gather(*self._revalidations.values(), return_exceptions=True)
+        self._revalidations.clear()
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def pool_stats(self) -> dict:
+        return get_pool_stats(self._client)
+
+    def rate_limit_stats(self) -> dict:
+        return self.rate_limiter.snapshot()
+
+    def cache_stats(self) -> dict:
+        return self.cache.stats()
 
     async def get(self, endpoint: str, params: dict | None = None) -> dict:
-        async with httpx.AsyncClient() as client:
-            request_params = {"api_token": self.api_token}
-            if params:
-                request_params.update(params)
-
-            response = await client.get(
-                f"{self.base_url}/{endpoint}",
-                params=request_params,
+        entity = entity_for(endpoint)
+        key = self.cache.key(endpoint, params)
+        ttl = self.cache.ttl_for(entity)
+        if not ttl:
+            return await self._requests.do(key, lambda: self._fetch(endpoint, params, entity))
+
+        entry, state = self.cache.lookup(key)
+        if state == CacheState.FRESH:
+            return entry.payload
+        if state == CacheState.STALE:
+            self._schedule_revalidation(key, endpoint, params, entity, entry)
+            return entry.payload
+        return await self._requests.do(key, lambda: self._revalidate(key, endpoint, params, entity, entry))
+
+    async def _fetch(self, endpoint: str, params: dict | None, entity: str) -> dict:
+        _, payload = await self._request(endpoint, params, entity)
+        return payload
+
+    async def _revalidate(
+        self,
+        key: str,
+        endpoint: str,
+        params: dict | None,
+        entity: str,
+        entry: CacheEntry | None,
+    ) -> dict:
+        ttl = self.cache.ttl_for(entity)
+        headers = entry.validators() if entry else None
+        response, payload = await self._request(endpoint, params, entity, headers)
+        if payload is None:
+            self.cache.touch(key, ttl)
+            return entry.payload
+
+        self.cache.put(
+            key,
+            payload,
+            size=len(response.content),
+            ttl=ttl,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+        )
+        return payload
+
+    def _schedule_revalidation(
+        self,
+        key: str,
+        endpoint: str,
+        params: dict | None,
+        entity: str,
+        entry: CacheEntry,
+    ) -> None:
+        if key in self._revalidations:
+            return
+
+        task = asyncio.create_task(self._revalidate(key, endpoint, params, entity, entry))
+        self._revalidations[key] = task
+
+        def done(task: asyncio.Task) -> None:
+            self._revalidations.pop(key, None)
+            if not task.cancelled() and task.exception() is not None:
+                logger.warning("cache_revalidation_failed", endpoint=endpoint, error=str(task.exception()))
+
+        task.add_done_callback(done)
+
+    async def _request(
+        self,
+        endpoint: str,
+        params: dict | None,
+        entity: str,
+        headers: dict | None = None,
+    ) -> tuple[httpx.Response, dict | None]:
+        request_params = {"api_token": self.api_token}
+        if params:
+            request_params.update(params)
+
+        for attempt in range(self.rate_limit_retries + 1):
+            await self.rate_limiter.acquire(entity)
+            request_start = time.perf_counter()
+            try:
+                response = await self.client.get(
+                    f"{self.base_url}/{endpoint}",
+                    params=request_params,
+                    headers=headers,
+                )
+            except BaseException:
+                UPSTREAM_REQUEST_DURATION.labels(entity, "error").observe(time.perf_counter() - request_start)
+                await self.rate_limiter.release(entity)
+                raise
+            UPSTREAM_REQUEST_DURATION.labels(entity, str(response.status_code)).observe(
+                time.perf_counter() - request_start
+            )
+
+            if response.status_code == httpx.codes.TOO_MANY_REQUESTS:
+                await self.rate_limiter.release(entity)
+                await self.rate_limiter.exhaust(entity, self._retry_after(response))
+                if attempt < self.rate_limit_retries:
+                    continue
+                response.raise_for_status()
+
+            if response.status_code == httpx.codes.NOT_MODIFIED:
+                await self.rate_limiter.release(entity)
+                return response, None
+
+            try:
+                response.raise_for_status()
+                payload = orjson.loads(response.content)
+            except (httpx.HTTPStatusError, ValueError):
+                await self.rate_limiter.release(entity)
+                raise
+
+            rate_limit = payload.get("rate_limit") or {}
+            await self.rate_limiter.release(
+                entity,
+                remaining=rate_limit.get("remaining"),
+                resets_in_seconds=rate_limit.get("resets_in_seconds"),
             )
-            response.raise_for_status()
-            return response.json()
+            return response, payload
 
     async def get_all_pages(
         self, endpoint: str, params: dict | None = None
     ) -> list[dict]:
-        all_data = []
-        page = 1
-        start = time.perf_counter()
+        key = self.cache.key(endpoint, params)
+        checkpoint = self._take_checkpoint(key)
+        all_data = checkpoint.items if checkpoint else []
+        start_page = checkpoint.next_page if checkpoint else 1
+        if checkpoint:
+            logger.info("pagination_resumed", endpoint=endpoint, page=start_page, items=len(all_data))
 
-        logger.info("pagination_started", endpoint=endpoint)
+        try:
+            async for items in self.iter_pages(endpoint, params, start_page=start_page):
+                all_data.extend(items)
+        except PaginationAbortedError as exc:
+            self._checkpoints[key] = PageCheckpoint(exc.page, all_data, time.monotonic())
+            logger.warning("pagination_checkpointed", endpoint=endpoint, page=exc.page, items=len(all_data))
+            raise
+        return all_data
 
-        while True:
-            page_start = time.perf_counter()
-            page_params = {"per_page": 50, "page": page}
-            if params:
-                page_params.update(params)
+    def _take_checkpoint(self, key: str) -> PageCheckpoint | None:
+        checkpoint = self._checkpoints.pop(key, None)
+        if checkpoint is None or time.monotonic() - checkpoint.created_at > self.checkpoint_ttl_seconds:
+            return None
+        return checkpoint
 
-            response = await self.get(endpoint, params=page_params)
-            items = response["data"]
-            all_data.extend(items)
+    async def iter_pages(
+        self, endpoint: str, params: dict | None = None, start_page: int = 1
+    ) -> AsyncIterator[list[dict]]:
+        key = f"{self.cache.key(endpoint, params)}@{start_page}"
+        walk = self._walks.get(key)
+        if walk is None or not walk.joinable:
+            walk = SharedPages(
+                self._walk_pages(endpoint, params, start_page),
+                on_finished=lambda: self._forget_walk(key, walk),
+            )
+            self._walks[key] = walk
+        else:
+            logger.info("pagination_coalesced", endpoint=endpoint)
 
-            page_duration_ms = int((time.perf_counter() - page_start) * 1000)
-            logger.info("page_fetched", endpoint=endpoint, page=page, items=len(items), duration_ms=page_duration_ms)
+        async with aclosing(walk.subscribe()) as pages:
+            async for items in pages:
+                yield items
 
-            if not response.get("pagination", {}).get("has_more", False):
-                break
+    def _forget_walk(self, key: str, walk: SharedPages) -> None:
+        if self._walks.get(key) is walk:
+            del self._walks[key]
+
+    async def _walk_pages(
+        self, endpoint: str, params: dict | None = None, start_page: int = 1
+    ) -> AsyncIterator[list[dict]]:
+        total_items = 0
+        start = time.perf_counter()
+        budget = RetryBudget(self.retry_budget)
+
+        logger.info("pagination_started", endpoint=endpoint, page=start_page, concurrency=self.page_concurrency)
+
+        try:
+            response = await self._get_page(endpoint, start_page, params, budget)
+        except Exception as exc:
+            raise PaginationAbortedError(endpoint, start_page) from exc
+        items = response.get("data", [])
+        total_items += len(items)
+        last_page = start_page
+        yield items
 
-            page += 1
+        # SportMonks only reports has_more, not a page count, so keep a window of
+        # pages in flight and drop whatever was fetched past the last one. The
+        # window starts at one page and doubles while has_more holds, so short
+        # walks barely overshoot and only long ones reach full concurrency.
+        pending: deque[tuple[int, asyncio.Task]] = deque()
+        next_page = start_page + 1
+        has_more = self._has_more(response)
+        window = 1
+        try:
+            while has_more:
+                while len(pending) < window:
+                    task = asyncio.create_task(self._get_page(endpoint, next_page, params, budget))
+                    pending.append((next_page, task))
+                    next_page += 1
+
+                last_page, task = pending.popleft()
+                try:
+                    response = await task
+                except Exception as exc:
+                    raise PaginationAbortedError(endpoint, last_page) from exc
+                items = response.get("data", [])
+                total_items += len(items)
+                has_more = self._has_more(response)
+                if has_more:
+                    window = min(window * 2, self.page_concurrency)
+                yield items
+        finally:
+            for _, task in pending:
+                task.cancel()
+            await asyncio.gather(*(task for _, task in pending), return_exceptions=True)
 
         total_duration_ms = int((time.perf_counter() - start) * 1000)
         logger.info(
             "pagination_completed",
             endpoint=endpoint,
-            total_pages=page,
-            total_items=len(all_data),
+            total_pages=last_page,
+            total_items=total_items,
             duration_ms=total_duration_ms,
         )
 
-        return all_data
+    async def _get_page(
+        self,
+        endpoint: str,
+        page: int,
+        params: dict | None = None,
+        budget: RetryBudget | None = None,
+    ) -> dict:
+        page_start = time.perf_counter()
+        page_params = {"per_page": self.per_page, "page": page}
+        if params:
+            page_params.update(params)
+
+        attempt = 0
+        while True:
+            try:
+                response = await self.get(endpoint, params=page_params)
+                break
+            except Exception as exc:
+                attempt += 1
+                if attempt >= self.retry_max_attempts or not is_retryable(exc) or not (budget and budget.take()):
+                    raise
+                delay = backoff_delay(attempt - 1, self.retry_backoff_base, self.retry_backoff_max)
+                logger.warning(
+                    "page_retry",
+                    endpoint=endpoint,
+                    page=page,
+                    attempt=attempt,
+                    delay_ms=int(delay * 1000),
+                    error=str(exc) or type(exc).__name__,
+                )
+                await asyncio.sleep(delay)
+
+        PAGES_FETCHED.labels(entity_for(endpoint)).inc()
+        page_duration_ms = int((time.perf_counter() - page_start) * 1000)
+        logger.info(
+            "page_fetched",
+            endpoint=endpoint,
+            page=page,
+            items=len(response.get("data", [])),
+            duration_ms=page_duration_ms,
+        )
+        return response
+
+    @staticmethod
+    def _retry_after(response: httpx.Response) -> float:
+        retry_after = response.headers.get("Retry-After")
+        if retry_after and retry_after.isdigit():
+            return float(retry_after)
+        try:
+            rate_limit = response.json().get("rate_limit") or {}
+        except ValueError:
+            rate_limit = {}
+        return float(rate_limit.get("resets_in_seconds") or 60)
+
+    @staticmethod
+    def _has_more(response: dict) -> bool:
+        return response.get("pagination", {}).get("has_more", False)
 
 
 sportmonks_client = SportMonksClient()
@@ -0,0 +1,133 @@
+import zlib
+from collections.abc import Callable
+
+import zstandard
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.config import settings
+
+# In order of preference when the client accepts both with the same weight.
+ENCODINGS = ("zstd", "gzip")
+# Compressing bigger chunks than this inline would stall the event loop.
+THREADPOOL_MIN_BYTES = 256 * 1024
+
+
+def negotiate(accept_encoding: str) -> str | None:
+    weights: dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        name, *params = (part.strip() for part in item.split(";"))
+        weight = 1.0
+        for param in params:
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    weight = float(value)
+                except ValueError:
+                    weight = 0.0
+        weights[name.lower()] = weight
+
+    best, best_weight = None, 0.0
+    for encoding in ENCODINGS:
+        weight = weights.get(encoding, weights.get("*", 0.0))
+        if weight > best_weight:
+            best, best_weight = encoding, weight
+    return best
+
+
+def gzip_compressor() -> Callable[[bytes, bool], bytes]:
+    compressobj = zlib.compressobj(settings.gzip_level, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+
+    def compress(data: bytes, final: bool) -> bytes:
+        return compressobj.compress(data) + compressobj.flush(zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH)
+
+    return compress
+
+
+def zstd_compressor() -> Callable[[bytes, bool], bytes]:
+    compressobj = zstandard.ZstdCompressor(level=settings.zstd_level).compressobj()
+
+    def compress(data: bytes, final: bool) -> bytes:
+        mode = zstandard.COMPRESSOBJ_FLUSH_FINISH if final else zstandard.COMPRESSOBJ_FLUSH_BLOCK
+        return compressobj.compress(data) + compressobj.flush(mode)
+
+    return compress
+
+
+COMPRESSORS = {"gzip": gzip_compressor, "zstd": zstd_compressor}
+
+
+class CompressionMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        await self.app(scope, receive, CompressingSend(send, encoding))
+
+
+class CompressingSend:
+    def __init__(self, send: Send, encoding: str) -> None:
+        self.send = send
+        self.encoding = encoding
+        self.start: Message | None = None
+        self.compress: Callable[[bytes, bool], bytes] | None = None
+
+    async def __call__(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self.start = message
+            return
+
+        if self.start is not None:
+            start, self.start = self.start, None
+            await self._begin(start, message)
+            return
+
+        if self.compress is None or message["type"] != "http.response.body":
+            await self.send(message)
+            return
+
+        more_body = message.get("more_body", False)
+        body = await self._compress(message.get("body", b""), not more_body)
+        await self.send({"type": "http.response.body", "body": body, "more_body": more_body})
+
+    async def _begin(self, start: Message, message: Message) -> None:
+        headers = MutableHeaders(raw=list(start["headers"]))
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        skip = (
+            message["type"] != "http.response.body"
+            or start["status"] in (204, 206, 304)
+            or "content-encoding" in headers
+            or headers.get("content-type", "").startswith("text/event-stream")
+            or (not more_body and len(body) < settings.compression_minimum_size)
+        )
+        if skip:
+            await self.send(start)
+            await self.send(message)
+            return
+
+        self.compress = COMPRESSORS[self.encoding]()
+        body = await self._compress(body, not more_body)
+        headers["Content-Encoding"] = self.encoding
+        headers.add_vary_header("Accept-Encoding")
+        if more_body:
+            del headers["Content-Length"]
+        else:
+            headers["Content-Length"] = str(len(body))
+        await self.send({**start, "headers": headers.raw})
+        await self.send({"type": "http.response.body", "body": body, "more_body": more_body})
+
+    async def _compress(self, data: bytes, final: bool) -> bytes:
+        if len(data) >= THREADPOOL_MIN_BYTES:
+            return await run_in_threadpool(self.compress, data, final)
+        return self.compress(data, final)
@@ -9,6 +9,38 @@ ENV_FILE = Path(__file__).resolve().parent.parent.parent.parent / ".env"
 class Settings(BaseSettings):
     api_key: str = Field(default="")
     base_url: str = "https://api.sportmonks.com/v3"
+    per_page: int = Field(default=50)
+    page_concurrency: int = Field(default=5, ge=1)
+    http_max_connections: int = Field(default=20)
+    http_max_keepalive_connections: int = Field(default=10)
+    http_keepalive_expiry: float = Field(default=30.0)
+    http2: bool = Field(default=False)
+    rate_limit_per_entity: int = Field(default=3000, ge=1)
+    rate_limit_window_seconds: float = Field(default=3600.0, gt=0)
+    rate_limit_reserve: int = Field(default=0, ge=0)
+    rate_limit_max_wait_seconds: float = Field(default=900.0, ge=0)
+    rate_limit_retries: int = Field(default=2, ge=0)
+    cache_max_bytes: int = Field(default=64 * 1024 * 1024, ge=0)
+    cache_ttl_seconds: dict[str, float] = Field(default={"leagues": 3600.0, "teams": 3600.0, "fixtures": 0.0})
+    cache_stale_seconds: float = Field(default=600.0, ge=0)
+    retry_max_attempts: int = Field(default=4, ge=1)
+    retry_budget: int = Field(default=20, ge=0)
+    retry_backoff_base: float = Field(default=0.5, ge=0)
+    retry_backoff_max: float = Field(default=10.0, ge=0)
+    checkpoint_ttl_seconds: float = Field(default=900.0, ge=0)
+    sportmonks_select_fields: bool = Field(default=True)
+    max_batch_ids: int = Field(default=1000, ge=1)
+    multi_ids_per_request: int = Field(default=50, ge=1)
+    compression_minimum_size: int = Field(default=1024, ge=0)
+    gzip_level: int = Field(default=6, ge=1, le=9)
+    zstd_level: int = Field(default=3, ge=1, le=22)
+    # /fixtures/latest only returns fixtures updated in the last 10 seconds.
+    fixtures_latest_window_seconds: float = Field(default=10.0, ge=0)
+    fixtures_delta_max_age_seconds: float = Field(default=3600.0, ge=0)
+    fixtures_delta_margin_seconds: float = Field(default=3 * 3600.0, ge=0)
+    fixtures_lookback_days: int = Field(default=1, ge=0)
+    fixtures_lookahead_days: int = Field(default=14, ge=0)
+    fixtures_between_max_days: int = Field(default=100, ge=1)
     model_config = {
         "env_file": ENV_FILE if ENV_FILE.exists() else None,
         "extra": "ignore",
@@ -1,14 +1,60 @@
-from fastapi import APIRouter
+from datetime import date
+from typing import Annotated
 
-from app.models.fixture import Fixture
+from fastapi import APIRouter, Header, HTTPException, Query
+from fastapi.responses import Response
+
+from app.models.batch import BatchLookupRequest
+from app.models.fixture import (
+    Fixture,
+    FixtureBatch,
+    FixtureFilters,
+    FixtureList,
+    UpdatedFixturesQuery,
+)
+from app.responses import json_response, ndjson_response, wants_ndjson
 from app.services.fixture_service import fixture_service
 
 router = APIRouter(prefix="/fixtures", tags=["fixtures"])
 
 
 @router.get("", response_model=list[Fixture])
-async def get_fixtures() -> list[Fixture]:
-    return await fixture_service.get_all_fixtures()
+async def get_fixtures(
+    filters: Annotated[FixtureFilters, Query()],
+    accept: str | None = Header(default=None),
+) -> Response:
+    if wants_ndjson(accept):
+        return ndjson_response(fixture_service.stream_fixtures(filters))
+    return json_response(FixtureList, await fixture_service.get_all_fixtures(filters))
+
+
+@router.get("/latest", response_model=list[Fixture])
+async def get_latest_fixtures(filters: Annotated[FixtureFilters, Query()]) -> Response:
+    return json_response(FixtureList, await fixture_service.get_latest_fixtures(filters))
+
+
+@router.get("/updated", response_model=list[Fixture])
+async def get_updated_fixtures(query: Annotated[UpdatedFixturesQuery, Query()]) -> Response:
+    return json_response(FixtureList, await fixture_service.get_fixtures_updated_since(query.since, query))
+
+
+@router.get("/between/{start_date}/{end_date}", response_model=list[Fixture])
+async def get_fixtures_between(
+    start_date: date,
+    end_date: date,
+    filters: Annotated[FixtureFilters, Query()],
+    accept: str | None = Header(default=None),
+) -> Response:
+    if start_date > end_date:
+        raise HTTPException(status_code=422, detail="start_date must not be after end_date")
+    if wants_ndjson(accept):
+        return ndjson_response(fixture_service.stream_fixtures_between(start_date, end_date, filters))
+    return json_response(FixtureList, await fixture_service.get_fixtures_between(start_date, end_date, filters))
+
+
+@router.post("/batch", response_model=FixtureBatch)
+async def get_fixtures_batch(request: BatchLookupRequest) -> FixtureBatch:
+    return await fixture_service.get_fixtures_by_ids(request.ids)
 
 
 @router.get("/{fixture_id}", response_model=Fixture)
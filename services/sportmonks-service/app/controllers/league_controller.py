@@ -1,14 +1,29 @@
-from fastapi import APIRouter
+from typing import Annotated
 
-from app.models.league import League
+from fastapi import APIRouter, Header, Query
+from fastapi.responses import Response
+
+from app.models.batch import BatchLookupRequest
+from app.models.league import League, LeagueBatch, LeagueFilters, LeagueList
+from app.responses import json_response, ndjson_response, wants_ndjson
 from app.services.league_service import league_service
 
 router = APIRouter(prefix="/leagues", tags=["leagues"])
 
 
 @router.get("", response_model=list[League])
-async def get_leagues() -> list[League]:
-    return await league_service.get_all_leagues()
+async def get_leagues(
+    filters: Annotated[LeagueFilters, Query()],
+    accept: str | None = Header(default=None),
+) -> Response:
+    if wants_ndjson(accept):
+        return ndjson_response(league_service.stream_leagues(filters))
+    return json_response(LeagueList, await league_service.get_all_leagues(filters))
+
+
+@router.post("/batch", response_model=LeagueBatch)
+async def get_leagues_batch(request: BatchLookupRequest) -> LeagueBatch:
+    return await league_service.get_leagues_by_ids(request.ids)
 
 
 @router.get("/{league_id}", response_model=League)
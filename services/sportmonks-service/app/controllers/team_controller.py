@@ -1,14 +1,29 @@
-from fastapi import APIRouter
+from typing import Annotated
 
-from app.models.team import Team
+from fastapi import APIRouter, Header, Query
+from fastapi.responses import Response
+
+from app.models.batch import BatchLookupRequest
+from app.models.team import Team, TeamBatch, TeamFilters, TeamList
+from app.responses import json_response, ndjson_response, wants_ndjson
 from app.services.team_service import team_service
 
 router = APIRouter(prefix="/teams", tags=["teams"])
 
 
 @router.get("", response_model=list[Team])
-async def get_teams() -> list[Team]:
-    return await team_service.get_all_teams()
+async def get_teams(
+    filters: Annotated[TeamFilters, Query()],
+    accept: str | None = Header(default=None),
+) -> Response:
+    if wants_ndjson(accept):
+        return ndjson_response(team_service.stream_teams(filters))
+    return json_response(TeamList, await team_service.get_all_teams(filters))
+
+
+@router.post("/batch", response_model=TeamBatch)
+async def get_teams_batch(request: BatchLookupRequest) -> TeamBatch:
+    return await team_service.get_teams_by_ids(request.ids)
 
 
 @router.get("/{team_id}", response_model=Team)
@@ -1,15 +1,58 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
 
+import httpx
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+from app.clients.rate_limiter import RateLimitExhaustedError
+from app.clients.retry import PaginationAbortedError, is_retryable
+from app.clients.sportmonks_client import sportmonks_client
+from app.compression import CompressionMiddleware
 from app.controllers import fixture_controller, league_controller, team_controller
 from app.logging import configure_logging
+from app.metrics import MetricsMiddleware, metrics_response, register_pool, register_rate_limit
 
 configure_logging()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    sportmonks_client.open()
+    yield
+    await sportmonks_client.close()
+
+
 app = FastAPI(
     title="SportMonks Service",
     description="Service for interacting with SportMonks API",
     version="0.1.0",
+    lifespan=lifespan,
 )
+app.add_middleware(CompressionMiddleware)
+app.add_middleware(MetricsMiddleware)
+register_pool("sportmonks", sportmonks_client.pool_stats)
+register_rate_limit(sportmonks_client.rate_limit_stats)
+
+
+@app.exception_handler(RateLimitExhaustedError)
+async def rate_limit_exhausted_handler(request: Request, exc: RateLimitExhaustedError) -> JSONResponse:
+    return JSONResponse(
+        status_code=429,
+        content={"detail": str(exc)},
+        headers={"Retry-After": str(int(exc.retry_after) + 1)},
+    )
+
+
+@app.exception_handler(PaginationAbortedError)
+async def pagination_aborted_handler(request: Request, exc: PaginationAbortedError) -> JSONResponse:
+    if isinstance(exc.__cause__, RateLimitExhaustedError):
+        return await rate_limit_exhausted_handler(request, exc.__cause__)
+    content = {"detail": str(exc), "endpoint": exc.endpoint, "resume_page": exc.page}
+    # Retrying will not fix a page upstream rejected outright, so pass its status through.
+    if isinstance(exc.__cause__, httpx.HTTPStatusError) and not is_retryable(exc.__cause__):
+        return JSONResponse(status_code=exc.__cause__.response.status_code, content=content)
+    return JSONResponse(status_code=503, content=content, headers={"Retry-After": "5"})
+
 
 app.include_router(fixture_controller.router)
 app.include_router(league_controller.router)
@@ -19,3 +62,23 @@ app.include_router(team_controller.router)
 @app.get("/health")
 async def health_check():
     return {"status": "healthy"}
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    return metrics_response()
+
+
+@app.get("/health/pool")
+async def pool_stats():
+    return {"sportmonks": sportmonks_client.pool_stats()}
+
+
+@app.get("/health/rate-limit")
+async def rate_limit_stats():
+    return {"sportmonks": sportmonks_client.rate_limit_stats()}
+
+
+@app.get("/health/cache")
+async def cache_stats():
+    return {"sportmonks": sportmonks_client.cache_stats()}
@@ -0,0 +1,111 @@
+import time
+from collections.abc import Callable
+
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, Counter, Gauge, Histogram, generate_latest
+from prometheus_client.core import GaugeMetricFamily
+from prometheus_client.registry import Collector
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds", "Time spent handling HTTP requests.", ["method", "route", "status"]
+)
+REQUESTS_IN_FLIGHT = Gauge("http_requests_in_flight", "HTTP requests currently being handled.", ["method"])
+UPSTREAM_REQUEST_DURATION = Histogram(
+    "sportmonks_request_duration_seconds", "Time spent on SportMonks API calls.", ["entity", "status"]
+)
+PAGES_FETCHED = Counter("sportmonks_pages_fetched_total", "Pages fetched from the SportMonks API.", ["entity"])
+
+
+class MetricsMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        in_flight = REQUESTS_IN_FLIGHT.labels(method)
+        in_flight.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            in_flight.dec()
+            # Label by route template rather than raw path to keep cardinality bounded.
+            route = getattr(scope.get("route"), "path", "unmatched")
+            REQUEST_DURATION.labels(method, route, str(status_code)).observe(time.perf_counter() - start)
+
+
+class PoolCollector(Collector):
+    def __init__(self) -> None:
+        self.pools: dict[str, Callable[[], dict]] = {}
+
+    def collect(self):
+        connections = GaugeMetricFamily(
+            "http_client_pool_connections", "Connections held by the outbound HTTP pool.", labels=["pool", "state"]
+        )
+        requests = GaugeMetricFamily(
+            "http_client_pool_requests", "Requests using or queued on the outbound HTTP pool.", labels=["pool", "state"]
+        )
+        for name, stats_for in self.pools.items():
+            stats = stats_for()
+            connections.add_metric([name, "active"], stats["active_connections"])
+            connections.add_metric([name, "idle"], stats["idle_connections"])
+            requests.add_metric([name, "active"], stats["active_requests"])
+            requests.add_metric([name, "queued"], stats["queued_requests"])
+        yield connections
+        yield requests
+
+
+pool_collector = PoolCollector()
+REGISTRY.register(pool_collector)
+
+
+def register_pool(name: str, stats: Callable[[], dict]) -> None:
+    pool_collector.pools[name] = stats
+
+
+class RateLimitCollector(Collector):
+    def __init__(self) -> None:
+        self.stats: Callable[[], dict] | None = None
+
+    def collect(self):
+        remaining = GaugeMetricFamily(
+            "sportmonks_rate_limit_remaining", "Calls left in the current SportMonks window.", labels=["entity"]
+        )
+        in_flight = GaugeMetricFamily(
+            "sportmonks_rate_limit_in_flight", "SportMonks calls holding a rate limit slot.", labels=["entity"]
+        )
+        resets_in = GaugeMetricFamily(
+            "sportmonks_rate_limit_resets_in_seconds", "Seconds until the SportMonks window resets.", labels=["entity"]
+        )
+        for entity, budget in (self.stats() if self.stats else {}).items():
+            remaining.add_metric([entity], budget["remaining"])
+            in_flight.add_metric([entity], budget["in_flight"])
+            resets_in.add_metric([entity], budget["resets_in_seconds"])
+        yield remaining
+        yield in_flight
+        yield resets_in
+
+
+rate_limit_collector = RateLimitCollector()
+REGISTRY.register(rate_limit_collector)
+
+
+def register_rate_limit(stats: Callable[[], dict]) -> None:
+    rate_limit_collector.stats = stats
+
+
+def metrics_response() -> Response:
+    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
@@ -1,4 +1,6 @@
-from pydantic import BaseModel
+from datetime import datetime
+
+from pydantic import BaseModel, Field, TypeAdapter
 
 
 class Fixture(BaseModel):
@@ -23,5 +25,28 @@ class Fixture(BaseModel):
     starting_at_timestamp: int | None = None
 
 
+FixtureList = TypeAdapter(list[Fixture])
+
+
 class FixtureResponse(BaseModel):
     data: list[Fixture]
+
+
+class FixtureBatch(BaseModel):
+    data: list[Fixture]
+    missing: list[int]
+
+
+class FixtureFilters(BaseModel):
+    league_ids: list[int] = Field(default_factory=list)
+    season_ids: list[int] = Field(default_factory=list)
+
+    def upstream(self) -> dict[str, list[int]]:
+        return {
+            "fixtureLeagues": self.league_ids,
+            "fixtureSeasons": self.season_ids,
+        }
+
+
+class UpdatedFixturesQuery(FixtureFilters):
+    since: datetime
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, TypeAdapter
 
 
 class League(BaseModel):
@@ -16,5 +16,22 @@ class League(BaseModel):
     has_jerseys: bool | None = None
 
 
+LeagueList = TypeAdapter(list[League])
+
+
 class LeagueResponse(BaseModel):
     data: list[League]
+
+
+class LeagueBatch(BaseModel):
+    data: list[League]
+    missing: list[int]
+
+
+class LeagueFilters(BaseModel):
+    country_ids: list[int] = Field(default_factory=list)
+
+    def upstream(self) -> dict[str, list[int]]:
+        return {
+            "leagueCountries": self.country_ids,
+        }
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, TypeAdapter
 
 
 class Team(BaseModel):
@@ -16,5 +16,22 @@ class Team(BaseModel):
     last_played_at: str | None = None
 
 
+TeamList = TypeAdapter(list[Team])
+
+
 class TeamResponse(BaseModel):
     data: list[Team]
+
+
+class TeamBatch(BaseModel):
+    data: list[Team]
+    missing: list[int]
+
+
+class TeamFilters(BaseModel):
+    country_ids: list[int] = Field(default_factory=list)
+
+    def upstream(self) -> dict[str, list[int]]:
+        return {
+            "teamCountries": self.country_ids,
+        }
@@ -0,0 +1,26 @@
+from collections.abc import AsyncIterator
+from typing import Any
+
+from fastapi.responses import Response, StreamingResponse
+from pydantic import BaseModel, TypeAdapter
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+def wants_ndjson(accept: str | None) -> bool:
+    return NDJSON_MEDIA_TYPE in (accept or "")
+
+
+def ndjson_response(pages: AsyncIterator[list[BaseModel]]) -> StreamingResponse:
+    async def body() -> AsyncIterator[bytes]:
+        async for models in pages:
+            if models:
+                yield b"".join(model.model_dump_json().encode() + b"\n" for model in models)
+
+    return StreamingResponse(body(), media_type=NDJSON_MEDIA_TYPE)
+
+
+def json_response(adapter: TypeAdapter, value: Any) -> Response:
+    # Already validated by the service; rendering here stops FastAPI from
+    # validating the response_model a second time.
+    return Response(content=adapter.dump_json(value), media_type="application/json")
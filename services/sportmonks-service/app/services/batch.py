@@ -0,0 +1,29 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+
+import httpx
+from pydantic import BaseModel
+
+
+async def fetch_each(
+    ids: list[int], fetch: Callable[[int], Awaitable[BaseModel | None]], concurrency: int
+) -> dict[int, BaseModel]:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def fetch_one(record_id: int) -> BaseModel | None:
+        async with semaphore:
+            try:
+                return await fetch(record_id)
+            except httpx.HTTPStatusError as exc:
+                if exc.response.status_code == httpx.codes.NOT_FOUND:
+                    return None
+                raise
+
+    results = await asyncio.gather(*(fetch_one(record_id) for record_id in ids))
+    return {record_id: result for record_id, result in zip(ids, results, strict=True) if result is not None}
+
+
+def in_request_order(ids: list[int], found: dict[int, BaseModel]) -> tuple[list[BaseModel], list[int]]:
+    data = [found[record_id] for record_id in ids if record_id in found]
+    missing = [record_id for record_id in ids if record_id not in found]
+    return data, missing
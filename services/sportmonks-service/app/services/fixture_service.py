@@ -1,9 +1,15 @@
+import asyncio
 import time
+from collections.abc import AsyncIterator
+from datetime import UTC, date, datetime, timedelta
 
 import structlog
 
+from app.clients.query import query_params
 from app.clients.sportmonks_client import sportmonks_client
-from app.models.fixture import Fixture
+from app.config import settings
+from app.models.fixture import Fixture, FixtureBatch, FixtureFilters, FixtureList
+from app.services.batch import in_request_order
 
 logger = structlog.get_logger()
 
@@ -12,20 +18,126 @@ class FixtureService:
     def __init__(self):
         self.url_suffix = "football/fixtures"
 
-    async def get_all_fixtures(self) -> list[Fixture]:
+    async def get_all_fixtures(self, filters: FixtureFilters | None = None) -> list[Fixture]:
         logger.info("fetch_started", entity="fixtures")
         start = time.perf_counter()
 
-        data = await sportmonks_client.get_all_pages(self.url_suffix)
-        fixtures = [Fixture(**item) for item in data]
+        data = await sportmonks_client.get_all_pages(self.url_suffix, self._params(filters))
+        fixtures = FixtureList.validate_python(data)
 
         duration_ms = int((time.perf_counter() - start) * 1000)
         logger.info("fetch_completed", entity="fixtures", records=len(fixtures), duration_ms=duration_ms)
         return fixtures
 
+    async def stream_fixtures(self, filters: FixtureFilters | None = None) -> AsyncIterator[list[Fixture]]:
+        logger.info("stream_started", entity="fixtures")
+        start = time.perf_counter()
+        records = 0
+
+        async for items in sportmonks_client.iter_pages(self.url_suffix, self._params(filters)):
+            fixtures = FixtureList.validate_python(items)
+            records += len(fixtures)
+            yield fixtures
+
+        duration_ms = int((time.perf_counter() - start) * 1000)
+        logger.info("stream_completed", entity="fixtures", records=records, duration_ms=duration_ms)
+
+    async def get_latest_fixtures(self, filters: FixtureFilters | None = None) -> list[Fixture]:
+        return await self._get_fixtures(f"{self.url_suffix}/latest", source="latest", filters=filters)
+
+    async def get_fixtures_between(
+        self, start_date: date, end_date: date, filters: FixtureFilters | None = None
+    ) -> list[Fixture]:
+        fixtures: dict[int, Fixture] = {}
+        for window_start, window_end in self._date_windows(start_date, end_date):
+            endpoint = f"{self.url_suffix}/between/{window_start.isoformat()}/{window_end.isoformat()}"
+            for fixture in await self._get_fixtures(endpoint, source="between", filters=filters):
+                fixtures[fixture.id] = fixture
+        return list(fixtures.values())
+
+    async def stream_fixtures_between(
+        self, start_date: date, end_date: date, filters: FixtureFilters | None = None
+    ) -> AsyncIterator[list[Fixture]]:
+        for window_start, window_end in self._date_windows(start_date, end_date):
+            endpoint = f"{self.url_suffix}/between/{window_start.isoformat()}/{window_end.isoformat()}"
+            async for items in sportmonks_client.iter_pages(endpoint, self._params(filters)):
+                yield FixtureList.validate_python(items)
+
+    async def get_fixtures_updated_since(
+        self, since: datetime, filters: FixtureFilters | None = None
+    ) -> list[Fixture]:
+        now = datetime.now(UTC)
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=UTC)
+
+        # The latest endpoint only covers the last few seconds of updates.
+        age = now - since
+        if age <= timedelta(seconds=settings.fixtures_latest_window_seconds):
+            return await self.get_latest_fixtures(filters)
+
+        # A watermark from the last live poll: recent updates are almost all to fixtures in play,
+        # so read the kickoffs around the gap plus whatever else /latest still has.
+        if age <= timedelta(seconds=settings.fixtures_delta_max_age_seconds):
+            margin = timedelta(seconds=settings.fixtures_delta_margin_seconds)
+            recent, latest = await asyncio.gather(
+                self.get_fixtures_between((since - margin).date(), (now + margin).date(), filters),
+                self.get_latest_fixtures(filters),
+            )
+            return list({fixture.id: fixture for fixture in [*recent, *latest]}.values())
+
+        # Older watermarks re-read the fixtures around the window where changes happen.
+        start_date = since.date() - timedelta(days=settings.fixtures_lookback_days)
+        end_date = now.date() + timedelta(days=settings.fixtures_lookahead_days)
+        return await self.get_fixtures_between(start_date, end_date, filters)
+
+    async def _get_fixtures(self, endpoint: str, source: str, filters: FixtureFilters | None = None) -> list[Fixture]:
+        logger.info("fetch_started", entity="fixtures", source=source)
+        start = time.perf_counter()
+
+        data = await sportmonks_client.get_all_pages(endpoint, self._params(filters))
+        fixtures = FixtureList.validate_python(data)
+
+        duration_ms = int((time.perf_counter() - start) * 1000)
+        logger.info(
+            "fetch_completed", entity="fixtures", source=source, records=len(fixtures), duration_ms=duration_ms
+        )
+        return fixtures
+
+    @staticmethod
+    def _date_windows(start_date: date, end_date: date) -> list[tuple[date, date]]:
+        windows = []
+        max_days = timedelta(days=settings.fixtures_between_max_days - 1)
+        while start_date <= end_date:
+            window_end = min(start_date + max_days, end_date)
+            windows.append((start_date, window_end))
+            start_date = window_end + timedelta(days=1)
+        return windows
+
     async def get_fixture_by_id(self, fixture_id: int) -> Fixture:
-        response = await sportmonks_client.get(f"{self.url_suffix}/{fixture_id}")
+        response = await sportmonks_client.get(f"{self.url_suffix}/{fixture_id}", query_params(Fixture))
         return Fixture(**response["data"])
 
+    async def get_fixtures_by_ids(self, ids: list[int]) -> FixtureBatch:
+        ids = list(dict.fromkeys(ids))
+        chunk_size = settings.multi_ids_per_request
+        chunks = [ids[start : start + chunk_size] for start in range(0, len(ids), chunk_size)]
+        responses = await asyncio.gather(
+            *(
+                sportmonks_client.get(f"{self.url_suffix}/multi/{','.join(map(str, chunk))}", query_params(Fixture))
+                for chunk in chunks
+            )
+        )
+        found = {
+            fixture.id: fixture
+            for response in responses
+            for fixture in FixtureList.validate_python(response.get("data") or [])
+        }
+        data, missing = in_request_order(ids, found)
+        return FixtureBatch(data=data, missing=missing)
+
+    @staticmethod
+    def _params(filters: FixtureFilters | None) -> dict:
+        return query_params(Fixture, filters.upstream() if filters else None)
+
 
 fixture_service = FixtureService()
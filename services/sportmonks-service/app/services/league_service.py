@@ -1,9 +1,13 @@
 import time
+from collections.abc import AsyncIterator
 
 import structlog
 
+from app.clients.query import query_params
 from app.clients.sportmonks_client import sportmonks_client
-from app.models.league import League
+from app.config import settings
+from app.models.league import League, LeagueBatch, LeagueFilters, LeagueList
+from app.services.batch import fetch_each, in_request_order
 
 logger = structlog.get_logger()
 
@@ -12,20 +16,48 @@ class LeagueService:
     def __init__(self):
         self.url_suffix = "football/leagues"
 
-    async def get_all_leagues(self) -> list[League]:
+    async def get_all_leagues(self, filters: LeagueFilters | None = None) -> list[League]:
         logger.info("fetch_started", entity="leagues")
         start = time.perf_counter()
 
-        data = await sportmonks_client.get_all_pages(self.url_suffix)
-        leagues = [League(**item) for item in data]
+        data = await sportmonks_client.get_all_pages(self.url_suffix, self._params(filters))
+        leagues = LeagueList.validate_python(data)
 
         duration_ms = int((time.perf_counter() - start) * 1000)
         logger.info("fetch_completed", entity="leagues", records=len(leagues), duration_ms=duration_ms)
         return leagues
 
+    async def stream_leagues(self, filters: LeagueFilters | None = None) -> AsyncIterator[list[League]]:
+        logger.info("stream_started", entity="leagues")
+        start = time.perf_counter()
+        records = 0
+
+        async for items in sportmonks_client.iter_pages(self.url_suffix, self._params(filters)):
+            leagues = LeagueList.validate_python(items)
+            records += len(leagues)
+            yield leagues
+
+        duration_ms = int((time.perf_counter() - start) * 1000)
+        logger.info("stream_completed", entity="leagues", records=records, duration_ms=duration_ms)
+
     async def get_league_by_id(self, league_id: int) -> League:
-        response = await sportmonks_client.get(f"{self.url_suffix}/{league_id}")
+        response = await sportmonks_client.get(f"{self.url_suffix}/{league_id}", query_params(League))
         return League(**response["data"])
 
+    async def get_leagues_by_ids(self, ids: list[int]) -> LeagueBatch:
+        # SportMonks has no multi-ID endpoint for leagues, so look each one up with page-fetch concurrency.
+        ids = list(dict.fromkeys(ids))
+        found = await fetch_each(ids, self._find_league, settings.page_concurrency)
+        data, missing = in_request_order(ids, found)
+        return LeagueBatch(data=data, missing=missing)
+
+    async def _find_league(self, league_id: int) -> League | None:
+        response = await sportmonks_client.get(f"{self.url_suffix}/{league_id}", query_params(League))
+        return League(**response["data"]) if response.get("data") else None
+
+    @staticmethod
+    def _params(filters: LeagueFilters | None) -> dict:
+        return query_params(League, filters.upstream() if filters else None)
+
 
 league_service = LeagueService()
@@ -1,9 +1,13 @@
 import time
+from collections.abc import AsyncIterator
 
 import structlog
 
+from app.clients.query import query_params
 from app.clients.sportmonks_client import sportmonks_client
-from app.models.team import Team
+from app.config import settings
+from app.models.team import Team, TeamBatch, TeamFilters, TeamList
+from app.services.batch import fetch_each, in_request_order
 
 logger = structlog.get_logger()
 
@@ -12,20 +16,48 @@ class TeamService:
     def __init__(self) -> None:
         self.url_suffix = "football/teams"
 
-    async def get_all_teams(self) -> list[Team]:
+    async def get_all_teams(self, filters: TeamFilters | None = None) -> list[Team]:
         logger.info("fetch_started", entity="teams")
         start = time.perf_counter()
 
-        data = await sportmonks_client.get_all_pages(self.url_suffix)
-        teams = [Team(**item) for item in data]
+        data = await sportmonks_client.get_all_pages(self.url_suffix, self._params(filters))
+        teams = TeamList.validate_python(data)
 
         duration_ms = int((time.perf_counter() - start) * 1000)
         logger.info("fetch_completed", entity="teams", records=len(teams), duration_ms=duration_ms)
         return teams
 
+    async def stream_teams(self, filters: TeamFilters | None = None) -> AsyncIterator[list[Team]]:
+        logger.info("stream_started", entity="teams")
+        start = time.perf_counter()
+        records = 0
+
+        async for items in sportmonks_client.iter_pages(self.url_suffix, self._params(filters)):
+            teams = TeamList.validate_python(items)
+            records += len(teams)
+            yield teams
+
+        duration_ms = int((time.perf_counter() - start) * 1000)
+        logger.info("stream_completed", entity="teams", records=records, duration_ms=duration_ms)
+
     async def get_team_by_id(self, team_id: int) -> Team:
-        response = await sportmonks_client.get(f"{self.url_suffix}/{team_id}")
+        response = await sportmonks_client.get(f"{self.url_suffix}/{team_id}", query_params(Team))
         return Team(**response["data"])
 
+    async def get_teams_by_ids(self, ids: list[int]) -> TeamBatch:
+        # SportMonks has no multi-ID endpoint for teams, so look each one up with page-fetch concurrency.
+        ids = list(dict.fromkeys(ids))
+        found = await fetch_each(ids, self._find_team, settings.page_concurrency)
+        data, missing = in_request_order(ids, found)
+        return TeamBatch(data=data, missing=missing)
+
+    async def _find_team(self, team_id: int) -> Team | None:
+        response = await sportmonks_client.get(f"{self.url_suffix}/{team_id}", query_params(Team))
+        return Team(**response["data"]) if response.get("data") else None
+
+    @staticmethod
+    def _params(filters: TeamFilters | None) -> dict:
+        return query_params(Team, filters.upstream() if filters else None)
+
 
 team_service = TeamService()
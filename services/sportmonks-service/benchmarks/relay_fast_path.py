@@ -0,0 +1,78 @@
+import argparse
+import asyncio
+import json
+import time
+
+import orjson
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from app.models.fixture import Fixture, FixtureList
+
+
+def fixture(fixture_id: int) -> dict:
+    return {
+        "id": fixture_id,
+        "sport_id": 1,
+        "league_id": 8,
+        "season_id": 23614,
+        "stage_id": 77471288,
+        "group_id": None,
+        "aggregate_id": None,
+        "round_id": 339235,
+        "state_id": 5,
+        "venue_id": 204,
+        "name": "Manchester United vs Fulham",
+        "starting_at": "2024-08-16 19:00:00",
+        "result_info": "Manchester United won after full-time.",
+        "leg": "1/1",
+        "details": None,
+        "length": 90,
+        "placeholder": False,
+        "has_odds": True,
+        "starting_at_timestamp": 1723834800,
+    }
+
+
+async def relay_baseline(body: bytes, response_field) -> bytes:
+    # httpx Response.json(), one Fixture(**item) per record, then FastAPI
+    # validating and serializing the response_model.
+    data = json.loads(body)["data"]
+    fixtures = [Fixture(**item) for item in data]
+    return await serialize_response(field=response_field, response_content=fixtures, dump_json=True)
+
+
+async def relay_fast_path(body: bytes) -> bytes:
+    data = orjson.loads(body)["data"]
+    fixtures = FixtureList.validate_python(data)
+    return FixtureList.dump_json(fixtures)
+
+
+async def measure(label: str, fn, records: int, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.process_time()
+        await fn()
+        best = min(best, time.process_time() - start)
+    per_record_us = best / records * 1_000_000
+    print(f"{label:>10}: {best * 1000:8.1f} ms CPU  {per_record_us:6.2f} us/record")
+    return per_record_us
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="CPU cost of relaying SportMonks fixture pages")
+    parser.add_argument("--records", type=int, default=50_000, help="Fixtures in the relayed payload")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per variant; the best is reported")
+    args = parser.parse_args()
+
+    body = orjson.dumps({"data": [fixture(i) for i in range(args.records)]})
+    response_field = create_model_field(name="Response_get_fixtures", type_=list[Fixture], mode="serialization")
+    assert orjson.loads(await relay_baseline(body, response_field)) == orjson.loads(await relay_fast_path(body))
+
+    baseline = await measure("baseline", lambda: relay_baseline(body, response_field), args.records, args.repeat)
+    fast = await measure("fast path", lambda: relay_fast_path(body), args.records, args.repeat)
+    print(f"{'saved':>10}: {baseline - fast:6.2f} us/record ({(1 - fast / baseline) * 100:.0f}%)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,47 @@
+import json
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+
+@pytest.fixture
+def many_fixtures(mock_fixture_data):
+    return [{**mock_fixture_data, "id": mock_fixture_data["id"] + index} for index in range(20)]
+
+
+@pytest.mark.parametrize("accept_encoding,expected", [("gzip, deflate, zstd", "zstd"), ("gzip", "gzip")])
+def test_list_response_is_compressed(client, many_fixtures, accept_encoding, expected):
+    with patch("app.services.fixture_service.sportmonks_client") as mock_client:
+        mock_client.get_all_pages = AsyncMock(return_value=many_fixtures)
+
+        response = client.get("/fixtures", headers={"Accept-Encoding": accept_encoding})
+
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == expected
+    assert int(response.headers["content-length"]) < len(response.content)
+    assert len(response.json()) == 20
+
+
+def test_uncompressed_without_accept_encoding(client, many_fixtures):
+    with patch("app.services.fixture_service.sportmonks_client") as mock_client:
+        mock_client.get_all_pages = AsyncMock(return_value=many_fixtures)
+
+        response = client.get("/fixtures", headers={"Accept-Encoding": "identity"})
+
+    assert "content-encoding" not in response.headers
+    assert len(response.json()) == 20
+
+
+def test_ndjson_stream_is_compressed_per_page(client, many_fixtures):
+    async def iter_pages(endpoint, params=None):
+        yield many_fixtures[:10]
+        yield many_fixtures[10:]
+
+    with patch("app.services.fixture_service.sportmonks_client") as mock_client:
+        mock_client.iter_pages = iter_pages
+
+        response = client.get("/fixtures", headers={"Accept": "application/x-ndjson", "Accept-Encoding": "zstd"})
+
+    assert response.headers["content-encoding"] == "zstd"
+    assert "content-length" not in response.headers
+    assert [json.loads(line)["id"] for line in response.text.splitlines()] == [f["id"] for f in many_fixtures]
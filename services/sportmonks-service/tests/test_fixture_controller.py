@@ -1,5 +1,13 @@
+import json
 from unittest.mock import AsyncMock, patch
 
+import httpx
+import pytest
+
+from app.clients.query import select_fields
+from app.clients.retry import PaginationAbortedError
+from app.models.fixture import Fixture
+
 
 class TestGetFixtures:
     def test_returns_list_of_fixtures(self, client, mock_fixtures_response, mock_fixture_data):
@@ -20,7 +28,85 @@ class TestGetFixtures:
 
             client.get("/fixtures")
 
-            mock_client.get_all_pages.assert_called_once_with("football/fixtures")
+            mock_client.get_all_pages.assert_called_once_with("football/fixtures", {"select": select_fields(Fixture)})
+
+    def test_passes_filters_upstream(self, client, mock_fixtures_response):
+        with patch("app.services.fixture_service.sportmonks_client") as mock_client:
+            mock_client.get_all_pages = AsyncMock(return_value=mock_fixtures_response)
+
+            response = client.get("/fixtures", params={"league_ids": [8, 9], "season_ids": 23614})
+
+            assert response.status_code == 200
+            params = mock_client.get_all_pages.call_args.args[1]
+            assert params["filters"] == "fixtureLeagues:8,9;fixtureSeasons:23614"
+            assert params["select"] == select_fields(Fixture)
+
+    @pytest.mark.parametrize("upstream_status,status,retry_after", [(503, 503, "5"), (404, 404, None)])
+    def test_aborted_pagination_status_follows_cause(self, client, upstream_status, status, retry_after):
+        request = httpx.Request("GET", "https://api.sportmonks.com/v3/football/fixtures")
+        cause = httpx.HTTPStatusError("failed", request=request, response=httpx.Response(upstream_status))
+        aborted = PaginationAbortedError("football/fixtures", 3)
+        aborted.__cause__ = cause
+
+        with patch("app.services.fixture_service.sportmonks_client") as mock_client:
+            mock_client.get_all_pages = AsyncMock(side_effect=aborted)
+
+            response = client.get("/fixtures")
+
+        assert response.status_code == status
+        assert response.headers.get("retry-after") == retry_after
+        assert response.json()["resume_page"] == 3
+
+    def test_streams_ndjson_when_requested(self, client, mock_fixture_data):
+        second_fixture = {**mock_fixture_data, "id": 19134031}
+
+        async def iter_pages(endpoint, params=None):
+            yield [mock_fixture_data]
+            yield [second_fixture]
+
+        with patch("app.services.fixture_service.sportmonks_client") as mock_client:
+            mock_client.iter_pages = iter_pages
+
+            response = client.get("/fixtures", headers={"Accept": "application/x-ndjson"})
+
+            assert response.status_code == 200
+            assert response.headers["content-type"] == "application/x-ndjson"
+            lines = [json.loads(line) for line in response.text.splitlines()]
+            assert [line["id"] for line in lines] == [19134030, 19134031]
+
+
+class TestGetFixturesBetween:
+    def test_returns_fixtures_in_date_range(self, client, mock_fixtures_response):
+        with patch("app.services.fixture_service.sportmonks_client") as mock_client:
+            mock_client.get_all_pages = AsyncMock(return_value=mock_fixtures_response)
+
+            response = client.get("/fixtures/between/2024-08-01/2024-08-31")
+
+            assert response.status_code == 200
+            assert len(response.json()) == 1
+            mock_client.get_all_pages.assert_called_once()
+            assert mock_client.get_all_pages.call_args.args[0] == "football/fixtures/between/2024-08-01/2024-08-31"
+
+    def test_rejects_inverted_range(self, client):
+        response = client.get("/fixtures/between/2024-08-31/2024-08-01")
+
+        assert response.status_code == 422
+
+
+class TestGetUpdatedFixtures:
+    def test_requires_since(self, client):
+        response = client.get("/fixtures/updated")
+
+        assert response.status_code == 422
+
+    def test_returns_fixtures_changed_since_watermark(self, client, mock_fixtures_response):
+        with patch("app.services.fixture_service.sportmonks_client") as mock_client:
+            mock_client.get_all_pages = AsyncMock(return_value=mock_fixtures_response)
+
+            response = client.get("/fixtures/updated", params={"since": "2024-08-01T12:00:00Z"})
+
+            assert response.status_code == 200
+            assert len(response.json()) == 1
 
 
 class TestGetFixtureById:
@@ -41,4 +127,4 @@ class TestGetFixtureById:
 
             client.get("/fixtures/19134030")
 
-            mock_client.get.assert_called_once_with("football/fixtures/19134030")
+            mock_client.get.assert_called_once_with("football/fixtures/19134030", {"select": select_fields(Fixture)})
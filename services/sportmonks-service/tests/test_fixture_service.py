@@ -1,7 +1,10 @@
+from datetime import UTC, date, datetime, timedelta
 from unittest.mock import AsyncMock, patch
 
 import pytest
 
+from app.clients.sportmonks_client import sportmonks_client
+from app.config import settings
 from app.services.fixture_service import FixtureService
 
 
@@ -34,3 +37,101 @@ class TestFixtureService:
 
             assert result.id == mock_fixture_data["id"]
             assert result.name == mock_fixture_data["name"]
+
+    @pytest.mark.asyncio
+    async def test_get_fixtures_between_splits_long_ranges_into_windows(self, service, mock_fixture_data):
+        with patch("app.services.fixture_service.sportmonks_client") as mock_client:
+            mock_client.get_all_pages = AsyncMock(return_value=[mock_fixture_data])
+
+            result = await service.get_fixtures_between(date(2024, 1, 1), date(2024, 6, 30))
+
+            endpoints = [call.args[0] for call in mock_client.get_all_pages.call_args_list]
+            assert endpoints == [
+                "football/fixtures/between/2024-01-01/2024-04-09",
+                "football/fixtures/between/2024-04-10/2024-06-30",
+            ]
+            assert [fixture.id for fixture in result] == [mock_fixture_data["id"]]
+
+    @pytest.mark.asyncio
+    async def test_updated_since_recent_watermark_uses_latest_endpoint(self, service, mock_fixture_data):
+        with patch("app.services.fixture_service.sportmonks_client") as mock_client:
+            mock_client.get_all_pages = AsyncMock(return_value=[mock_fixture_data])
+
+            await service.get_fixtures_updated_since(datetime.now(UTC) - timedelta(seconds=2))
+
+            mock_client.get_all_pages.assert_called_once()
+            assert mock_client.get_all_pages.call_args.args[0] == "football/fixtures/latest"
+
+    @pytest.mark.asyncio
+    async def test_updated_since_minutes_old_watermark_reads_narrow_window(self, service, mock_fixture_data):
+        with patch("app.services.fixture_service.sportmonks_client") as mock_client:
+            mock_client.get_all_pages = AsyncMock(return_value=[mock_fixture_data])
+
+            result = await service.get_fixtures_updated_since(datetime.now(UTC) - timedelta(minutes=5))
+
+            endpoints = sorted(call.args[0] for call in mock_client.get_all_pages.call_args_list)
+            assert endpoints[1] == "football/fixtures/latest"
+            start, end = (date.fromisoformat(part) for part in endpoints[0].split("/")[-2:])
+            assert endpoints[0].startswith("football/fixtures/between/")
+            assert (end - start).days <= 1
+            assert [fixture.id for fixture in result] == [mock_fixture_data["id"]]
+
+    @pytest.mark.asyncio
+    async def test_live_interval_run_fetches_few_upstream_pages(self, service, mock_fixture_data):
+        fixtures_per_day = 40
+
+        async def upstream(endpoint, params):
+            if endpoint.endswith("/latest"):
+                total = 3
+            else:
+                start, end = (date.fromisoformat(part) for part in endpoint.split("/")[-2:])
+                total = ((end - start).days + 1) * fixtures_per_day
+            first = (params["page"] - 1) * params["per_page"]
+            ids = range(first, min(first + params["per_page"], total))
+            data = [{**mock_fixture_data, "id": fixture_id} for fixture_id in ids]
+            return {"data": data, "pagination": {"has_more": first + params["per_page"] < total}}
+
+        async def pages_fetched(since: datetime) -> int:
+            with patch.object(sportmonks_client, "get", new_callable=AsyncMock) as mock_get:
+                mock_get.side_effect = upstream
+                await service.get_fixtures_updated_since(since)
+                return mock_get.await_count
+
+        # The orchestrator polls every minute or so while fixtures are live.
+        live = await pages_fetched(datetime.now(UTC) - timedelta(seconds=90))
+        wide = await pages_fetched(datetime.now(UTC) - timedelta(days=1))
+
+        assert live <= 4
+        assert wide > 3 * live
+
+    @pytest.mark.asyncio
+    async def test_updated_since_older_watermark_reads_date_window(self, service, mock_fixture_data):
+        since = datetime.now(UTC) - timedelta(hours=3)
+
+        with patch("app.services.fixture_service.sportmonks_client") as mock_client:
+            mock_client.get_all_pages = AsyncMock(return_value=[mock_fixture_data])
+
+            await service.get_fixtures_updated_since(since)
+
+            start = since.date() - timedelta(days=1)
+            end = datetime.now(UTC).date() + timedelta(days=14)
+            mock_client.get_all_pages.assert_called_once()
+            endpoint = mock_client.get_all_pages.call_args.args[0]
+            assert endpoint == f"football/fixtures/between/{start.isoformat()}/{end.isoformat()}"
+
+    @pytest.mark.asyncio
+    async def test_get_fixtures_by_ids_chunks_multi_requests_and_reports_missing(
+        self, service, mock_fixture_data, monkeypatch
+    ):
+        monkeypatch.setattr(settings, "multi_ids_per_request", 2)
+        second = {**mock_fixture_data, "id": 2}
+
+        with patch("app.services.fixture_service.sportmonks_client") as mock_client:
+            mock_client.get = AsyncMock(side_effect=[{"data": [second, mock_fixture_data]}, {}])
+
+            result = await service.get_fixtures_by_ids([mock_fixture_data["id"], 2, 2, 3])
+
+            endpoints = [call.args[0] for call in mock_client.get.call_args_list]
+            assert endpoints == [f"football/fixtures/multi/{mock_fixture_data['id']},2", "football/fixtures/multi/3"]
+            assert [fixture.id for fixture in result.data] == [mock_fixture_data["id"], 2]
+            assert result.missing == [3]
@@ -1,5 +1,8 @@
 from unittest.mock import AsyncMock, patch
 
+from app.clients.query import select_fields
+from app.models.league import League
+
 
 class TestGetLeagues:
     def test_returns_list_of_leagues(self, client, mock_leagues_response, mock_league_data):
@@ -20,7 +23,7 @@ class TestGetLeagues:
 
             client.get("/leagues")
 
-            mock_client.get_all_pages.assert_called_once_with("football/leagues")
+            mock_client.get_all_pages.assert_called_once_with("football/leagues", {"select": select_fields(League)})
 
 
 class TestGetLeagueById:
@@ -41,4 +44,22 @@ class TestGetLeagueById:
 
             client.get("/leagues/271")
 
-            mock_client.get.assert_called_once_with("football/leagues/271")
+            mock_client.get.assert_called_once_with("football/leagues/271", {"select": select_fields(League)})
+
+
+class TestGetLeaguesBatch:
+    def test_returns_found_leagues_and_missing_ids(self, client, mock_league_data):
+        with patch("app.services.league_service.sportmonks_client") as mock_client:
+            mock_client.get = AsyncMock(side_effect=[{"data": mock_league_data}, {"data": None}])
+
+            response = client.post("/leagues/batch", json={"ids": [271, 999]})
+
+            assert response.status_code == 200
+            body = response.json()
+            assert [league["id"] for league in body["data"]] == [271]
+            assert body["missing"] == [999]
+
+    def test_rejects_empty_id_list(self, client):
+        response = client.post("/leagues/batch", json={"ids": []})
+
+        assert response.status_code == 422
@@ -1,5 +1,6 @@
 from unittest.mock import AsyncMock, patch
 
+import httpx
 import pytest
 
 from app.services.league_service import LeagueService
@@ -34,3 +35,22 @@ class TestLeagueService:
 
             assert result.id == mock_league_data["id"]
             assert result.name == mock_league_data["name"]
+
+    @pytest.mark.asyncio
+    async def test_get_leagues_by_ids_looks_up_each_id_and_reports_missing(self, service, mock_league_data):
+        request = httpx.Request("GET", "https://example.test")
+        not_found = httpx.HTTPStatusError("not found", request=request, response=httpx.Response(404))
+
+        async def get(endpoint, params):
+            if endpoint.endswith("/271"):
+                return {"data": mock_league_data}
+            raise not_found
+
+        with patch("app.services.league_service.sportmonks_client") as mock_client:
+            mock_client.get = AsyncMock(side_effect=get)
+
+            result = await service.get_leagues_by_ids([999, 271, 271])
+
+            assert mock_client.get.await_count == 2
+            assert [league.id for league in result.data] == [271]
+            assert result.missing == [999]
@@ -0,0 +1,54 @@
+from unittest.mock import AsyncMock, patch
+
+from prometheus_client import REGISTRY
+
+from app.clients.sportmonks_client import sportmonks_client
+
+
+def test_metrics_endpoint_exposes_prometheus_text(client):
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert "http_requests_in_flight" in response.text
+    assert 'http_client_pool_connections{pool="sportmonks",state="active"}' in response.text
+
+
+def test_request_latency_is_labelled_by_route_template(client, mock_league_response):
+    labels = {"method": "GET", "route": "/leagues/{league_id}", "status": "200"}
+    before = REGISTRY.get_sample_value("http_request_duration_seconds_count", labels) or 0
+
+    with patch("app.services.league_service.sportmonks_client") as mock_client:
+        mock_client.get = AsyncMock(return_value=mock_league_response)
+        client.get("/leagues/271")
+
+    assert REGISTRY.get_sample_value("http_request_duration_seconds_count", labels) == before + 1
+
+
+async def test_pages_fetched_are_counted_per_entity():
+    labels = {"entity": "venues"}
+    before = REGISTRY.get_sample_value("sportmonks_pages_fetched_total", labels) or 0
+    pages = {
+        1: {"data": [{"id": 1}], "pagination": {"has_more": True}},
+        2: {"data": [{"id": 2}], "pagination": {"has_more": False}},
+    }
+
+    async def get_page(endpoint, params):
+        return pages.get(params["page"], {"data": [], "pagination": {"has_more": False}})
+
+    with patch.object(sportmonks_client, "get", new_callable=AsyncMock) as mock_get:
+        mock_get.side_effect = get_page
+        await sportmonks_client.get_all_pages("football/venues")
+
+    assert REGISTRY.get_sample_value("sportmonks_pages_fetched_total", labels) >= before + 2
+
+
+async def test_rate_limit_budget_is_exported_per_entity(client):
+    await sportmonks_client.rate_limiter.acquire("venues")
+    try:
+        response = client.get("/metrics")
+    finally:
+        await sportmonks_client.rate_limiter.release("venues")
+
+    assert 'sportmonks_rate_limit_in_flight{entity="venues"} 1.0' in response.text
+    assert 'sportmonks_rate_limit_remaining{entity="venues"}' in response.text
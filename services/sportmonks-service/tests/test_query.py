@@ -0,0 +1,29 @@
+from unittest.mock import patch
+
+from app.clients.query import build_filters, query_params, select_fields
+from app.models.team import Team
+
+
+class TestSelectFields:
+    def test_lists_model_fields_without_id(self):
+        fields = select_fields(Team).split(",")
+
+        assert "id" not in fields
+        assert fields[:2] == ["sport_id", "country_id"]
+        assert "last_played_at" in fields
+
+
+class TestBuildFilters:
+    def test_joins_non_empty_filters(self):
+        assert build_filters({"fixtureLeagues": [8, 564], "fixtureSeasons": []}) == "fixtureLeagues:8,564"
+
+    def test_returns_none_without_values(self):
+        assert build_filters({"fixtureLeagues": []}) is None
+
+
+class TestQueryParams:
+    def test_select_can_be_disabled(self):
+        with patch("app.clients.query.settings") as mock_settings:
+            mock_settings.sportmonks_select_fields = False
+
+            assert query_params(Team, {"teamCountries": [462]}) == {"filters": "teamCountries:462"}
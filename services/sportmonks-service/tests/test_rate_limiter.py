@@ -0,0 +1,76 @@
+import asyncio
+
+import pytest
+
+from app.clients.rate_limiter import RateLimiter, RateLimitExhaustedError, entity_for
+
+
+class TestEntityFor:
+    def test_groups_endpoints_by_entity(self):
+        assert entity_for("football/fixtures") == "fixtures"
+        assert entity_for("football/fixtures/between/2024-08-01/2024-08-31") == "fixtures"
+        assert entity_for("football/teams/85") == "teams"
+
+
+class TestRateLimiter:
+    @pytest.mark.asyncio
+    async def test_acquire_counts_in_flight_requests_against_budget(self):
+        limiter = RateLimiter(limit=2, window_seconds=60)
+
+        await limiter.acquire("fixtures")
+        await limiter.acquire("fixtures")
+
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(limiter.acquire("fixtures"), timeout=0.05)
+        assert limiter.snapshot()["fixtures"]["in_flight"] == 2
+
+    @pytest.mark.asyncio
+    async def test_release_wakes_waiting_request(self):
+        limiter = RateLimiter(limit=1, window_seconds=60)
+        await limiter.acquire("fixtures")
+
+        waiter = asyncio.create_task(limiter.acquire("fixtures"))
+        await asyncio.sleep(0)
+        await limiter.release("fixtures", remaining=1, resets_in_seconds=60)
+        await asyncio.wait_for(waiter, timeout=1)
+
+        assert limiter.snapshot()["fixtures"]["in_flight"] == 1
+
+    @pytest.mark.asyncio
+    async def test_budgets_are_tracked_per_entity(self):
+        limiter = RateLimiter(limit=1, window_seconds=60)
+
+        await limiter.acquire("fixtures")
+        await limiter.acquire("teams")
+
+        assert set(limiter.snapshot()) == {"fixtures", "teams"}
+
+    @pytest.mark.asyncio
+    async def test_stale_response_does_not_raise_remaining_within_window(self):
+        limiter = RateLimiter(limit=3000, window_seconds=3600)
+        await limiter.acquire("fixtures")
+        await limiter.acquire("fixtures")
+
+        await limiter.release("fixtures", remaining=2990, resets_in_seconds=1000)
+        await limiter.release("fixtures", remaining=2995, resets_in_seconds=1000)
+
+        assert limiter.snapshot()["fixtures"]["remaining"] == 2990
+
+    @pytest.mark.asyncio
+    async def test_waits_for_reset_when_exhausted(self):
+        limiter = RateLimiter(limit=5, window_seconds=60)
+        await limiter.exhaust("fixtures", resets_in_seconds=0.05)
+
+        await asyncio.wait_for(limiter.acquire("fixtures"), timeout=1)
+
+        assert limiter.snapshot()["fixtures"]["remaining"] == 5
+
+    @pytest.mark.asyncio
+    async def test_raises_when_reset_is_beyond_max_wait(self):
+        limiter = RateLimiter(limit=5, window_seconds=60, max_wait_seconds=1)
+        await limiter.exhaust("fixtures", resets_in_seconds=120)
+
+        with pytest.raises(RateLimitExhaustedError) as exc_info:
+            await limiter.acquire("fixtures")
+
+        assert exc_info.value.entity == "fixtures"
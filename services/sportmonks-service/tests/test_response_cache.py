@@ -0,0 +1,65 @@
+import time
+
+from app.clients.response_cache import CacheState, ResponseCache
+
+
+class TestResponseCache:
+    def test_key_ignores_param_order(self):
+        assert ResponseCache.key("football/teams", {"page": 2, "per_page": 50}) == ResponseCache.key(
+            "football/teams", {"per_page": 50, "page": 2}
+        )
+
+    def test_lookup_reports_fresh_stale_and_miss(self):
+        cache = ResponseCache(max_bytes=1024, ttl_seconds={}, stale_seconds=60)
+
+        assert cache.lookup("leagues")[1] == CacheState.MISS
+
+        cache.put("leagues", {"data": []}, size=10, ttl=60)
+        assert cache.lookup("leagues")[1] == CacheState.FRESH
+
+        cache.put("teams", {"data": []}, size=10, ttl=-1)
+        assert cache.lookup("teams")[1] == CacheState.STALE
+
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["stale_hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_entry_past_stale_window_is_a_miss_but_keeps_validators(self):
+        cache = ResponseCache(max_bytes=1024, ttl_seconds={}, stale_seconds=0)
+        cache.put("leagues", {"data": []}, size=10, ttl=-1, etag='"abc"')
+
+        entry, state = cache.lookup("leagues")
+
+        assert state == CacheState.MISS
+        assert entry.validators() == {"If-None-Match": '"abc"'}
+
+    def test_evicts_least_recently_used_entries_by_size(self):
+        cache = ResponseCache(max_bytes=100, ttl_seconds={}, stale_seconds=0)
+        cache.put("a", {"id": "a"}, size=40, ttl=60)
+        cache.put("b", {"id": "b"}, size=40, ttl=60)
+        cache.lookup("a")
+
+        cache.put("c", {"id": "c"}, size=40, ttl=60)
+
+        assert cache.lookup("b")[1] == CacheState.MISS
+        assert cache.lookup("a")[1] == CacheState.FRESH
+        assert cache.stats()["bytes"] == 80
+        assert cache.stats()["evictions"] == 1
+
+    def test_skips_entries_larger_than_the_cache(self):
+        cache = ResponseCache(max_bytes=100, ttl_seconds={}, stale_seconds=0)
+
+        cache.put("a", {"id": "a"}, size=101, ttl=60)
+
+        assert cache.stats()["entries"] == 0
+
+    def test_touch_extends_expiry(self):
+        cache = ResponseCache(max_bytes=1024, ttl_seconds={}, stale_seconds=0)
+        cache.put("leagues", {"data": []}, size=10, ttl=-1)
+
+        cache.touch("leagues", ttl=60)
+
+        entry, state = cache.lookup("leagues")
+        assert state == CacheState.FRESH
+        assert entry.expires_at > time.monotonic()
+        assert cache.stats()["revalidated"] == 1
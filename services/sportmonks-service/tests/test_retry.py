@@ -0,0 +1,34 @@
+import httpx
+
+from app.clients.retry import RetryBudget, backoff_delay, is_retryable
+
+REQUEST = httpx.Request("GET", "https://api.sportmonks.com/v3/football/fixtures")
+
+
+def status_error(status_code: int) -> httpx.HTTPStatusError:
+    return httpx.HTTPStatusError(
+        "error", request=REQUEST, response=httpx.Response(status_code, request=REQUEST)
+    )
+
+
+class TestIsRetryable:
+    def test_server_errors_and_timeouts_are_retryable(self):
+        assert is_retryable(status_error(503))
+        assert is_retryable(status_error(502))
+        assert is_retryable(httpx.ReadTimeout("timed out", request=REQUEST))
+        assert is_retryable(httpx.ConnectError("refused", request=REQUEST))
+
+    def test_client_errors_are_not_retryable(self):
+        assert not is_retryable(status_error(401))
+        assert not is_retryable(status_error(404))
+        assert not is_retryable(ValueError("bad json"))
+
+
+class TestBackoff:
+    def test_delay_is_capped(self):
+        assert all(0 <= backoff_delay(attempt, base=0.5, cap=2.0) <= 2.0 for attempt in range(10))
+
+    def test_budget_is_shared_until_exhausted(self):
+        budget = RetryBudget(2)
+
+        assert [budget.take() for _ in range(3)] == [True, True, False]
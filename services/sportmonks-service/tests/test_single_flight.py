@@ -0,0 +1,144 @@
+import asyncio
+
+import pytest
+
+from app.clients.single_flight import SharedPages, SingleFlight
+
+
+async def pages(count: int, calls: list[int], delay: float = 0.01):
+    for page in range(1, count + 1):
+        calls.append(page)
+        await asyncio.sleep(delay)
+        yield [{"id": page}]
+
+
+class TestSingleFlight:
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_execution(self):
+        flight = SingleFlight()
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"data": []}
+
+        results = await asyncio.gather(*(flight.do("football/leagues", fetch) for _ in range(5)))
+
+        assert calls == 1
+        assert all(result == {"data": []} for result in results)
+        assert "football/leagues" not in flight
+
+    @pytest.mark.asyncio
+    async def test_failure_is_shared_and_not_remembered(self):
+        flight = SingleFlight()
+
+        async def fail():
+            await asyncio.sleep(0.01)
+            raise ValueError("upstream down")
+
+        results = await asyncio.gather(flight.do("key", fail), flight.do("key", fail), return_exceptions=True)
+
+        assert all(isinstance(result, ValueError) for result in results)
+        assert "key" not in flight
+
+    @pytest.mark.asyncio
+    async def test_last_caller_leaving_cancels_the_shared_call(self):
+        flight = SingleFlight()
+        started = asyncio.Event()
+        cancelled = asyncio.Event()
+
+        async def fetch():
+            started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        first = asyncio.create_task(flight.do("key", fetch))
+        second = asyncio.create_task(flight.do("key", fetch))
+        await started.wait()
+
+        first.cancel()
+        await asyncio.sleep(0)
+        assert not cancelled.is_set()
+
+        second.cancel()
+        await asyncio.wait_for(cancelled.wait(), 1)
+        assert "key" not in flight
+
+
+class TestSharedPages:
+    @pytest.mark.asyncio
+    async def test_subscribers_share_one_walk(self):
+        calls = []
+        finished = []
+        shared = SharedPages(pages(3, calls), on_finished=lambda: finished.append(True))
+
+        async def collect():
+            return [items async for items in shared.subscribe()]
+
+        first, second = await asyncio.gather(collect(), collect())
+
+        assert first == second == [[{"id": 1}], [{"id": 2}], [{"id": 3}]]
+        assert calls == [1, 2, 3]
+        assert finished == [True]
+
+    @pytest.mark.asyncio
+    async def test_pages_are_dropped_once_every_subscriber_has_read_them(self):
+        calls = []
+        shared = SharedPages(pages(3, calls), on_finished=lambda: None)
+        fast, slow = shared.subscribe(), shared.subscribe()
+
+        assert await asyncio.gather(anext(fast), anext(slow)) == [[{"id": 1}]] * 2
+        assert shared._pages == []
+        assert await anext(fast) == [{"id": 2}]
+        assert await anext(fast) == [{"id": 3}]
+        assert len(shared._pages) == 2
+        assert await anext(slow) == [{"id": 2}]
+        assert len(shared._pages) == 1
+
+        assert [items async for items in slow] == [[{"id": 3}]]
+        assert [items async for items in fast] == []
+        assert shared._pages == []
+
+    @pytest.mark.asyncio
+    async def test_joinable_only_until_first_page_is_consumed(self):
+        shared = SharedPages(pages(3, []), on_finished=lambda: None)
+        subscriber = shared.subscribe()
+
+        assert shared.joinable
+        await anext(subscriber)
+        assert not shared.joinable
+        await subscriber.aclose()
+
+    @pytest.mark.asyncio
+    async def test_error_reaches_every_subscriber(self):
+        async def failing():
+            yield [{"id": 1}]
+            await asyncio.sleep(0.01)
+            raise RuntimeError("page 2 failed")
+
+        shared = SharedPages(failing(), on_finished=lambda: None)
+
+        async def collect():
+            return [items async for items in shared.subscribe()]
+
+        results = await asyncio.gather(collect(), collect(), return_exceptions=True)
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+
+    @pytest.mark.asyncio
+    async def test_last_subscriber_leaving_stops_the_walk(self):
+        calls = []
+        finished = []
+        shared = SharedPages(pages(10, calls), on_finished=lambda: finished.append(True))
+        subscriber = shared.subscribe()
+
+        await anext(subscriber)
+        await subscriber.aclose()
+
+        assert calls == [1]
+        assert finished == [True]
@@ -1,7 +1,12 @@
+import asyncio
+import time
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
+import orjson
 import pytest
 
+from app.clients.retry import PaginationAbortedError
 from app.clients.sportmonks_client import SportMonksClient
 
 
@@ -11,18 +16,33 @@ class TestSportMonksClient:
         with patch("app.clients.sportmonks_client.settings") as mock_settings:
             mock_settings.base_url = "https://api.sportmonks.com/v3"
             mock_settings.api_key = "test_api_key"
+            mock_settings.per_page = 50
+            mock_settings.page_concurrency = 3
+            mock_settings.rate_limit_per_entity = 3000
+            mock_settings.rate_limit_window_seconds = 3600.0
+            mock_settings.rate_limit_reserve = 0
+            mock_settings.rate_limit_max_wait_seconds = 900.0
+            mock_settings.rate_limit_retries = 2
+            mock_settings.cache_max_bytes = 1024 * 1024
+            mock_settings.cache_ttl_seconds = {}
+            mock_settings.cache_stale_seconds = 60.0
+            mock_settings.retry_max_attempts = 3
+            mock_settings.retry_budget = 5
+            mock_settings.retry_backoff_base = 0.0
+            mock_settings.retry_backoff_max = 0.0
+            mock_settings.checkpoint_ttl_seconds = 60.0
             return SportMonksClient()
 
     @pytest.mark.asyncio
     async def test_get_includes_api_token_in_params(self, client):
         mock_response = MagicMock()
-        mock_response.json.return_value = {"data": []}
+        mock_response.content = orjson.dumps({"data": []})
         mock_response.raise_for_status = MagicMock()
 
         with patch("httpx.AsyncClient") as mock_async_client:
             mock_client_instance = AsyncMock()
             mock_client_instance.get = AsyncMock(return_value=mock_response)
-            mock_async_client.return_value.__aenter__.return_value = mock_client_instance
+            mock_async_client.return_value = mock_client_instance
 
             await client.get("football/leagues")
 
@@ -33,13 +53,13 @@ class TestSportMonksClient:
     @pytest.mark.asyncio
     async def test_get_constructs_correct_url(self, client):
         mock_response = MagicMock()
-        mock_response.json.return_value = {"data": []}
+        mock_response.content = orjson.dumps({"data": []})
         mock_response.raise_for_status = MagicMock()
 
         with patch("httpx.AsyncClient") as mock_async_client:
             mock_client_instance = AsyncMock()
             mock_client_instance.get = AsyncMock(return_value=mock_response)
-            mock_async_client.return_value.__aenter__.return_value = mock_client_instance
+            mock_async_client.return_value = mock_client_instance
 
             await client.get("football/leagues")
 
@@ -49,13 +69,13 @@ class TestSportMonksClient:
     @pytest.mark.asyncio
     async def test_get_merges_additional_params(self, client):
         mock_response = MagicMock()
-        mock_response.json.return_value = {"data": []}
+        mock_response.content = orjson.dumps({"data": []})
         mock_response.raise_for_status = MagicMock()
 
         with patch("httpx.AsyncClient") as mock_async_client:
             mock_client_instance = AsyncMock()
             mock_client_instance.get = AsyncMock(return_value=mock_response)
-            mock_async_client.return_value.__aenter__.return_value = mock_client_instance
+            mock_async_client.return_value = mock_client_instance
 
             await client.get("football/leagues", params={"include": "seasons"})
 
@@ -63,6 +83,35 @@ class TestSportMonksClient:
             assert call_kwargs[1]["params"]["api_token"] == "test_api_key"
             assert call_kwargs[1]["params"]["include"] == "seasons"
 
+    @pytest.mark.asyncio
+    async def test_get_reuses_shared_http_client(self, client):
+        mock_response = MagicMock()
+        mock_response.content = orjson.dumps({"data": []})
+        mock_response.raise_for_status = MagicMock()
+
+        with patch("httpx.AsyncClient") as mock_async_client:
+            mock_client_instance = AsyncMock()
+            mock_client_instance.get = AsyncMock(return_value=mock_response)
+            mock_async_client.return_value = mock_client_instance
+
+            await client.get("football/leagues")
+            await client.get("football/teams")
+
+            mock_async_client.assert_called_once()
+            assert mock_client_instance.get.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_close_releases_shared_http_client(self, client):
+        with patch("httpx.AsyncClient") as mock_async_client:
+            mock_client_instance = AsyncMock()
+            mock_async_client.return_value = mock_client_instance
+
+            client.open()
+            await client.close()
+
+            mock_client_instance.aclose.assert_awaited_once()
+            assert client.pool_stats()["open"] is False
+
     @pytest.mark.asyncio
     async def test_get_all_pages_single_page(self, client):
         response_data = {
@@ -82,25 +131,316 @@ class TestSportMonksClient:
 
     @pytest.mark.asyncio
     async def test_get_all_pages_multiple_pages(self, client):
-        page_1 = {
-            "data": [{"id": 1}, {"id": 2}],
-            "pagination": {"has_more": True},
-        }
-        page_2 = {
-            "data": [{"id": 3}],
-            "pagination": {"has_more": False},
+        pages = {
+            1: {"data": [{"id": 1}, {"id": 2}], "pagination": {"has_more": True}},
+            2: {"data": [{"id": 3}], "pagination": {"has_more": False}},
         }
 
+        async def get_page(endpoint, params):
+            return pages.get(params["page"], {"data": [], "pagination": {"has_more": False}})
+
         with patch.object(client, "get", new_callable=AsyncMock) as mock_get:
-            mock_get.side_effect = [page_1, page_2]
+            mock_get.side_effect = get_page
 
             result = await client.get_all_pages("football/leagues")
 
             assert result == [{"id": 1}, {"id": 2}, {"id": 3}]
-            assert mock_get.call_count == 2
             mock_get.assert_any_call(
                 "football/leagues", params={"per_page": 50, "page": 1}
             )
             mock_get.assert_any_call(
                 "football/leagues", params={"per_page": 50, "page": 2}
             )
+
+    @pytest.mark.asyncio
+    async def test_get_all_pages_keeps_page_order_when_fetched_concurrently(self, client):
+        async def get_page(endpoint, params):
+            page = params["page"]
+            await asyncio.sleep(0.01 * (6 - page))
+            return {"data": [{"id": page}], "pagination": {"has_more": page < 5}}
+
+        with patch.object(client, "get", new_callable=AsyncMock) as mock_get:
+            mock_get.side_effect = get_page
+
+            result = await client.get_all_pages("football/fixtures")
+
+            assert result == [{"id": page} for page in range(1, 6)]
+
+    @pytest.mark.asyncio
+    async def test_get_all_pages_limits_pages_in_flight(self, client):
+        in_flight = 0
+        peak = 0
+
+        async def get_page(endpoint, params):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {"data": [{"id": params["page"]}], "pagination": {"has_more": params["page"] < 10}}
+
+        with patch.object(client, "get", new_callable=AsyncMock) as mock_get:
+            mock_get.side_effect = get_page
+
+            result = await client.get_all_pages("football/fixtures")
+
+            assert len(result) == 10
+            assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_short_walk_requests_few_pages_past_the_end(self, client):
+        async def get_page(endpoint, params):
+            await asyncio.sleep(0.01)
+            return {"data": [{"id": params["page"]}], "pagination": {"has_more": params["page"] < 2}}
+
+        with patch.object(client, "get", new_callable=AsyncMock) as mock_get:
+            mock_get.side_effect = get_page
+
+            result = await client.get_all_pages("football/fixtures")
+
+            assert len(result) == 2
+            assert [call.kwargs["params"]["page"] for call in mock_get.call_args_list] == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_iter_pages_yields_each_page_in_order(self, client):
+        async def get_page(endpoint, params):
+            page = params["page"]
+            return {"data": [{"id": page}], "pagination": {"has_more": page < 4}}
+
+        with patch.object(client, "get", new_callable=AsyncMock) as mock_get:
+            mock_get.side_effect = get_page
+
+            pages = [items async for items in client.iter_pages("football/fixtures")]
+
+            assert pages == [[{"id": 1}], [{"id": 2}], [{"id": 3}], [{"id": 4}]]
+
+    @pytest.mark.asyncio
+    async def test_get_records_rate_limit_budget_from_response(self, client):
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = orjson.dumps(
+            {
+                "data": [],
+                "rate_limit": {"remaining": 2412, "resets_in_seconds": 1800, "requested_entity": "Fixture"},
+            }
+        )
+
+        with patch("httpx.AsyncClient") as mock_async_client:
+            mock_client_instance = AsyncMock()
+            mock_client_instance.get = AsyncMock(return_value=mock_response)
+            mock_async_client.return_value = mock_client_instance
+
+            await client.get("football/fixtures/between/2024-08-01/2024-08-31")
+
+            budget = client.rate_limit_stats()["fixtures"]
+            assert budget["remaining"] == 2412
+            assert budget["in_flight"] == 0
+            assert 1790 < budget["resets_in_seconds"] <= 1800
+
+    @pytest.mark.asyncio
+    async def test_get_waits_for_reset_and_retries_after_429(self, client):
+        limited = httpx.Response(
+            429,
+            headers={"Retry-After": "0"},
+            json={"message": "Too Many Attempts."},
+            request=httpx.Request("GET", "https://api.sportmonks.com/v3/football/teams"),
+        )
+        ok = httpx.Response(
+            200,
+            json={"data": [{"id": 1}], "rate_limit": {"remaining": 2999, "resets_in_seconds": 3600}},
+            request=httpx.Request("GET", "https://api.sportmonks.com/v3/football/teams"),
+        )
+
+        with patch("httpx.AsyncClient") as mock_async_client:
+            mock_client_instance = AsyncMock()
+            mock_client_instance.get = AsyncMock(side_effect=[limited, ok])
+            mock_async_client.return_value = mock_client_instance
+
+            result = await client.get("football/teams")
+
+            assert result["data"] == [{"id": 1}]
+            assert mock_client_instance.get.call_count == 2
+            assert client.rate_limit_stats()["teams"]["remaining"] == 2999
+
+    @pytest.mark.asyncio
+    async def test_get_serves_cached_response_within_ttl(self, client):
+        client.cache.ttl_seconds = {"leagues": 60.0}
+        ok = httpx.Response(
+            200,
+            json={"data": [{"id": 8}]},
+            request=httpx.Request("GET", "https://api.sportmonks.com/v3/football/leagues"),
+        )
+
+        with patch("httpx.AsyncClient") as mock_async_client:
+            mock_client_instance = AsyncMock()
+            mock_client_instance.get = AsyncMock(return_value=ok)
+            mock_async_client.return_value = mock_client_instance
+
+            first = await client.get("football/leagues", params={"page": 1})
+            second = await client.get("football/leagues", params={"page": 1})
+
+            assert first == second == {"data": [{"id": 8}]}
+            mock_client_instance.get.assert_called_once()
+            assert client.cache_stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_get_revalidates_expired_entry_with_etag(self, client):
+        client.cache.ttl_seconds = {"leagues": 60.0}
+        client.cache.stale_seconds = 0
+        request = httpx.Request("GET", "https://api.sportmonks.com/v3/football/leagues")
+        ok = httpx.Response(200, headers={"ETag": '"v1"'}, json={"data": [{"id": 8}]}, request=request)
+        not_modified = httpx.Response(304, request=request)
+
+        with patch("httpx.AsyncClient") as mock_async_client:
+            mock_client_instance = AsyncMock()
+            mock_client_instance.get = AsyncMock(side_effect=[ok, not_modified])
+            mock_async_client.return_value = mock_client_instance
+
+            await client.get("football/leagues")
+            client.cache._entries["football/leagues"].expires_at = 0
+            result = await client.get("football/leagues")
+
+            assert result == {"data": [{"id": 8}]}
+            assert mock_client_instance.get.call_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
+            assert client.cache_stats()["revalidated"] == 1
+
+    @pytest.mark.asyncio
+    async def test_get_returns_stale_entry_while_refreshing_in_background(self, client):
+        client.cache.ttl_seconds = {"teams": 60.0}
+        request = httpx.Request("GET", "https://api.sportmonks.com/v3/football/teams")
+        first = httpx.Response(200, json={"data": [{"id": 1}]}, request=request)
+        refreshed = httpx.Response(200, json={"data": [{"id": 2}]}, request=request)
+
+        with patch("httpx.AsyncClient") as mock_async_client:
+            mock_client_instance = AsyncMock()
+            mock_client_instance.get = AsyncMock(side_effect=[first, refreshed])
+            mock_async_client.return_value = mock_client_instance
+
+            await client.get("football/teams")
+            client.cache._entries["football/teams"].expires_at = time.monotonic() - 1
+            stale = await client.get("football/teams")
+            await asyncio.gather(*client._revalidations.values())
+            fresh = await client.get("football/teams")
+
+            assert stale == {"data": [{"id": 1}]}
+            assert fresh == {"data": [{"id": 2}]}
+            assert client.cache_stats()["stale_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_walks_of_same_endpoint_are_coalesced(self, client):
+        async def get_page(endpoint, params):
+            await asyncio.sleep(0.01)
+            page = params["page"]
+            return {"data": [{"id": page}], "pagination": {"has_more": page < 4}}
+
+        with patch.object(client, "get", new_callable=AsyncMock) as mock_get:
+            mock_get.side_effect = get_page
+
+            first, second = await asyncio.gather(
+                client.get_all_pages("football/teams"),
+                client.get_all_pages("football/teams"),
+            )
+
+            assert first == second == [{"id": page} for page in range(1, 5)]
+            requested = [call.kwargs["params"]["page"] for call in mock_get.call_args_list]
+            assert len(requested) == len(set(requested))
+            assert client._walks == {}
+
+    @pytest.mark.asyncio
+    async def test_walk_past_first_page_is_not_joined(self, client):
+        async def get_page(endpoint, params):
+            await asyncio.sleep(0.01)
+            page = params["page"]
+            return {"data": [{"id": page}], "pagination": {"has_more": page < 3}}
+
+        with patch.object(client, "get", new_callable=AsyncMock) as mock_get:
+            mock_get.side_effect = get_page
+            early = client.iter_pages("football/teams")
+            await anext(early)
+
+            late = [items async for items in client.iter_pages("football/teams")]
+            rest = [items async for items in early]
+
+            assert late == [[{"id": 1}], [{"id": 2}], [{"id": 3}]]
+            assert rest == [[{"id": 2}], [{"id": 3}]]
+            assert client._walks == {}
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_gets_share_one_request(self, client):
+        ok = httpx.Response(
+            200,
+            json={"data": {"id": 42}},
+            request=httpx.Request("GET", "https://api.sportmonks.com/v3/football/fixtures/42"),
+        )
+
+        async def slow_get(*args, **kwargs):
+            await asyncio.sleep(0.01)
+            return ok
+
+        with patch("httpx.AsyncClient") as mock_async_client:
+            mock_client_instance = AsyncMock()
+            mock_client_instance.get = AsyncMock(side_effect=slow_get)
+            mock_async_client.return_value = mock_client_instance
+
+            results = await asyncio.gather(*(client.get("football/fixtures/42") for _ in range(3)))
+
+            assert results == [{"data": {"id": 42}}] * 3
+            mock_client_instance.get.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_get_all_pages_retries_transient_page_errors(self, client):
+        request = httpx.Request("GET", "https://api.sportmonks.com/v3/football/fixtures")
+        failures = {2: 2}
+
+        async def get_page(endpoint, params):
+            page = params["page"]
+            if failures.get(page):
+                failures[page] -= 1
+                raise httpx.HTTPStatusError("unavailable", request=request, response=httpx.Response(503))
+            return {"data": [{"id": page}], "pagination": {"has_more": page < 3}}
+
+        with patch.object(client, "get", new_callable=AsyncMock) as mock_get:
+            mock_get.side_effect = get_page
+
+            result = await client.get_all_pages("football/fixtures")
+
+            assert result == [{"id": 1}, {"id": 2}, {"id": 3}]
+
+    @pytest.mark.asyncio
+    async def test_get_all_pages_does_not_retry_client_errors(self, client):
+        request = httpx.Request("GET", "https://api.sportmonks.com/v3/football/fixtures")
+
+        with patch.object(client, "get", new_callable=AsyncMock) as mock_get:
+            mock_get.side_effect = httpx.HTTPStatusError(
+                "forbidden", request=request, response=httpx.Response(403)
+            )
+
+            with pytest.raises(PaginationAbortedError):
+                await client.get_all_pages("football/fixtures")
+
+            mock_get.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_abandoned_walk_resumes_from_failed_page(self, client):
+        upstream_down = True
+
+        async def get_page(endpoint, params):
+            page = params["page"]
+            if page == 3 and upstream_down:
+                raise httpx.ReadTimeout("timed out")
+            return {"data": [{"id": page}], "pagination": {"has_more": page < 4}}
+
+        with patch.object(client, "get", new_callable=AsyncMock) as mock_get:
+            mock_get.side_effect = get_page
+
+            with pytest.raises(PaginationAbortedError) as exc_info:
+                await client.get_all_pages("football/fixtures")
+            assert exc_info.value.page == 3
+
+            upstream_down = False
+            mock_get.reset_mock()
+            result = await client.get_all_pages("football/fixtures")
+
+            assert result == [{"id": page} for page in range(1, 5)]
+            requested = sorted(call.kwargs["params"]["page"] for call in mock_get.call_args_list)
+            assert requested[0] == 3